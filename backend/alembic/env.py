@@ -7,8 +7,13 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # IMPORTANT: Import models to register them with Base.metadata
+import app.models.contribution  # noqa: F401, E402
 import app.models.pull_request  # noqa: F401, E402
+import app.models.repository  # noqa: F401, E402
+import app.models.sync_state  # noqa: F401, E402
 import app.models.user  # noqa: F401, E402
+import app.models.user_score  # noqa: F401, E402
+import app.models.weight_profile  # noqa: F401, E402
 from alembic import context  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.db.base import Base  # noqa: E402
@@ -0,0 +1,92 @@
+"""user_scores.final_score for the leaderboard
+
+Revision ID: 0b6e3d5f7a21
+Revises: e4b7c1a9f352
+Create Date: 2026-10-18 17:25:48.120934
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b6e3d5f7a21"
+down_revision: str | Sequence[str] | None = "e4b7c1a9f352"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# scoring as of this revision, inlined so later changes to the app's
+# scoring code do not change what this migration writes
+_REPO_WEIGHTS = {
+    "pr": 0.25,
+    "commits": 0.2,
+    "merge_time": 0.25,
+    "stars": 0.2,
+    "forks": 0.1,
+}
+_AGGREGATE_WEIGHTS = {"pr_avg": 0.7, "repo": 0.3}
+
+
+def _final_score(row: sa.Row) -> float:
+    pr_count = row.pr_count
+    avg_pr_score = row.score_sum / pr_count
+    repo = (
+        min(pr_count / 50.0, 1.0) * _REPO_WEIGHTS["pr"]
+        + min(max(0.0, row.total_commits / pr_count) / 10.0, 1.0)
+        * _REPO_WEIGHTS["commits"]
+        + (1.0 - min(max(0.0, row.total_merge_days / pr_count) / 30.0, 1.0))
+        * _REPO_WEIGHTS["merge_time"]
+        + min(max(0, row.total_stars) / 1000.0, 1.0) * _REPO_WEIGHTS["stars"]
+        + min(max(0, row.total_forks) / 500.0, 1.0) * _REPO_WEIGHTS["forks"]
+    )
+    repo_level_score = round(max(0.0, min(repo, 1.0)) * 100, 2)
+    final = (
+        avg_pr_score / 100.0 * _AGGREGATE_WEIGHTS["pr_avg"]
+        + repo_level_score / 100.0 * _AGGREGATE_WEIGHTS["repo"]
+    )
+    return round(max(0.0, min(final, 1.0)) * 100, 2)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_scores",
+        sa.Column("final_score",
+                  sa.Float(),
+                  nullable=False,
+                  server_default="0"),
+    )
+    op.create_index(
+        "ix_user_scores_final_score",
+        "user_scores",
+        ["final_score"],
+        unique=False,
+    )
+
+    # backfill with the scoring formula of this revision
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT user_id, pr_count, score_sum, total_commits, "
+        "total_merge_days, total_stars, total_forks FROM user_scores "
+        "WHERE pr_count > 0"
+    )).all()
+    updates = [
+        {"user_id": row.user_id, "final_score": _final_score(row)}
+        for row in rows
+    ]
+    if updates:
+        bind.execute(
+            sa.text(
+                "UPDATE user_scores SET final_score = :final_score "
+                "WHERE user_id = :user_id"
+            ),
+            updates,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_scores_final_score", table_name="user_scores")
+    op.drop_column("user_scores", "final_score")
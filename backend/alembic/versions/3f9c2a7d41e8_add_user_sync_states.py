@@ -0,0 +1,42 @@
+"""add user_sync_states and pull_requests.updated_at
+
+Revision ID: 3f9c2a7d41e8
+Revises: b188a27b4e29
+Create Date: 2026-10-18 09:12:44.318207
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a7d41e8"
+down_revision: str | Sequence[str] | None = "b188a27b4e29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_sync_states",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("pr_updated_watermark",
+                  sa.DateTime(timezone=True),
+                  nullable=True),
+        sa.Column("last_synced_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.add_column(
+        "pull_requests",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("pull_requests", "updated_at")
+    op.drop_table("user_sync_states")
@@ -0,0 +1,52 @@
+"""pull_requests created_at / closed_at / commits and window index
+
+Revision ID: 5a2d9f8e6c30
+Revises: c71a5e93d0b4
+Create Date: 2026-10-18 15:21:52.610448
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a2d9f8e6c30"
+down_revision: str | Sequence[str] | None = "c71a5e93d0b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "pull_requests",
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "pull_requests",
+        sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "pull_requests",
+        sa.Column("commits",
+                  sa.Integer(),
+                  nullable=False,
+                  server_default="0"),
+    )
+    op.create_index(
+        "ix_pull_requests_user_id_created_at",
+        "pull_requests",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_pull_requests_user_id_created_at",
+                  table_name="pull_requests")
+    op.drop_column("pull_requests", "commits")
+    op.drop_column("pull_requests", "closed_at")
+    op.drop_column("pull_requests", "created_at")
@@ -0,0 +1,62 @@
+"""add contribution_days rollup table
+
+Revision ID: 7c1f2e8b9d40
+Revises: 0b6e3d5f7a21
+Create Date: 2026-10-18 18:03:15.551207
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1f2e8b9d40"
+down_revision: str | Sequence[str] | None = "0b6e3d5f7a21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "contribution_days",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("pr_count", sa.Integer(), nullable=False),
+        sa.Column("lines_added", sa.BigInteger(), nullable=False),
+        sa.Column("lines_removed", sa.BigInteger(), nullable=False),
+        sa.Column("commits", sa.Integer(), nullable=False),
+        sa.Column("merged_count", sa.Integer(), nullable=False),
+        sa.Column("merge_days", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"],
+                                ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+    # backfill from PRs that already have an opened date
+    op.execute("""
+        INSERT INTO contribution_days (
+            user_id, day, pr_count, lines_added, lines_removed, commits,
+            merged_count, merge_days
+        )
+        SELECT
+            user_id,
+            (created_at AT TIME ZONE 'UTC')::date,
+            count(*),
+            sum(additions),
+            sum(deletions),
+            sum(commits),
+            count(merged_at),
+            coalesce(sum(
+                extract(epoch FROM merged_at - created_at) / 86400.0
+            ), 0)
+        FROM pull_requests
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("contribution_days")
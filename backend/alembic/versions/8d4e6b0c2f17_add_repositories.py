@@ -0,0 +1,35 @@
+"""add repositories metadata table
+
+Revision ID: 8d4e6b0c2f17
+Revises: 3f9c2a7d41e8
+Create Date: 2026-10-18 11:02:37.904511
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4e6b0c2f17"
+down_revision: str | Sequence[str] | None = "3f9c2a7d41e8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "repositories",
+        sa.Column("name_with_owner", sa.String(length=255), nullable=False),
+        sa.Column("stargazer_count", sa.Integer(), nullable=False),
+        sa.Column("fork_count", sa.Integer(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name_with_owner"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("repositories")
@@ -0,0 +1,109 @@
+"""add weight_profiles and profile_scores
+
+Revision ID: a93d4f6b2e18
+Revises: 7c1f2e8b9d40
+Create Date: 2026-10-18 18:47:30.208164
+
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a93d4f6b2e18"
+down_revision: str | Sequence[str] | None = "7c1f2e8b9d40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PR_WEIGHTS = {
+    "lines_added": 0.25,
+    "lines_removed": 0.10,
+    "files_changed": 0.20,
+    "commits": 0.20,
+    "merge_speed": 0.25,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    profiles = op.create_table(
+        "weight_profiles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("repo_level", sa.String(length=32), nullable=False),
+        sa.Column("pr_weights",
+                  postgresql.JSONB(astext_type=sa.Text()),
+                  nullable=False),
+        sa.Column("repo_weights",
+                  postgresql.JSONB(astext_type=sa.Text()),
+                  nullable=False),
+        sa.Column("aggregate_weights",
+                  postgresql.JSONB(astext_type=sa.Text()),
+                  nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name",
+                            "version",
+                            name="uq_weight_profiles_name_version"),
+    )
+    op.create_table(
+        "profile_scores",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("profile_id", sa.Integer(), nullable=False),
+        sa.Column("pr_count", sa.Integer(), nullable=False),
+        sa.Column("avg_pr_score", sa.Float(), nullable=False),
+        sa.Column("repo_level_score", sa.Float(), nullable=False),
+        sa.Column("final_score", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["profile_id"], ["weight_profiles.id"],
+                                ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"],
+                                ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "profile_id"),
+    )
+
+    # version 1 of each profile = the current scoring_service defaults
+    now = datetime.now(timezone.utc)
+    op.bulk_insert(profiles, [
+        {
+            "name": "open_source",
+            "version": 1,
+            "repo_level": "open_source",
+            "pr_weights": _PR_WEIGHTS,
+            "repo_weights": {
+                "pr": 0.25,
+                "commits": 0.2,
+                "merge_time": 0.25,
+                "stars": 0.2,
+                "forks": 0.1,
+            },
+            "aggregate_weights": {"pr_avg": 0.7, "repo": 0.3},
+            "created_at": now,
+        },
+        {
+            "name": "personal",
+            "version": 1,
+            "repo_level": "personal",
+            "pr_weights": _PR_WEIGHTS,
+            "repo_weights": {
+                "pr": 0.3,
+                "commits": 0.25,
+                "merge_time": 0.25,
+                "stars": 0.1,
+                "forks": 0.1,
+            },
+            "aggregate_weights": {"pr_avg": 0.7, "repo": 0.3},
+            "created_at": now,
+        },
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("profile_scores")
+    op.drop_table("weight_profiles")
@@ -0,0 +1,45 @@
+"""unique (user_id, github_pr_id) on pull_requests
+
+Revision ID: c71a5e93d0b4
+Revises: 8d4e6b0c2f17
+Create Date: 2026-10-18 13:47:05.226184
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c71a5e93d0b4"
+down_revision: str | Sequence[str] | None = "8d4e6b0c2f17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the newest row of any duplicates written by per-row syncs
+    op.execute(
+        """
+        DELETE FROM pull_requests a
+        USING pull_requests b
+        WHERE a.user_id = b.user_id
+          AND a.github_pr_id = b.github_pr_id
+          AND a.id < b.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_pull_requests_user_id_github_pr_id",
+        "pull_requests",
+        ["user_id", "github_pr_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_pull_requests_user_id_github_pr_id",
+        "pull_requests",
+        type_="unique",
+    )
@@ -0,0 +1,62 @@
+"""add user_scores snapshot table
+
+Revision ID: e4b7c1a9f352
+Revises: 5a2d9f8e6c30
+Create Date: 2026-10-18 16:40:12.377025
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c1a9f352"
+down_revision: str | Sequence[str] | None = "5a2d9f8e6c30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_scores",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("pr_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.BigInteger(), nullable=False),
+        sa.Column("total_commits", sa.BigInteger(), nullable=False),
+        sa.Column("total_merge_days", sa.Float(), nullable=False),
+        sa.Column("total_stars", sa.BigInteger(), nullable=False),
+        sa.Column("total_forks", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"],
+                                ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # backfill from the PRs already stored
+    op.execute("""
+        INSERT INTO user_scores (
+            user_id, pr_count, score_sum, total_commits, total_merge_days,
+            total_stars, total_forks, updated_at
+        )
+        SELECT
+            pr.user_id,
+            count(*),
+            coalesce(sum(pr.score), 0),
+            coalesce(sum(pr.commits), 0),
+            coalesce(sum(
+                extract(epoch FROM pr.closed_at - pr.created_at) / 86400.0
+            ), 0),
+            coalesce(sum(r.stargazer_count), 0),
+            coalesce(sum(r.fork_count), 0),
+            now()
+        FROM pull_requests pr
+        LEFT JOIN repositories r ON r.name_with_owner = pr.repo_full_name
+        GROUP BY pr.user_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_scores")
@@ -0,0 +1,33 @@
+"""pull_requests.repo_full_name index for repo count changes
+
+Revision ID: f2c8a1d7b593
+Revises: a93d4f6b2e18
+Create Date: 2026-10-18 21:14:06.518342
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8a1d7b593"
+down_revision: str | Sequence[str] | None = "a93d4f6b2e18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_pull_requests_repo_full_name",
+        "pull_requests",
+        ["repo_full_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_pull_requests_repo_full_name",
+                  table_name="pull_requests")
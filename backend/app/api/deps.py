@@ -1,5 +1,7 @@
-from app.core.security import decode_access_token
-from app.db.session import get_db
+from collections.abc import AsyncGenerator
+
+from app.core.security import decode_access_token_cached
+from app.db.session import session_router
 from app.models.user import User
 from app.services import user_service
 from fastapi import Depends, HTTPException, status
@@ -9,24 +11,51 @@ from sqlalchemy.ext.asyncio import AsyncSession
 auth_scheme = HTTPBearer(auto_error=False)
 
 
+async def get_read_db(
+    credentials: HTTPAuthorizationCredentials | None = Depends(auth_scheme),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only handlers: the replica when one is configured,
+    the primary for a user who wrote within the read-your-writes window.
+    Handlers that write use `get_db`.
+    """
+    github_id = None
+    if credentials:
+        try:
+            github_id = decode_access_token_cached(
+                credentials.credentials
+            ).get("github_id")
+        except HTTPException:
+            # get_current_user reports bad tokens
+            pass
+    async with session_router.for_read(github_id)() as session:
+        yield session
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(auth_scheme),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> User:
-    """Resolve the authenticated user from the bearer token."""
+    """
+    Resolve the authenticated user from the bearer token. The lookup is a
+    read, so it goes through `get_read_db`; the returned User belongs to
+    that session (or is detached), not to a handler's `get_db` session.
+    """
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required.",
         )
-    payload = decode_access_token(credentials.credentials)
+    payload = decode_access_token_cached(credentials.credentials)
     github_id = payload.get("github_id")
     if not github_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload.",
         )
-    user = await user_service.get_by_github_id(db, github_id=github_id)
+    user = await user_service.get_by_github_id_cached(
+        db, github_id=github_id
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,42 @@
+import time
+from typing import Any
+
+from app.core import metrics
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class MetricsMiddleware:
+    """
+    Records latency and status of every HTTP request, labelled by the
+    matched route's path template (`/leaderboard/users/{user_id}`) so path
+    parameters do not create new series; requests that match no route share
+    the `unmatched` label. Plain ASGI rather than BaseHTTPMiddleware, so
+    responses are not re-wrapped.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            route: Any = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            metrics.http_request_seconds.observe(elapsed, method, template)
+            metrics.http_requests.inc(method, template, str(status))
@@ -1,3 +1,3 @@
-from app.api.routes import auth, health, score, users
+from app.api.routes import auth, health, leaderboard, metrics, score, users
 
-__all__ = ["auth", "health", "score", "users"]
+__all__ = ["auth", "health", "leaderboard", "metrics", "score", "users"]
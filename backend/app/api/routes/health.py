@@ -1,14 +1,26 @@
 import shutil
 import subprocess
+from functools import cache
 from pathlib import Path
 
-from fastapi import APIRouter
+from app.core.config import settings
+from app.core.security import claims_cache
+from app.db.instrumentation import db_stats
+from app.db.routing import recent_writes
+from app.integrations.scheduler import get_scheduler
+from app.services.readiness_service import readiness_probes
+from app.services.user_service import user_cache
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
 router = APIRouter(tags=["Health"])
 
 
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
 def get_git_commit_sha() -> str:
-    repo_root = Path(__file__).resolve().parents[4]
+    repo_root = REPO_ROOT
 
     if git_bin := shutil.which("git"):
         try:
@@ -54,6 +66,84 @@ def get_git_commit_sha() -> str:
     return "unknown"
 
 
+@cache
+def get_build_id() -> str:
+    """
+    Build identity, resolved once per process: BUILD_COMMIT, then the
+    build-time version file, then git.
+    """
+    if settings.build_commit:
+        return settings.build_commit
+    version_file = REPO_ROOT / settings.build_version_file
+    try:
+        if build_id := version_file.read_text().strip():
+            return build_id
+    except OSError:
+        pass
+    return get_git_commit_sha()
+
+
 @router.get("/health")
 async def health_check():
-    return {"status": " DEVSTASTS RUNNING ", "commit_id": get_git_commit_sha()}
+    return {"status": " DEVSTASTS RUNNING ", "commit_id": get_build_id()}
+
+
+@router.get("/health/ready")
+async def readiness():
+    """
+    Database and GitHub readiness from the background probes; never
+    waits on I/O. 503 until every probe has passed recently enough.
+    """
+    readiness_probes.start()
+    ready, checks = readiness_probes.report(
+        settings.health_probe_max_staleness
+    )
+    return JSONResponse(
+        status_code=(
+            status.HTTP_200_OK if ready
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content={"ready": ready, "checks": checks},
+    )
+
+
+@router.get("/health/github")
+async def github_budget():
+    """Rate-limit budgets, queue depths and learned query costs."""
+    return get_scheduler().snapshot()
+
+
+@router.get("/health/auth-cache")
+async def auth_cache_stats():
+    """Hit / miss counters of the token-claims and user caches."""
+    return {"claims": claims_cache.stats(), "users": user_cache.stats()}
+
+
+@router.get("/health/db")
+async def db_pool_stats():
+    """
+    Pool occupancy, checkout waits and statement timings, plus the same
+    for the read replica when one is configured.
+    """
+    # imported here so importing this module does not create an engine
+    from app.db.session import engine, replica_db_stats, replica_engine
+
+    replica = None
+    if replica_engine is not None:
+        replica = replica_db_stats.snapshot(replica_engine)
+    return {
+        "config": {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+        **db_stats.snapshot(engine),
+        "replica": replica,
+        "read_your_writes": {
+            "window_seconds": settings.read_your_writes_seconds,
+            "sticky": recent_writes.stats(),
+        },
+    }
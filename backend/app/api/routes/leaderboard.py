@@ -0,0 +1,65 @@
+import uuid
+
+from app.api import deps
+from app.schemas.leaderboard import (LeaderboardEntryOut, LeaderboardPage,
+                                     LeaderboardPositionOut)
+from app.services import leaderboard_service
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/leaderboard", tags=["Leaderboard"])
+
+
+@router.get("", response_model=LeaderboardPage)
+async def top_users(
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> LeaderboardPage:
+    board = await leaderboard_service.ensure_loaded(db)
+    return LeaderboardPage(
+        total_users=len(board),
+        entries=[
+            LeaderboardEntryOut(**entry._asdict())
+            for entry in board.top(limit, offset=offset)
+        ],
+    )
+
+
+@router.get("/users/{user_id}", response_model=LeaderboardPositionOut)
+async def user_position(
+    user_id: uuid.UUID,
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> LeaderboardPositionOut:
+    board = await leaderboard_service.ensure_loaded(db)
+    position = board.position(user_id)
+    if position is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User is not ranked.",
+        )
+    return LeaderboardPositionOut(
+        rank=position.entry.rank,
+        final_score=position.entry.final_score,
+        percentile=position.percentile,
+        total_users=position.total_users,
+    )
+
+
+@router.get(
+    "/users/{user_id}/neighbors",
+    response_model=list[LeaderboardEntryOut],
+)
+async def user_neighbors(
+    user_id: uuid.UUID,
+    radius: int = Query(default=5, ge=1, le=50),
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> list[LeaderboardEntryOut]:
+    board = await leaderboard_service.ensure_loaded(db)
+    neighbors = board.neighbors(user_id, radius)
+    if not neighbors:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User is not ranked.",
+        )
+    return [LeaderboardEntryOut(**entry._asdict()) for entry in neighbors]
@@ -0,0 +1,21 @@
+from app.core.metrics import registry
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    Request, GitHub and database metrics in the Prometheus text format.
+    Meant for the internal scraper; keep it off the public ingress.
+    """
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
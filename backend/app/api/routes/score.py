@@ -0,0 +1,151 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.api import deps
+from app.db.session import AsyncSessionLocal
+from app.models.user import User
+from app.models.weight_profile import ProfileScore
+from app.schemas.job import RefreshJobOut
+from app.schemas.score import (ConsistencyOut, ProfileScoreOut, ScoreRequest,
+                               ScoreSnapshotOut)
+from app.services import (contribution_service, user_score_service,
+                          weight_profile_service)
+from app.services.job_queue import QueueFullError, refresh_queue
+from app.services.score_service import refresh_user_score
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/score", tags=["Score"])
+
+
+@router.get("", response_model=ScoreSnapshotOut)
+async def get_score(
+    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> ScoreSnapshotOut:
+    """
+    The current user's score over all synced PRs, read from the
+    `user_scores` snapshot. Zero until the first refresh has run.
+    """
+    snapshot = await user_score_service.get_snapshot(
+        db, user_id=current_user.id
+    )
+    if snapshot is None:
+        return ScoreSnapshotOut(
+            pull_request_count=0,
+            avg_pr_score=0.0,
+            repo_level_score=0.0,
+            final_score=0.0,
+        )
+    return ScoreSnapshotOut(
+        pull_request_count=snapshot.pr_count,
+        updated_at=snapshot.updated_at,
+        **user_score_service.snapshot_score(snapshot),
+    )
+
+
+@router.get("/consistency", response_model=ConsistencyOut)
+async def get_consistency(
+    days: int = Query(default=90, ge=1, le=730),
+    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> ConsistencyOut:
+    """Activity streaks and regularity from the daily contribution rollups."""
+    end = datetime.now(timezone.utc).date()
+    buckets = await contribution_service.list_days(
+        db,
+        user_id=current_user.id,
+        since=end - timedelta(days=days - 1),
+    )
+    return ConsistencyOut(
+        window_days=days,
+        **contribution_service.consistency_metrics(
+            buckets, end=end, days=days
+        ),
+    )
+
+
+@router.get("/profiles/{name}", response_model=ProfileScoreOut)
+async def get_profile_score(
+    name: str,
+    version: int | None = Query(default=None, ge=1),
+    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_read_db),
+) -> ProfileScoreOut:
+    """
+    The current user's score under a weight profile, as of the last
+    rescore run. Defaults to the profile's latest version.
+    """
+    if version is None:
+        profiles = await weight_profile_service.get_latest(db, names=[name])
+        profile = profiles[0] if profiles else None
+    else:
+        profile = await weight_profile_service.get_version(
+            db, name=name, version=version
+        )
+    score = None
+    if profile is not None:
+        score = await db.get(ProfileScore, (current_user.id, profile.id))
+    if profile is None or score is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No score for this profile yet.",
+        )
+    return ProfileScoreOut(
+        profile=profile.name,
+        version=profile.version,
+        pull_request_count=score.pr_count,
+        avg_pr_score=score.avg_pr_score,
+        repo_level_score=score.repo_level_score,
+        final_score=score.final_score,
+        computed_at=score.computed_at,
+    )
+
+
+@router.post(
+    "/refresh",
+    response_model=RefreshJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def refresh_score(
+    body: ScoreRequest | None = None,
+    current_user: User = Depends(deps.get_current_user),
+) -> RefreshJobOut:
+    """
+    Queue a GitHub sync + rescore for the current user and return the job.
+    A refresh already queued or running for this user is shared, and its
+    window / limit apply.
+    """
+    params = body or ScoreRequest()
+    user_id = current_user.id
+    try:
+        job = refresh_queue.submit(
+            f"refresh:{user_id}",
+            lambda: refresh_user_score(
+                AsyncSessionLocal,
+                user_id=user_id,
+                days=params.days,
+                limit=params.limit,
+            ),
+            owner_id=user_id,
+        )
+    except QueueFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Refresh queue is full, try again later.",
+        ) from exc
+    return RefreshJobOut.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=RefreshJobOut)
+async def get_refresh_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(deps.get_current_user),
+) -> RefreshJobOut:
+    job = refresh_queue.get(job_id)
+    if job is None or job.owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found.",
+        )
+    return RefreshJobOut.model_validate(job)
@@ -5,11 +5,90 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: str = ""
+    # optional read replica; read-only endpoints use it when set
+    database_replica_url: str = ""
+    # seconds a user's reads stay on the primary after they wrote
+    read_your_writes_seconds: float = 5.0
+
+    # DB connection pool, per process (size it for the number of workers)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    # seconds to wait for a free connection before failing
+    db_pool_timeout: float = 30.0
+    # seconds before a connection is replaced; -1 keeps them forever
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # asyncpg prepared-statement cache; 0 behind pgbouncer transaction pooling
+    db_statement_cache_size: int = 100
 
     # GitHub OAuth
     github_client_id: str | None = None
     github_client_secret: str | None = None
     jwt_secret: str | None = None
+    # comma-separated Fernet keys for stored GitHub tokens, newest first;
+    # a key derived from jwt_secret is always tried last
+    token_encryption_keys: str = ""
+
+    # GitHub API client (shared connection pool)
+    github_api_url: str = "https://api.github.com"
+    github_max_connections: int = 100
+    github_max_keepalive_connections: int = 20
+    github_keepalive_expiry: float = 30.0
+    github_connect_timeout: float = 10.0
+    github_read_timeout: float = 30.0
+    # parallel requests per sharded PR search
+    github_search_concurrency: int = 4
+    # aliased searches packed into one batched GraphQL request
+    github_batch_max_aliases: int = 20
+    # conditional-request cache for REST calls: "memory", "sqlite" or "none"
+    github_cache_backend: str = "memory"
+    github_cache_path: str = ".github_cache.sqlite3"
+    github_cache_max_entries: int = 10_000
+    # seconds a user's repo inventory is reused before re-listing
+    github_inventory_ttl: float = 300.0
+    github_inventory_max_entries: int = 1024
+    # seconds repo star / fork counts are reused before refetching
+    github_repo_metadata_ttl: float = 3600.0
+    # share of each rate-limit window held back for interactive requests
+    github_background_reserve: float = 0.2
+    # comma-separated extra tokens for bulk syncs (token pool)
+    github_service_tokens: str = ""
+    # let users' OAuth tokens serve other users' fetches; results then follow
+    # the token owner's private-repo access, so leave off unless acceptable
+    github_share_user_tokens: bool = False
+
+    # background score refresh jobs
+    refresh_workers: int = 4
+    refresh_max_queued: int = 1000
+    # seconds a finished job stays pollable
+    refresh_job_retention: float = 3600.0
+
+    # PR batches at least this large are COPYed through a staging table;
+    # syncs also write PRs in chunks of this size
+    pr_bulk_copy_threshold: int = 5000
+
+    # seconds before the in-memory leaderboard is reloaded from user_scores
+    leaderboard_reload_interval: float = 300.0
+
+    # build identity for /health: BUILD_COMMIT, else this file (relative to
+    # the repo root), else `git describe` once at startup
+    build_commit: str | None = None
+    build_version_file: str = "BUILD_COMMIT"
+
+    # /health/ready: background probe cadence and how stale a result may be
+    health_probe_interval: float = 5.0
+    health_probe_timeout: float = 2.0
+    health_probe_max_staleness: float = 30.0
+
+    # in-process cache of decoded JWTs and authenticated users (seconds)
+    auth_cache_ttl: float = 60.0
+    auth_cache_max_entries: int = 10_000
+
+    # PR rows per chunk when rescoring stored history under a weight profile
+    rescore_chunk_size: int = 10_000
+
+    # request timing middleware and the Prometheus /metrics endpoint
+    metrics_enabled: bool = True
 
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).resolve().parents[3] / ".env"),
@@ -0,0 +1,237 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+# Prometheus' default latency buckets, in seconds
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, Sequence[str], Sequence[str], float]]:
+        """(suffix, label names, label values, value) per exposed sample."""
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.type}"
+        for suffix, names, values, value in self.samples():
+            yield (
+                f"{self.name}{suffix}{_format_labels(names, values)} "
+                f"{_format_value(value)}"
+            )
+
+
+class Counter(_Metric):
+    """
+    Monotonic counter per label combination. `inc` is a dict update with no
+    lock: fine on the event loop, and from threads an increment can at worst
+    be lost under contention, which is acceptable for monitoring.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[tuple[str, Sequence[str], Sequence[str], float]]:
+        for labels, value in sorted(self._values.items()):
+            yield "_total", self.labelnames, labels, value
+
+
+class _HistogramChild:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    """
+    Fixed-bucket histogram per label combination. An observation is one
+    bisect and two additions; buckets are only made cumulative when
+    rendered. A label combination's first observation takes a lock to
+    create its slot, later ones take none.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[Labels, _HistogramChild] = {}
+        self._lock = threading.Lock()
+
+    def _child(self, labels: Labels) -> _HistogramChild:
+        with self._lock:
+            return self._children.setdefault(
+                labels, _HistogramChild(len(self.buckets) + 1)
+            )
+
+    def observe(self, value: float, *labels: str) -> None:
+        child = self._children.get(labels) or self._child(labels)
+        # bucket i counts values <= buckets[i]; the last slot is +Inf
+        child.counts[bisect_left(self.buckets, value)] += 1
+        child.sum += value
+
+    def count(self, *labels: str) -> int:
+        child = self._children.get(labels)
+        return sum(child.counts) if child else 0
+
+    def samples(self) -> Iterator[tuple[str, Sequence[str], Sequence[str], float]]:
+        bucket_names = (*self.labelnames, "le")
+        for labels, child in sorted(self._children.items()):
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield (
+                    "_bucket",
+                    bucket_names,
+                    (*labels, _format_value(bound)),
+                    cumulative,
+                )
+            yield "_sum", self.labelnames, labels, child.sum
+            yield "_count", self.labelnames, labels, cumulative
+
+
+class GaugeFunc(_Metric):
+    """Gauge read from a callback (label tuple -> value) at scrape time."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        read: Callable[[], dict[Labels, float]],
+    ):
+        super().__init__(name, help, labelnames)
+        self.read = read
+
+    def samples(self) -> Iterator[tuple[str, Sequence[str], Sequence[str], float]]:
+        for labels, value in sorted(self.read().items()):
+            yield "", self.labelnames, labels, value
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_seconds = registry.register(Histogram(
+    "devstats_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+))
+http_requests = registry.register(Counter(
+    "devstats_http_requests",
+    "HTTP responses by route template and status code.",
+    ("method", "route", "status"),
+))
+
+github_request_seconds = registry.register(Histogram(
+    "devstats_github_request_duration_seconds",
+    "GitHub API call latency by query type, including rate-limit waits.",
+    ("query_type",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+))
+github_requests = registry.register(Counter(
+    "devstats_github_requests",
+    "GitHub API calls by query type and HTTP status.",
+    ("query_type", "status"),
+))
+github_response_bytes = registry.register(Histogram(
+    "devstats_github_response_size_bytes",
+    "GitHub API response body size by query type.",
+    ("query_type",),
+    buckets=tuple(1024 * 4 ** i for i in range(8)),
+))
+github_rate_limit_cost = registry.register(Counter(
+    "devstats_github_rate_limit_cost",
+    "Rate-limit points spent by query type (GraphQL cost, 1 per REST call).",
+    ("query_type",),
+))
+
+db_query_seconds = registry.register(Histogram(
+    "devstats_db_query_duration_seconds",
+    "SQL statement latency by database and statement kind.",
+    ("database", "kind"),
+    buckets=(
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+        1.0, 2.5, 5.0,
+    ),
+))
+db_checkout_seconds = registry.register(Histogram(
+    "devstats_db_pool_checkout_duration_seconds",
+    "Time spent waiting for a pooled database connection.",
+    ("database",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+))
@@ -1,42 +1,107 @@
 import base64
 import hashlib
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from app.core.config import settings
-from cryptography.fernet import Fernet, InvalidToken
+from app.core.ttl_cache import TTLCache
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 
 
-def _fernet_key() -> bytes:
+def _derived_key(secret: str) -> bytes:
+    """Fernet key derived from a secret (the JWT secret by default)."""
+    digest = hashlib.sha256(secret.encode()).digest()
+    return base64.urlsafe_b64encode(digest)
+
+
+class CryptoContext:
     """
-    Derive a Fernet key from the JWT secret so we do not persist
-    multiple secrets.
+    Keys derived once per process. Tokens are encrypted with the first
+    Fernet key and decrypted with any of them, so a new key can be put in
+    front of `TOKEN_ENCRYPTION_KEYS` without re-encrypting stored rows;
+    `rotate` moves a row onto the primary key when convenient. The key
+    derived from JWT_SECRET always comes last, so data written before any
+    explicit keys existed still decrypts.
     """
-    if not settings.jwt_secret:
-        raise RuntimeError(
-            "JWT_SECRET is required for encryption and signing.")
-    digest = hashlib.sha256(settings.jwt_secret.encode()).digest()
-    return base64.urlsafe_b64encode(digest)
+
+    def __init__(self, jwt_secret: str | None, encryption_keys: str = ""):
+        if not jwt_secret:
+            raise RuntimeError(
+                "JWT_SECRET is required for encryption and signing.")
+        self.jwt_secret = jwt_secret
+        keys = [key.strip() for key in encryption_keys.split(",")
+                if key.strip()]
+        keys.append(_derived_key(jwt_secret).decode())
+        self.fernet = MultiFernet([Fernet(key) for key in keys])
+
+    def encrypt(self, token: str) -> str:
+        return self.fernet.encrypt(token.encode()).decode()
+
+    def decrypt(self, token_encrypted: str) -> str:
+        try:
+            return self.fernet.decrypt(token_encrypted.encode()).decode()
+        except InvalidToken as exc:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid stored credentials.",
+            ) from exc
+
+    def decrypt_many(
+        self,
+        tokens_encrypted: Iterable[str | None],
+    ) -> list[str | None]:
+        """Decrypt a batch; entries that are empty or invalid map to None."""
+        decrypt = self.fernet.decrypt
+        results: list[str | None] = []
+        for token_encrypted in tokens_encrypted:
+            try:
+                results.append(
+                    decrypt(token_encrypted.encode()).decode()
+                    if token_encrypted else None
+                )
+            except InvalidToken:
+                results.append(None)
+        return results
+
+    def rotate(self, token_encrypted: str) -> str:
+        """Re-encrypt a stored token under the primary key."""
+        return self.fernet.rotate(token_encrypted.encode()).decode()
+
+
+_crypto_context: CryptoContext | None = None
+
+
+def get_crypto_context() -> CryptoContext:
+    global _crypto_context
+    if _crypto_context is None:
+        _crypto_context = CryptoContext(
+            settings.jwt_secret, settings.token_encryption_keys
+        )
+    return _crypto_context
+
+
+def reset_crypto_context() -> None:
+    """Forget derived keys, e.g. after changing settings in tests."""
+    global _crypto_context
+    _crypto_context = None
 
 
 def encrypt_token(token: str) -> str:
     """Encrypt sensitive tokens before storing."""
-    fernet = Fernet(_fernet_key())
-    return fernet.encrypt(token.encode()).decode()
+    return get_crypto_context().encrypt(token)
 
 
 def decrypt_token(token_encrypted: str) -> str:
     """Decrypt stored tokens."""
-    fernet = Fernet(_fernet_key())
-    try:
-        return fernet.decrypt(token_encrypted.encode()).decode()
-    except InvalidToken as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid stored credentials.",
-        ) from exc
+    return get_crypto_context().decrypt(token_encrypted)
+
+
+def decrypt_tokens(tokens_encrypted: Iterable[str | None]) -> list[str | None]:
+    """Batch decrypt for background jobs; invalid entries come back None."""
+    return get_crypto_context().decrypt_many(tokens_encrypted)
 
 
 def create_access_token(
@@ -44,23 +109,21 @@ def create_access_token(
     expires_delta: timedelta | None = None,
 ) -> str:
     """Create a short-lived JWT for API access."""
-    if not settings.jwt_secret:
-        raise RuntimeError("JWT_SECRET is not configured.")
+    secret = get_crypto_context().jwt_secret
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(hours=6))
     to_encode.update({"exp": expire})
-    return str(jwt.encode(to_encode, settings.jwt_secret, algorithm="HS256"))
+    return str(jwt.encode(to_encode, secret, algorithm="HS256"))
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
     """Decode and validate JWT."""
-    if not settings.jwt_secret:
-        raise RuntimeError("JWT_SECRET is not configured.")
+    secret = get_crypto_context().jwt_secret
     try:
         return dict(
             jwt.decode(
                 token,
-                settings.jwt_secret,
+                secret,
                 algorithms=["HS256"]
             )
         )
@@ -69,3 +132,28 @@ def decode_access_token(token: str) -> dict[str, Any]:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token.",
         ) from exc
+
+
+# decoded claims keyed by a hash of the token
+claims_cache = TTLCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl,
+)
+
+
+def decode_access_token_cached(token: str) -> dict[str, Any]:
+    """
+    decode_access_token, reusing the result for repeat requests with the
+    same token. Entries never outlive the token's own `exp`.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = claims_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
+    payload = decode_access_token(token)
+    ttl = settings.auth_cache_ttl
+    if isinstance(exp := payload.get("exp"), (int, float)):
+        ttl = min(ttl, exp - datetime.now(timezone.utc).timestamp())
+    claims_cache.set(key, payload, ttl_seconds=ttl)
+    return dict(payload)
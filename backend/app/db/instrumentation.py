@@ -0,0 +1,165 @@
+import time
+from typing import Any
+
+from app.core import metrics
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+STATEMENT_KINDS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "avg_ms": round(self.total / self.count * 1000, 3)
+            if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+def statement_kind(statement: str) -> str:
+    head = statement.lstrip()[:6].upper()
+    return head if head in STATEMENT_KINDS else "OTHER"
+
+
+class DBStats:
+    """
+    Pool and statement counters for one engine, fed by SQLAlchemy pool and
+    cursor events plus InstrumentedQueuePool's checkout timing. Timings
+    also go to the Prometheus histograms, labelled with `name`.
+    Updates are plain attribute writes made under the GIL; a snapshot may
+    be a few events behind, which is fine for monitoring.
+    """
+
+    def __init__(self, name: str = "primary") -> None:
+        self.name = name
+        self.checkout_wait = _Timing()
+        self.statements = {
+            kind: _Timing() for kind in (*STATEMENT_KINDS, "OTHER")
+        }
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkout_errors = 0
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        _instrumented[self.name] = self
+        query_seconds = metrics.db_query_seconds
+
+        @event.listens_for(sync_engine.pool, "connect")
+        def _connect(dbapi_conn: Any, record: Any) -> None:
+            self.connects += 1
+
+        @event.listens_for(sync_engine.pool, "checkout")
+        def _checkout(dbapi_conn: Any, record: Any, proxy: Any) -> None:
+            self.checkouts += 1
+            self.in_use += 1
+            if self.in_use > self.max_in_use:
+                self.max_in_use = self.in_use
+
+        @event.listens_for(sync_engine.pool, "checkin")
+        def _checkin(dbapi_conn: Any, record: Any) -> None:
+            self.in_use = max(0, self.in_use - 1)
+
+        @event.listens_for(sync_engine.pool, "invalidate")
+        def _invalidate(dbapi_conn: Any, record: Any, exc: Any) -> None:
+            self.invalidations += 1
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, params, context, many) -> None:
+            starts = conn.info.setdefault("query_start", [])
+            starts.append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, params, context, many) -> None:
+            elapsed = time.perf_counter() - conn.info["query_start"].pop()
+            kind = statement_kind(statement)
+            self.statements[kind].record(elapsed)
+            query_seconds.observe(elapsed, self.name, kind)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _error(context: Any) -> None:
+            # a failed statement never reaches after_cursor_execute
+            if context.connection is not None:
+                context.connection.info.pop("query_start", None)
+
+    def snapshot(self, engine: AsyncEngine | None = None) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "connections": {
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "invalidations": self.invalidations,
+                "checkout_errors": self.checkout_errors,
+            },
+            "checkout_wait": self.checkout_wait.as_dict(),
+            "statements": {
+                kind: timing.as_dict()
+                for kind, timing in self.statements.items()
+            },
+        }
+        if engine is not None:
+            pool = engine.sync_engine.pool
+            data["pool"] = {
+                "class": type(pool).__name__,
+                "size": getattr(pool, "size", lambda: None)(),
+                "checked_out": getattr(pool, "checkedout", lambda: None)(),
+                "overflow": getattr(pool, "overflow", lambda: None)(),
+                "status": pool.status(),
+            }
+        return data
+
+
+db_stats = DBStats()
+
+# stats of engines instrumented in this process, by name
+_instrumented: dict[str, DBStats] = {}
+
+metrics.registry.register(metrics.GaugeFunc(
+    "devstats_db_connections_in_use",
+    "Pooled database connections currently checked out.",
+    ("database",),
+    lambda: {(name,): stats.in_use for name, stats in _instrumented.items()},
+))
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long each checkout waited for
+    a connection (including opening a new one). The pool has no event
+    that fires before a checkout starts, hence the subclass.
+    """
+
+    stats = db_stats
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            self.stats.checkout_errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.checkout_wait.record(elapsed)
+            metrics.db_checkout_seconds.observe(elapsed, self.stats.name)
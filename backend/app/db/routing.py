@@ -0,0 +1,60 @@
+from collections.abc import Hashable
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class RecentWrites:
+    """
+    Keys (a user's github_id) that wrote within the last `window_seconds`.
+    Tracked per process, so with several workers the guarantee holds for
+    requests that land on the worker which made the write.
+    """
+
+    def __init__(self, *, window_seconds: float, max_keys: int = 100_000):
+        self._keys = TTLCache(max_entries=max_keys, ttl_seconds=window_seconds)
+
+    def note(self, key: Hashable | None) -> None:
+        if key is not None:
+            self._keys.set(key, True)
+
+    def __contains__(self, key: Hashable | None) -> bool:
+        return key is not None and self._keys.get(key) is not None
+
+    def stats(self) -> dict[str, int]:
+        return self._keys.stats()
+
+
+recent_writes = RecentWrites(window_seconds=settings.read_your_writes_seconds)
+
+
+class SessionRouter:
+    """
+    Picks the session factory for a unit of work: writes always go to the
+    primary, reads go to the replica when one is configured, except for a
+    key that wrote recently, whose reads stay on the primary so the user
+    sees their own writes despite replica lag.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        writes: RecentWrites = recent_writes,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.writes = writes
+
+    def for_write(self) -> async_sessionmaker[AsyncSession]:
+        return self.primary
+
+    def for_read(
+        self,
+        key: Hashable | None = None,
+    ) -> async_sessionmaker[AsyncSession]:
+        if self.replica is None or key in self.writes:
+            return self.primary
+        return self.replica
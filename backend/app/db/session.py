@@ -1,14 +1,39 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from app.core.config import settings
-from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
-                                    create_async_engine)
+from app.db.instrumentation import DBStats, InstrumentedQueuePool, db_stats
+from app.db.routing import SessionRouter
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
+
+
+def _create_engine(url: str, stats: DBStats) -> AsyncEngine:
+    pool_class = type(
+        "InstrumentedQueuePool", (InstrumentedQueuePool,), {"stats": stats}
+    )
+    connect_args: dict[str, Any] = {}
+    # asyncpg-only; other drivers (e.g. aiosqlite) reject it at connect time
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["statement_cache_size"] = settings.db_statement_cache_size
+    created = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=pool_class,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+    stats.instrument(created)
+    return created
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    future=True,
-)
+
+engine = _create_engine(settings.database_url, db_stats)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -16,6 +41,21 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+replica_db_stats = DBStats("replica")
+replica_engine: AsyncEngine | None = None
+ReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_replica_url:
+    replica_engine = _create_engine(
+        settings.database_replica_url, replica_db_stats
+    )
+    ReadSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+session_router = SessionRouter(AsyncSessionLocal, ReadSessionLocal)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
@@ -1,3 +1,10 @@
 from .github import GitHubService
+from .github_async import AsyncGitHubService, GitHubAPIError
+from .inventory import RepoInventory
 
-__all__ = ["GitHubService"]
+__all__ = [
+    "AsyncGitHubService",
+    "GitHubAPIError",
+    "GitHubService",
+    "RepoInventory",
+]
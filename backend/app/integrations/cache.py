@@ -0,0 +1,237 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+from app.core.config import settings
+
+
+class CachedResponse(NamedTuple):
+    """A GitHub REST response body plus the validators needed to revalidate."""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+    next_url: str | None
+
+
+class ResponseCacheBackend(Protocol):
+    # whether calls may block on I/O (and so run off the event loop)
+    blocking: bool
+
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU keyed by request URL."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    LRU cache persisted to a local SQLite file, so validators survive
+    restarts and can be shared by workers on the same host.
+
+    Reads do not write: access times are kept in memory and flushed in
+    one transaction with the next `set`, or once `touch_batch` reads have
+    piled up. Calls block on disk, so async callers go through
+    ResponseCache, which runs them in a worker thread.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10_000,
+        *,
+        touch_batch: int = 256,
+    ):
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS github_response_cache (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                next_url TEXT,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_github_response_cache_accessed_at "
+            "ON github_response_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body, next_url "
+                "FROM github_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touches()
+                self._conn.commit()
+        etag, last_modified, body, next_url = row
+        return CachedResponse(etag, last_modified, json.loads(body), next_url)
+
+    def _flush_touches(self) -> None:
+        """Write pending access times (caller holds the lock and commits)."""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE github_response_cache SET accessed_at = ? WHERE key = ?",
+            [(at, key) for key, at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            # eviction below must see recent reads
+            self._flush_touches()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO github_response_cache "
+                "(key, etag, last_modified, body, next_url, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.etag,
+                    entry.last_modified,
+                    json.dumps(entry.body),
+                    entry.next_url,
+                    time.time(),
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM github_response_cache WHERE key IN ("
+                "SELECT key FROM github_response_cache "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM github_response_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM github_response_cache"
+            ).fetchone()
+        return int(count)
+
+
+class ResponseCache:
+    """
+    Conditional-request cache for GitHub REST GETs.
+
+    GitHub does not count 304 Not Modified responses against the rate
+    limit, so revalidating with If-None-Match / If-Modified-Since is
+    effectively free.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    async def lookup(self, key: str) -> CachedResponse | None:
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.backend.get, key)
+        return self.backend.get(key)
+
+    async def store(self, key: str, entry: CachedResponse) -> None:
+        if self.backend.blocking:
+            await asyncio.to_thread(self.backend.set, key, entry)
+        else:
+            self.backend.set(key, entry)
+
+    def validators(self, entry: CachedResponse | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+        if entry.etag:
+            return {"If-None-Match": entry.etag}
+        if entry.last_modified:
+            return {"If-Modified-Since": entry.last_modified}
+        return {}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """The process-wide cache configured by `settings.github_cache_backend`."""
+    global _response_cache
+    if _response_cache is None:
+        backend: ResponseCacheBackend
+        if settings.github_cache_backend == "memory":
+            backend = MemoryCacheBackend(settings.github_cache_max_entries)
+        elif settings.github_cache_backend == "sqlite":
+            backend = SQLiteCacheBackend(
+                settings.github_cache_path,
+                settings.github_cache_max_entries,
+            )
+        else:
+            return None
+        _response_cache = ResponseCache(backend)
+    return _response_cache
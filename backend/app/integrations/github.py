@@ -1,44 +1,73 @@
-import json
-import os
-from typing import Any
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from datetime import datetime
+from typing import Any, TypeVar
+
+from app.integrations.github_async import AsyncGitHubService, BatchKey
+from app.schemas.pull_request import PRParameters, PullRequestInfo
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Drive a coroutine to completion on a long-lived, per-thread loop so
+    sync callers still reuse one keep-alive pool between calls.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "GitHubService blocks the event loop; "
+            "use AsyncGitHubService from async code."
+        )
+
+    loop: asyncio.AbstractEventLoop | None = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop.run_until_complete(coro)
 
-from github import Github
 
-from backend.app.schemas.pull_request import PRParameters, PullRequestInfo
+def _iter_sync(agen: AsyncIterator[T]) -> Iterator[T]:
+    """Step an async iterator from sync code, one item per loop run."""
+    try:
+        while True:
+            try:
+                yield _run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(agen, "aclose", None)
+        if aclose is not None:
+            _run_sync(aclose())
 
 
 class GitHubService:
-    def __init__(self, token: str | None = None):
-        self.token = (
-            token
-            or os.getenv("Github_Token")
-            or os.getenv("GITHUB_TOKEN")
-        )
-        if not self.token:
-            raise ValueError(
-                "GitHub token not provided. Set Github_Token env var "
-                "or pass token."
-            )
+    """Synchronous facade over `AsyncGitHubService` for scripts and CLIs."""
 
-        # Treat the PyGithub client as `Any` to allow accessing different
-        # versions' internals (requester or graphql) without static errors.
-        self.client: Any = Github(self.token)
+    def __init__(self, token: str | None = None):
+        self.aio = AsyncGitHubService(token)
+        self.token = self.aio.token
 
     # -----------------------------
     # Repo helpers
     # -----------------------------
 
     def get_user_repos(self, username: str) -> list[str]:
-        user = self.client.get_user(username)
-        return [repo.full_name for repo in user.get_repos()]
+        return _run_sync(self.aio.get_user_repos(username))
 
     def get_user_repos_forked(self, username: str) -> list[str]:
-        user = self.client.get_user(username)
-        return [repo.full_name for repo in user.get_repos() if repo.fork]
+        return _run_sync(self.aio.get_user_repos_forked(username))
 
     def get_user_repos_not_forked(self, username: str) -> list[str]:
-        user = self.client.get_user(username)
-        return [repo.full_name for repo in user.get_repos() if not repo.fork]
+        return _run_sync(self.aio.get_user_repos_not_forked(username))
 
     # -------------------------------------------------
     # 🚀 FASTEST PR FETCH + PRParameters (GraphQL)
@@ -48,91 +77,60 @@ class GitHubService:
         self,
         username: str,
         repo_full_name: str | None = None,
+        *,
+        paginate: bool = False,
     ) -> list[tuple[PullRequestInfo, PRParameters]]:
-
-        search_query = f"is:pr author:{username}"
-        if repo_full_name:
-            search_query += f" repo:{repo_full_name}"
-
-        query = """
-        query ($query: String!) {
-          search(type: ISSUE, query: $query, first: 100) {
-            nodes {
-              ... on PullRequest {
-                number
-                title
-                body
-                state
-                merged
-                createdAt
-                closedAt
-                additions
-                deletions
-                changedFiles
-                commits {
-                  totalCount
-                }
-                baseRepository {
-                  nameWithOwner
-                  stargazerCount
-                  forkCount
-                }
-              }
-            }
-          }
-        }
-        """
-
-        variables = {"query": search_query}
-
-        # Access the internal requester if available, otherwise fall back to
-        # the public `graphql` method provided by PyGithub.
-        requester: Any | None = getattr(self.client, "_Github__requester", None) or getattr(
-            self.client, "__requester", None
+        return _run_sync(
+            self.aio.get_user_prs_graphql(
+                username, repo_full_name, paginate=paginate
+            )
         )
 
-        if requester is not None:
-            status, headers, raw_result = requester.requestJson(
-                "POST",
-                "/graphql",
-                input={"query": query, "variables": variables},
-            )
-            result = json.loads(raw_result) if isinstance(raw_result, str) else raw_result
-        else:
-            # Use the public graphql method; signature may vary by PyGithub version.
-            try:
-                result = self.client.graphql(query, variables=variables)
-            except TypeError:
-                # Some versions expect a single string argument or different kwargs
-                result = self.client.graphql(query)
-
-        output: list[tuple[PullRequestInfo, PRParameters]] = []
-
-        for pr in result["data"]["search"]["nodes"]:
-            pr_info = PullRequestInfo(
-                repo=pr["baseRepository"]["nameWithOwner"],
-                pr_number=pr["number"],
-                title=pr["title"],
-                body=pr["body"],
-                state=pr["state"].lower(),
-                created_at=pr["createdAt"],
-                merged=pr["merged"],
+    def iter_user_prs_graphql(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        page_size: int = 100,
+    ) -> Iterator[tuple[PullRequestInfo, PRParameters]]:
+        """Blocking counterpart of `AsyncGitHubService.iter_user_prs_graphql`."""
+        return _iter_sync(
+            self.aio.iter_user_prs_graphql(
+                username, repo_full_name, page_size=page_size
             )
+        )
 
-            pr_params = PRParameters(
-                lines_added=pr["additions"],
-                lines_removed=pr["deletions"],
-                files_changed=pr["changedFiles"],
-                commits=pr["commits"]["totalCount"],
-                pr_opened=pr["createdAt"],
-                pr_closed=pr["closedAt"],
-                repo_stars=pr["baseRepository"]["stargazerCount"],
-                repo_forks=pr["baseRepository"]["forkCount"],
+    def get_user_prs_sharded(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[tuple[PullRequestInfo, PRParameters]]:
+        return _run_sync(
+            self.aio.get_user_prs_sharded(
+                username,
+                repo_full_name,
+                since=since,
+                until=until,
+                max_concurrency=max_concurrency,
             )
+        )
 
-            output.append((pr_info, pr_params))
-
-        return output
+    def get_prs_batch(
+        self,
+        keys: list[BatchKey],
+        *,
+        paginate: bool = True,
+        max_aliases: int | None = None,
+    ) -> dict[BatchKey, list[tuple[PullRequestInfo, PRParameters]]]:
+        return _run_sync(
+            self.aio.get_prs_batch(
+                keys, paginate=paginate, max_aliases=max_aliases
+            )
+        )
 
     # -------------------------------------------------
     # PRs made from FORKED repos (still fast)
@@ -142,21 +140,4 @@ class GitHubService:
         self,
         username: str
     ) -> list[tuple[PullRequestInfo, PRParameters]]:
-
-        user = self.client.get_user(username)
-
-        forked_repo_names = {
-            repo.full_name
-            for repo in user.get_repos()
-            if repo.fork
-        }
-
-        all_prs = self.get_user_prs_graphql(username=username)
-
-        forked_prs = [
-            (pr_info, pr_params)
-            for pr_info, pr_params in all_prs
-            if pr_info.repo not in forked_repo_names
-        ]
-
-        return forked_prs
+        return _run_sync(self.aio.get_user_pr_in_forked_repos(username))
@@ -0,0 +1,798 @@
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+from app.core import metrics
+from app.core.config import settings
+from app.integrations.cache import (CachedResponse, ResponseCache,
+                                    get_response_cache)
+from app.integrations.http import get_http_client
+from app.integrations.inventory import RepoInventory, RepoInventoryCache
+from app.integrations.repo_metadata import (RepoMetadata, RepoMetadataStore,
+                                            build_repo_metadata_query,
+                                            get_repo_metadata_store)
+from app.integrations.scheduler import (GitHubScheduler, Priority,
+                                        get_scheduler, github_priority)
+from app.integrations.token_pool import (Credential, TokenPool, credential_id,
+                                         get_token_pool)
+from app.schemas.pull_request import PRParameters, PullRequestInfo
+
+# Selection shared by single and batched (aliased) PR searches.
+PR_SEARCH_FRAGMENT = """
+fragment PRSearchPage on SearchResultItemConnection {
+  issueCount
+  pageInfo {
+    hasNextPage
+    endCursor
+  }
+  nodes {
+    ... on PullRequest {
+      databaseId
+      number
+      title
+      body
+      state
+      merged
+      createdAt
+      updatedAt
+      closedAt
+      additions
+      deletions
+      changedFiles
+      commits {
+        totalCount
+      }
+      baseRepository {
+        nameWithOwner
+      }
+    }
+  }
+}
+"""
+
+RATE_LIMIT_FIELDS = """
+  rateLimit {
+    cost
+    limit
+    remaining
+    resetAt
+  }"""
+
+PR_SEARCH_QUERY = """
+query ($query: String!, $first: Int = 100, $after: String) {""" + RATE_LIMIT_FIELDS + """
+  search(type: ISSUE, query: $query, first: $first, after: $after) {
+    ...PRSearchPage
+  }
+}
+""" + PR_SEARCH_FRAGMENT
+
+PR_COUNT_QUERY = """
+query ($query: String!) {""" + RATE_LIMIT_FIELDS + """
+  search(type: ISSUE, query: $query, first: 1) {
+    issueCount
+  }
+}
+"""
+
+# GitHub search never returns more than this many results for one query.
+SEARCH_RESULT_CAP = 1000
+
+# Earliest possible `created:` date for a PR; GitHub launched in 2008.
+SEARCH_EPOCH = datetime(2008, 1, 1, tzinfo=timezone.utc)
+
+# Shards are not bisected below this width, even if still over the cap.
+MIN_SHARD_WIDTH = timedelta(minutes=1)
+
+# GitHub rejects documents that could return more nodes than this.
+GRAPHQL_NODE_LIMIT = 500_000
+
+DateRange = tuple[datetime, datetime]
+
+# A username, or a (username, repo_full_name) pair.
+BatchKey = str | tuple[str, str | None]
+
+_inventory_cache = RepoInventoryCache(
+    settings.github_inventory_ttl,
+    settings.github_inventory_max_entries,
+)
+
+
+def build_batched_pr_search(count: int) -> str:
+    """
+    One GraphQL document with `count` aliased searches `s0..s{count-1}`,
+    each with its own `$q{i}` query string and `$a{i}` cursor.
+    """
+    params = ", ".join(
+        f"$q{i}: String!, $a{i}: String" for i in range(count)
+    )
+    fields = "\n".join(
+        f"  s{i}: search(type: ISSUE, query: $q{i}, first: $first, "
+        f"after: $a{i}) {{\n    ...PRSearchPage\n  }}"
+        for i in range(count)
+    )
+    return (
+        f"query ($first: Int = 100, {params}) {{{RATE_LIMIT_FIELDS}\n"
+        f"{fields}\n}}\n{PR_SEARCH_FRAGMENT}"
+    )
+
+
+class GitHubAPIError(RuntimeError):
+    """Raised when GitHub returns GraphQL errors without any data."""
+
+
+def _alias_errors(errors: list[dict[str, Any]]) -> dict[str, str]:
+    """GraphQL error messages keyed by the top-level alias they hit."""
+    by_alias: dict[str, str] = {}
+    for error in errors:
+        path = error.get("path") or []
+        if path:
+            by_alias.setdefault(str(path[0]), error.get("message", ""))
+    return by_alias
+
+
+def resolve_token(token: str | None = None) -> str:
+    resolved = (
+        token
+        or os.getenv("Github_Token")
+        or os.getenv("GITHUB_TOKEN")
+    )
+    if not resolved:
+        raise ValueError(
+            "GitHub token not provided. Set Github_Token env var "
+            "or pass token."
+        )
+    return resolved
+
+
+def _search_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def pr_search_query(
+    username: str,
+    repo_full_name: str | None = None,
+    created: DateRange | None = None,
+    updated_since: datetime | None = None,
+) -> str:
+    search_query = f"is:pr author:{username}"
+    if repo_full_name:
+        search_query += f" repo:{repo_full_name}"
+    if created:
+        start, end = created
+        search_query += (
+            f" created:{_search_timestamp(start)}..{_search_timestamp(end)}"
+        )
+    if updated_since:
+        # inclusive so PRs touched in the watermark's own second are not
+        # lost; re-fetching them is harmless because sync upserts
+        search_query += (
+            f" updated:>={_search_timestamp(updated_since)} sort:updated-asc"
+        )
+    return search_query
+
+
+def parse_pr_node(
+    pr: dict[str, Any],
+    repo_metadata: Mapping[str, RepoMetadata] | None = None,
+) -> tuple[PullRequestInfo, PRParameters]:
+    """
+    Convert one GraphQL PullRequest node into our PR schemas.
+    Star / fork counts come from `repo_metadata` (keyed by nameWithOwner)
+    unless the node carries them itself.
+    """
+    base = pr["baseRepository"]
+    if "stargazerCount" in base:
+        repo_stars, repo_forks = base["stargazerCount"], base["forkCount"]
+    else:
+        meta = (repo_metadata or {}).get(base["nameWithOwner"])
+        repo_stars, repo_forks = (meta.stars, meta.forks) if meta else (0, 0)
+
+    pr_info = PullRequestInfo(
+        repo=pr["baseRepository"]["nameWithOwner"],
+        pr_number=pr["number"],
+        title=pr["title"],
+        body=pr["body"],
+        state=pr["state"].lower(),
+        created_at=pr["createdAt"],
+        merged=pr["merged"],
+        github_id=pr.get("databaseId"),
+        updated_at=pr.get("updatedAt"),
+    )
+
+    pr_params = PRParameters(
+        lines_added=pr["additions"],
+        lines_removed=pr["deletions"],
+        files_changed=pr["changedFiles"],
+        commits=pr["commits"]["totalCount"],
+        pr_opened=pr["createdAt"],
+        pr_closed=pr["closedAt"],
+        repo_stars=repo_stars,
+        repo_forks=repo_forks,
+    )
+
+    return pr_info, pr_params
+
+
+class AsyncGitHubService:
+    """
+    Non-blocking GitHub client for use inside the FastAPI event loop.
+    All instances share the per-process connection pool from
+    `app.integrations.http` unless an explicit client is passed.
+
+    Without an explicit token, requests are spread over the process-wide
+    `TokenPool`; `owner` names the user whose data is being fetched so
+    their own token is preferred.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
+        scheduler: GitHubScheduler | None = None,
+        *,
+        pool: TokenPool | None = None,
+        owner: str | None = None,
+    ):
+        if pool is None and token is None and len(get_token_pool()):
+            pool = get_token_pool()
+        self.pool = pool
+        self.owner = owner
+        self.token: str | None = None
+        self._credential_fixed: Credential | None = None
+        if pool is None:
+            self.token = resolve_token(token)
+            self._credential_fixed = Credential(
+                self.token, credential_id(self.token), None
+            )
+        self._client = client
+        self.cache = cache or get_response_cache()
+        self.scheduler = scheduler or get_scheduler()
+        self.repo_metadata: RepoMetadataStore = get_repo_metadata_store()
+        # scopes memoized per-user data such as the repo inventory
+        self.scope = (
+            self._credential_fixed.id if self._credential_fixed else "pool"
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+
+    @contextmanager
+    def _credential(self, resource: str) -> Iterator[Credential]:
+        if self._credential_fixed is not None:
+            yield self._credential_fixed
+            return
+        assert self.pool is not None
+        cred = self.pool.pick(resource, owner=self.owner)
+        try:
+            yield cred
+        finally:
+            self.pool.release(cred)
+
+    @staticmethod
+    def _auth_headers(cred: Credential) -> dict[str, str]:
+        return {"Authorization": f"Bearer {cred.token}"}
+
+    @staticmethod
+    def _record_call(
+        query_type: str,
+        started: float,
+        response: httpx.Response | None,
+    ) -> None:
+        metrics.github_request_seconds.observe(
+            time.perf_counter() - started, query_type
+        )
+        if response is None:
+            metrics.github_requests.inc(query_type, "error")
+            return
+        metrics.github_requests.inc(query_type, str(response.status_code))
+        metrics.github_response_bytes.observe(
+            len(response.content), query_type
+        )
+
+    # -----------------------------
+    # Transport
+    # -----------------------------
+
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        *,
+        cost_key: str = "graphql",
+    ) -> dict[str, Any]:
+        """
+        POST a GraphQL document through the rate-limit scheduler.
+        `cost_key` names the query shape so its point cost can be learned;
+        its part before any ':' labels the call in the metrics.
+        """
+        query_type = cost_key.split(":", 1)[0]
+        started = time.perf_counter()
+        response = None
+        try:
+            with self._credential("graphql") as cred:
+                response = await self.scheduler.run(
+                    cred.id,
+                    "graphql",
+                    cost_key,
+                    lambda: self.client.post(
+                        "/graphql",
+                        json={"query": query, "variables": variables or {}},
+                        headers=self._auth_headers(cred),
+                    ),
+                )
+        finally:
+            self._record_call(query_type, started, response)
+        self.scheduler.observe_headers(
+            cred.id, response.headers, default_resource="graphql"
+        )
+        response.raise_for_status()
+        result: dict[str, Any] = response.json()
+        if result.get("errors") and not result.get("data"):
+            raise GitHubAPIError(str(result["errors"]))
+        rate_limit = (result.get("data") or {}).get("rateLimit")
+        self.scheduler.observe_graphql(cred.id, cost_key, rate_limit)
+        metrics.github_rate_limit_cost.inc(
+            query_type,
+            amount=float((rate_limit or {}).get("cost") or 1),
+        )
+        return result
+
+    async def rest_get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> CachedResponse:
+        """
+        GET one REST resource, revalidating against the response cache.
+        A 304 is answered from the cached body.
+        """
+        with self._credential("core") as cred:
+            request = self.client.build_request("GET", url, params=params)
+            # validators are only meaningful for the token that got them
+            key = f"{cred.id}:{request.url}"
+            cached = await self.cache.lookup(key) if self.cache else None
+
+            request.headers.update(self._auth_headers(cred))
+            if self.cache:
+                request.headers.update(self.cache.validators(cached))
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await self.scheduler.run(
+                    cred.id,
+                    "core",
+                    "rest",
+                    lambda: self.client.send(request),
+                )
+            finally:
+                self._record_call("rest", started, response)
+        self.scheduler.observe_headers(cred.id, response.headers)
+
+        if response.status_code == 304 and cached is not None:
+            if self.cache:
+                self.cache.hits += 1
+            return cached
+
+        response.raise_for_status()
+        # conditional requests answered with 304 do not count against the limit
+        metrics.github_rate_limit_cost.inc("rest")
+        entry = CachedResponse(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            body=response.json(),
+            next_url=response.links.get("next", {}).get("url"),
+        )
+        if self.cache:
+            self.cache.misses += 1
+            if entry.etag or entry.last_modified:
+                await self.cache.store(key, entry)
+        return entry
+
+    async def rest_get_all(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """GET a paginated REST collection, following `Link: rel=next`."""
+        items: list[dict[str, Any]] = []
+        url: str | None = path
+        query: dict[str, Any] | None = {"per_page": 100, **(params or {})}
+        while url:
+            page = await self.rest_get(url, query)
+            items.extend(page.body)
+            url = page.next_url
+            # the `next` link already carries the query string
+            query = None
+        return items
+
+    # -----------------------------
+    # Repo helpers
+    # -----------------------------
+
+    async def get_repo_inventory(
+        self,
+        username: str,
+        *,
+        refresh: bool = False,
+    ) -> RepoInventory:
+        """
+        All of the user's repos with fork flag, stars and forks, listed
+        once and memoized for `settings.github_inventory_ttl` seconds.
+        The listing goes through the REST response cache, so a refresh
+        after the TTL is usually a free 304.
+        """
+        async def fetch() -> RepoInventory:
+            items = await self.rest_get_all(f"/users/{username}/repos")
+            inventory = RepoInventory.from_rest(username, items)
+            fetched_at = datetime.now(timezone.utc)
+            self.repo_metadata.put_many(
+                RepoMetadata(repo.full_name, repo.stars, repo.forks, fetched_at)
+                for repo in inventory.repos
+            )
+            return inventory
+
+        return await _inventory_cache.get(
+            f"{self.scope}:{username.lower()}",
+            fetch,
+            refresh=refresh,
+        )
+
+    # -----------------------------
+    # Repository metadata
+    # -----------------------------
+
+    async def resolve_repo_metadata(
+        self,
+        names: Iterable[str],
+    ) -> dict[str, RepoMetadata]:
+        """
+        Star / fork counts for the given repos, fetching only those missing
+        from (or stale in) the metadata store, many per request.
+        """
+        names = list(dict.fromkeys(names))
+        stale = self.repo_metadata.stale(names)
+        per_query = settings.github_batch_max_aliases
+        for i in range(0, len(stale), per_query):
+            chunk = stale[i:i + per_query]
+            variables: dict[str, str] = {}
+            for j, name in enumerate(chunk):
+                owner, _, repo = name.partition("/")
+                variables[f"o{j}"] = owner
+                variables[f"n{j}"] = repo
+            result = await self.graphql(
+                build_repo_metadata_query(len(chunk)),
+                variables,
+                cost_key=f"repo_metadata:{len(chunk)}",
+            )
+            data = result.get("data") or {}
+            fetched_at = datetime.now(timezone.utc)
+            for j, name in enumerate(chunk):
+                # deleted / inaccessible repos are cached as 0 / 0 so they
+                # are not looked up again on every page
+                node = data.get(f"r{j}") or {}
+                self.repo_metadata.put(RepoMetadata(
+                    node.get("nameWithOwner", name),
+                    node.get("stargazerCount", 0),
+                    node.get("forkCount", 0),
+                    fetched_at,
+                ))
+        return self.repo_metadata.lookup(names)
+
+    async def _parse_nodes(
+        self,
+        nodes: Iterable[dict[str, Any] | None],
+    ) -> list[tuple[PullRequestInfo, PRParameters]]:
+        prs = [pr for pr in nodes if pr]
+        metadata = await self.resolve_repo_metadata(
+            pr["baseRepository"]["nameWithOwner"]
+            for pr in prs
+            if "stargazerCount" not in pr["baseRepository"]
+        )
+        return [parse_pr_node(pr, metadata) for pr in prs]
+
+    async def get_user_repos(self, username: str) -> list[str]:
+        return (await self.get_repo_inventory(username)).full_names
+
+    async def get_user_repos_forked(self, username: str) -> list[str]:
+        return list((await self.get_repo_inventory(username)).forked)
+
+    async def get_user_repos_not_forked(self, username: str) -> list[str]:
+        return list((await self.get_repo_inventory(username)).not_forked)
+
+    # -------------------------------------------------
+    # PR fetch + PRParameters (GraphQL)
+    # -------------------------------------------------
+
+    async def get_user_prs_graphql(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        paginate: bool = False,
+    ) -> list[tuple[PullRequestInfo, PRParameters]]:
+        """
+        Fetch the user's PRs. By default only the first 100 search results
+        are returned; pass `paginate=True` to follow every page.
+        """
+        if paginate:
+            return [
+                pr async for pr in self.iter_user_prs_graphql(
+                    username, repo_full_name
+                )
+            ]
+        result = await self.graphql(
+            PR_SEARCH_QUERY,
+            {"query": pr_search_query(username, repo_full_name)},
+            cost_key="pr_search",
+        )
+        return await self._parse_nodes(result["data"]["search"]["nodes"])
+
+    async def iter_user_prs_graphql(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        page_size: int = 100,
+        created: DateRange | None = None,
+        updated_since: datetime | None = None,
+    ) -> AsyncIterator[tuple[PullRequestInfo, PRParameters]]:
+        """
+        Stream every PR matching the search, following `endCursor`.
+
+        Only one page is held at a time; the next page is requested while
+        the caller is still consuming the current one.
+        """
+        variables: dict[str, Any] = {
+            "query": pr_search_query(
+                username, repo_full_name, created, updated_since
+            ),
+            "first": page_size,
+            "after": None,
+        }
+        pending = asyncio.ensure_future(
+            self.graphql(
+                PR_SEARCH_QUERY, dict(variables), cost_key="pr_search"
+            )
+        )
+        try:
+            while pending is not None:
+                search = (await pending)["data"]["search"]
+                pending = None
+                page_info = search["pageInfo"]
+                if page_info["hasNextPage"] and page_info["endCursor"]:
+                    variables["after"] = page_info["endCursor"]
+                    pending = asyncio.ensure_future(
+                        self.graphql(
+                            PR_SEARCH_QUERY,
+                            dict(variables),
+                            cost_key="pr_search",
+                        )
+                    )
+                for pr in await self._parse_nodes(search["nodes"]):
+                    yield pr
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # -------------------------------------------------
+    # Batched search (many users / repos per request)
+    # -------------------------------------------------
+
+    async def get_prs_batch(
+        self,
+        keys: list[BatchKey],
+        *,
+        paginate: bool = True,
+        page_size: int = 100,
+        max_aliases: int | None = None,
+        errors: dict[BatchKey, str] | None = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> dict[BatchKey, list[tuple[PullRequestInfo, PRParameters]]]:
+        """
+        Run the PR search for many usernames or (username, repo) pairs,
+        packing up to `max_aliases` (default
+        `settings.github_batch_max_aliases`) aliased searches into each
+        GraphQL request. Searches with more pages are re-packed with
+        their cursors in the next round. Returns results per input key.
+
+        GitHub fails aliases one by one (e.g. a login that does not
+        exist comes back as null next to the other results): such a key
+        keeps the pages fetched so far and its error message is put in
+        `errors` when given.
+
+        Being bulk work, the searches run at `Priority.BACKGROUND` unless
+        another `priority` is passed.
+        """
+        targets: dict[BatchKey, tuple[str, str | None]] = {
+            key: (key, None) if isinstance(key, str) else key
+            for key in dict.fromkeys(keys)
+        }
+        results: dict[BatchKey, list[tuple[PullRequestInfo, PRParameters]]] = {
+            key: [] for key in targets
+        }
+        per_query = max(1, min(
+            max_aliases or settings.github_batch_max_aliases,
+            GRAPHQL_NODE_LIMIT // page_size,
+        ))
+        semaphore = asyncio.Semaphore(settings.github_search_concurrency)
+
+        async def run_chunk(
+            chunk: list[tuple[BatchKey, str | None]],
+        ) -> list[tuple[BatchKey, str | None]]:
+            variables: dict[str, Any] = {"first": page_size}
+            for i, (key, cursor) in enumerate(chunk):
+                variables[f"q{i}"] = pr_search_query(*targets[key])
+                variables[f"a{i}"] = cursor
+            async with semaphore:
+                result = await self.graphql(
+                    build_batched_pr_search(len(chunk)),
+                    variables,
+                    cost_key=f"pr_search_batch:{len(chunk)}",
+                )
+            follow_up: list[tuple[BatchKey, str | None]] = []
+            data = result["data"]
+            searches = [data.get(f"s{i}") for i in range(len(chunk))]
+            metadata = await self.resolve_repo_metadata(
+                pr["baseRepository"]["nameWithOwner"]
+                for search in searches
+                if search is not None
+                for pr in search["nodes"]
+                if pr and "stargazerCount" not in pr["baseRepository"]
+            )
+            failed = _alias_errors(result.get("errors") or [])
+            for i, ((key, _), search) in enumerate(zip(chunk, searches)):
+                if search is None:
+                    if errors is not None:
+                        errors[key] = failed.get(
+                            f"s{i}", "No data returned for this search."
+                        )
+                    continue
+                results[key].extend(
+                    parse_pr_node(pr, metadata) for pr in search["nodes"] if pr
+                )
+                page_info = search["pageInfo"]
+                if (
+                    paginate
+                    and page_info["hasNextPage"]
+                    and page_info["endCursor"]
+                ):
+                    follow_up.append((key, page_info["endCursor"]))
+            return follow_up
+
+        pending: list[tuple[BatchKey, str | None]] = [
+            (key, None) for key in targets
+        ]
+        # tasks copy the context when created, so the chunks inherit it
+        with github_priority(priority):
+            while pending:
+                rounds = await asyncio.gather(*(
+                    run_chunk(pending[i:i + per_query])
+                    for i in range(0, len(pending), per_query)
+                ))
+                pending = [item for follow_up in rounds for item in follow_up]
+        return results
+
+    # -------------------------------------------------
+    # Date-sharded search (past the 1000 result cap)
+    # -------------------------------------------------
+
+    async def count_user_prs(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        created: DateRange | None = None,
+    ) -> int:
+        result = await self.graphql(
+            PR_COUNT_QUERY,
+            {"query": pr_search_query(username, repo_full_name, created)},
+            cost_key="pr_count",
+        )
+        return int(result["data"]["search"]["issueCount"])
+
+    async def plan_date_shards(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[DateRange]:
+        """
+        Split `created:` time into ranges that each match at most
+        SEARCH_RESULT_CAP PRs, bisecting any range that is over the cap.
+        Empty ranges are dropped. Returned in chronological order.
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.github_search_concurrency
+        )
+
+        async def split(created: DateRange) -> list[DateRange]:
+            async with semaphore:
+                count = await self.count_user_prs(
+                    username, repo_full_name, created
+                )
+            start, end = created
+            if count == 0:
+                return []
+            if count <= SEARCH_RESULT_CAP or end - start <= MIN_SHARD_WIDTH:
+                return [created]
+            # search ranges are inclusive on both ends; the overlap on the
+            # midpoint second is removed when results are merged
+            mid = start + (end - start) / 2
+            mid = mid.replace(microsecond=0)
+            left, right = await asyncio.gather(
+                split((start, mid)), split((mid, end))
+            )
+            return left + right
+
+        return await split((
+            since or SEARCH_EPOCH,
+            until or datetime.now(timezone.utc),
+        ))
+
+    async def get_user_prs_sharded(
+        self,
+        username: str,
+        repo_full_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[tuple[PullRequestInfo, PRParameters]]:
+        """
+        Fetch a user's complete PR history by searching date shards
+        concurrently, at most `max_concurrency` requests in flight
+        (default `settings.github_search_concurrency`).
+        Results are merged oldest shard first, without duplicates.
+        """
+        limit = max_concurrency or settings.github_search_concurrency
+        shards = await self.plan_date_shards(
+            username,
+            repo_full_name,
+            since=since,
+            until=until,
+            max_concurrency=limit,
+        )
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(
+            created: DateRange,
+        ) -> list[tuple[PullRequestInfo, PRParameters]]:
+            async with semaphore:
+                return [
+                    pr async for pr in self.iter_user_prs_graphql(
+                        username, repo_full_name, created=created
+                    )
+                ]
+
+        pages = await asyncio.gather(*(fetch(shard) for shard in shards))
+
+        seen: set[tuple[str, int]] = set()
+        output: list[tuple[PullRequestInfo, PRParameters]] = []
+        for page in pages:
+            for pr_info, pr_params in page:
+                key = (pr_info.repo, pr_info.pr_number)
+                if key not in seen:
+                    seen.add(key)
+                    output.append((pr_info, pr_params))
+        return output
+
+    async def get_user_pr_in_forked_repos(
+        self,
+        username: str
+    ) -> list[tuple[PullRequestInfo, PRParameters]]:
+        forked_repo_names = set(await self.get_user_repos_forked(username))
+        all_prs = await self.get_user_prs_graphql(username=username)
+        return [
+            (pr_info, pr_params)
+            for pr_info, pr_params in all_prs
+            if pr_info.repo not in forked_repo_names
+        ]
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, NamedTuple
+
+
+class RepoSummary(NamedTuple):
+    full_name: str
+    is_fork: bool
+    stars: int
+    forks: int
+
+
+class RepoInventory:
+    """A user's repositories, partitioned into forked / not forked once."""
+
+    def __init__(self, username: str, repos: Iterable[RepoSummary]):
+        self.username = username
+        self.fetched_at = time.monotonic()
+        self.repos: list[RepoSummary] = []
+        self.forked: list[str] = []
+        self.not_forked: list[str] = []
+        for repo in repos:
+            self.repos.append(repo)
+            (self.forked if repo.is_fork else self.not_forked).append(
+                repo.full_name
+            )
+
+    @classmethod
+    def from_rest(
+        cls,
+        username: str,
+        items: Iterable[dict[str, Any]],
+    ) -> "RepoInventory":
+        return cls(
+            username,
+            (
+                RepoSummary(
+                    full_name=item["full_name"],
+                    is_fork=bool(item["fork"]),
+                    stars=item.get("stargazers_count", 0),
+                    forks=item.get("forks_count", 0),
+                )
+                for item in items
+            ),
+        )
+
+    @property
+    def full_names(self) -> list[str]:
+        return [repo.full_name for repo in self.repos]
+
+
+class RepoInventoryCache:
+    """
+    TTL memo of `RepoInventory` objects, least recently used first out
+    once `max_entries` is reached. Concurrent misses for the same key
+    share a single fetch task; every caller awaits it shielded, so
+    cancelling one caller does not cancel the fetch for the others.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, RepoInventory] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[RepoInventory]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, key: str | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _store(self, key: str, task: asyncio.Task[RepoInventory]) -> None:
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = task.result()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[RepoInventory]],
+        *,
+        refresh: bool = False,
+    ) -> RepoInventory:
+        inventory = self._entries.get(key)
+        if inventory is not None:
+            if (
+                not refresh
+                and time.monotonic() - inventory.fetched_at < self.ttl_seconds
+            ):
+                self._entries.move_to_end(key)
+                return inventory
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._store(key, done))
+            self._in_flight[key] = task
+        return await asyncio.shield(task)
@@ -0,0 +1,92 @@
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from app.core.config import settings
+
+REPO_METADATA_FIELDS = """
+    nameWithOwner
+    stargazerCount
+    forkCount
+"""
+
+
+class RepoMetadata(NamedTuple):
+    name_with_owner: str
+    stars: int
+    forks: int
+    fetched_at: datetime
+
+
+def build_repo_metadata_query(count: int) -> str:
+    """Aliased `repository(owner:, name:)` lookups `r0..r{count-1}`."""
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{"
+        f"{REPO_METADATA_FIELDS}  }}"
+        for i in range(count)
+    )
+    return (
+        f"query ({params}) {{\n"
+        "  rateLimit {\n    cost\n    limit\n    remaining\n    resetAt\n  }\n"
+        f"{fields}\n}}\n"
+    )
+
+
+class RepoMetadataStore:
+    """
+    Star / fork counts per repository, keyed by `nameWithOwner`
+    (case-insensitive), refreshed once they are older than the TTL.
+    PR search results carry only the repo name and look the counts up
+    here, so each repo is fetched once per TTL instead of once per PR.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._entries: dict[str, RepoMetadata] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name_with_owner: str) -> RepoMetadata | None:
+        return self._entries.get(name_with_owner.lower())
+
+    def is_fresh(self, entry: RepoMetadata | None) -> bool:
+        return (
+            entry is not None
+            and datetime.now(timezone.utc) - entry.fetched_at < self.ttl
+        )
+
+    def stale(self, names: Iterable[str]) -> list[str]:
+        """Names that are missing or past their TTL, deduplicated."""
+        return [
+            name
+            for name in dict.fromkeys(names)
+            if not self.is_fresh(self.get(name))
+        ]
+
+    def put(self, entry: RepoMetadata) -> None:
+        with self._lock:
+            current = self._entries.get(entry.name_with_owner.lower())
+            if current is None or current.fetched_at <= entry.fetched_at:
+                self._entries[entry.name_with_owner.lower()] = entry
+
+    def put_many(self, entries: Iterable[RepoMetadata]) -> None:
+        for entry in entries:
+            self.put(entry)
+
+    def lookup(self, names: Iterable[str]) -> dict[str, RepoMetadata]:
+        return {
+            name: entry
+            for name in names
+            if (entry := self.get(name)) is not None
+        }
+
+
+_repo_metadata_store = RepoMetadataStore(settings.github_repo_metadata_ttl)
+
+
+def get_repo_metadata_store() -> RepoMetadataStore:
+    return _repo_metadata_store
@@ -0,0 +1,242 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Lower value runs first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "github_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def github_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run the GitHub calls made inside this block (and tasks spawned from
+    it) at the given priority, e.g. `Priority.BACKGROUND` for bulk syncs.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class _Budget:
+    """Rate-limit window for one (credential, resource) pair."""
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+        self.waiters: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self.wake_task: asyncio.Task[None] | None = None
+
+    def observe(self, limit: int, remaining: int, reset_at: float) -> None:
+        if reset_at > self.reset_at + 1:
+            # a fresh window: the server's number replaces ours
+            self.remaining = remaining
+        elif self.remaining is None or remaining < self.remaining:
+            # same window; responses can arrive out of order, keep the lowest
+            self.remaining = remaining
+        self.limit = limit
+        self.reset_at = max(self.reset_at, reset_at)
+
+    def roll_window(self) -> None:
+        """Assume a full budget once the reset time has passed."""
+        if self.limit is not None and time.time() >= self.reset_at:
+            self.remaining = self.limit
+            # GitHub windows are one hour; headers will correct this
+            self.reset_at = time.time() + 3600
+
+    def debit(self, cost: float) -> None:
+        if self.remaining is not None:
+            self.remaining -= max(1, round(cost))
+
+    def allows(self, priority: int, cost: float) -> bool:
+        if self.remaining is None or self.limit is None:
+            return True
+        self.roll_window()
+        floor = 0.0
+        if priority > Priority.INTERACTIVE:
+            floor = self.limit * settings.github_background_reserve
+        return self.remaining - cost >= floor
+
+
+class GitHubScheduler:
+    """
+    Admission control in front of every GitHub request.
+
+    Keeps a token budget per credential and resource ("core" for REST,
+    "graphql"), learns what each GraphQL query costs from the responses,
+    and releases queued requests interactive-first. Background requests
+    leave `github_background_reserve` of the budget for interactive ones
+    and wait for the window reset instead of running into a 403.
+    """
+
+    def __init__(self) -> None:
+        self._budgets: dict[tuple[str, str], _Budget] = {}
+        self._costs: dict[str, float] = {}
+        self._seq = itertools.count()
+
+    def _budget(self, scope: str, resource: str) -> _Budget:
+        key = (scope, resource)
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = self._budgets[key] = _Budget()
+        return budget
+
+    def remaining(self, scope: str, resource: str) -> int | None:
+        """Budget left for a credential, or None if not yet observed."""
+        budget = self._budgets.get((scope, resource))
+        if budget is None:
+            return None
+        budget.roll_window()
+        return budget.remaining
+
+    def estimated_cost(self, cost_key: str) -> float:
+        return self._costs.get(cost_key, 1.0)
+
+    async def run(
+        self,
+        scope: str,
+        resource: str,
+        cost_key: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        priority: Priority | None = None,
+    ) -> T:
+        """Wait for budget, then await `call()`."""
+        budget = self._budget(scope, resource)
+        cost = self.estimated_cost(cost_key)
+        prio = current_priority() if priority is None else priority
+
+        if budget.waiters or not budget.allows(prio, cost):
+            future: asyncio.Future[None] = (
+                asyncio.get_running_loop().create_future()
+            )
+            heapq.heappush(
+                budget.waiters, (prio, next(self._seq), cost, future)
+            )
+            self._pump(budget)
+            # _pump debits the budget when it releases this waiter
+            await future
+        else:
+            budget.debit(cost)
+        return await call()
+
+    def _pump(self, budget: _Budget) -> None:
+        """Release queued requests, highest priority first, while they fit."""
+        while budget.waiters:
+            prio, _, cost, future = budget.waiters[0]
+            if future.done():
+                heapq.heappop(budget.waiters)
+                continue
+            if not budget.allows(prio, cost):
+                break
+            heapq.heappop(budget.waiters)
+            budget.debit(cost)
+            future.set_result(None)
+
+        if budget.waiters and (
+            budget.wake_task is None or budget.wake_task.done()
+        ):
+            budget.wake_task = asyncio.ensure_future(self._wake(budget))
+
+    async def _wake(self, budget: _Budget) -> None:
+        await asyncio.sleep(max(0.0, budget.reset_at - time.time()) + 0.5)
+        budget.roll_window()
+        self._pump(budget)
+
+    def observe_headers(
+        self,
+        scope: str,
+        headers: Mapping[str, str],
+        *,
+        default_resource: str = "core",
+    ) -> None:
+        """Update the budget from `X-RateLimit-*` response headers."""
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset_at = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        resource = headers.get("x-ratelimit-resource", default_resource)
+        budget = self._budget(scope, resource)
+        budget.observe(limit, remaining, reset_at)
+        self._pump(budget)
+
+    def observe_graphql(
+        self,
+        scope: str,
+        cost_key: str,
+        rate_limit: Mapping[str, Any] | None,
+    ) -> None:
+        """Learn from a GraphQL `rateLimit { cost remaining resetAt limit }`."""
+        if not rate_limit:
+            return
+        cost = float(rate_limit.get("cost") or 1)
+        previous = self._costs.get(cost_key)
+        self._costs[cost_key] = (
+            cost if previous is None else 0.8 * previous + 0.2 * cost
+        )
+        if "remaining" in rate_limit and "resetAt" in rate_limit:
+            reset_at = datetime.fromisoformat(
+                str(rate_limit["resetAt"]).replace("Z", "+00:00")
+            ).timestamp()
+            budget = self._budget(scope, "graphql")
+            budget.observe(
+                int(rate_limit.get("limit") or budget.limit or 5000),
+                int(rate_limit["remaining"]),
+                reset_at,
+            )
+            self._pump(budget)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Queue depth, budget and learned costs, for monitoring."""
+        budgets = []
+        for (scope, resource), budget in self._budgets.items():
+            pending = [w for w in budget.waiters if not w[3].done()]
+            budgets.append({
+                "credential": scope,
+                "resource": resource,
+                "limit": budget.limit,
+                "remaining": budget.remaining,
+                "reset_at": budget.reset_at,
+                "queued_interactive": sum(
+                    1 for w in pending if w[0] == Priority.INTERACTIVE
+                ),
+                "queued_background": sum(
+                    1 for w in pending if w[0] == Priority.BACKGROUND
+                ),
+            })
+        return {"budgets": budgets, "query_costs": dict(self._costs)}
+
+
+_scheduler = GitHubScheduler()
+
+
+def get_scheduler() -> GitHubScheduler:
+    return _scheduler
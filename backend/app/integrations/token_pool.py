@@ -0,0 +1,152 @@
+import hashlib
+import os
+import threading
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.integrations.scheduler import GitHubScheduler, get_scheduler
+
+# Budget assumed for a credential the scheduler has not heard about yet
+# (GitHub's authenticated hourly limit for both REST and GraphQL).
+DEFAULT_BUDGET = 5000
+
+
+def credential_id(token: str) -> str:
+    """Stable, non-secret id for a token (cache and budget scoping)."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class Credential(NamedTuple):
+    token: str
+    id: str
+    owner: str | None
+
+
+class TokenPool:
+    """
+    Spreads GitHub requests over many tokens: service tokens plus users'
+    own OAuth tokens. Each pick goes to the credential with the most
+    remaining budget for the resource, except that requests for a user's
+    own data prefer that user's token while it has budget left.
+
+    GitHub answers with what the token's owner can see, so a user token
+    lent to someone else's fetch can surface that owner's private
+    repositories in another user's stats. Unless `share_user_tokens` is
+    set, a user token therefore only serves its owner's requests and
+    everything else goes through service tokens.
+    """
+
+    def __init__(
+        self,
+        tokens: list[str] | None = None,
+        scheduler: GitHubScheduler | None = None,
+        *,
+        share_user_tokens: bool = False,
+    ):
+        self.scheduler = scheduler or get_scheduler()
+        self.share_user_tokens = share_user_tokens
+        self._credentials: dict[str, Credential] = {}
+        self._by_owner: dict[str, str] = {}
+        self._in_flight: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for token in tokens or []:
+            self.add(token)
+
+    def __len__(self) -> int:
+        return len(self._credentials)
+
+    def add(self, token: str, *, owner: str | None = None) -> Credential:
+        """Add a token; a user's new token replaces their previous one."""
+        cred = Credential(token, credential_id(token), owner)
+        with self._lock:
+            if owner:
+                previous = self._by_owner.get(owner.lower())
+                if previous is not None and previous != cred.id:
+                    self._credentials.pop(previous, None)
+                self._by_owner[owner.lower()] = cred.id
+            self._credentials[cred.id] = cred
+        return cred
+
+    def remove(self, token: str) -> None:
+        cid = credential_id(token)
+        with self._lock:
+            cred = self._credentials.pop(cid, None)
+            if cred and cred.owner:
+                self._by_owner.pop(cred.owner.lower(), None)
+
+    def remove_owner(self, owner: str) -> None:
+        with self._lock:
+            cid = self._by_owner.pop(owner.lower(), None)
+            if cid is not None:
+                self._credentials.pop(cid, None)
+
+    def _usable(self, cred: Credential, owner: str | None) -> bool:
+        return (
+            cred.owner is None
+            or self.share_user_tokens
+            or (owner is not None and cred.owner.lower() == owner.lower())
+        )
+
+    def _headroom(self, cid: str, resource: str) -> int:
+        remaining = self.scheduler.remaining(cid, resource)
+        if remaining is None:
+            remaining = DEFAULT_BUDGET
+        return remaining - self._in_flight.get(cid, 0)
+
+    def pick(self, resource: str, *, owner: str | None = None) -> Credential:
+        with self._lock:
+            if not self._credentials:
+                raise ValueError("Token pool is empty.")
+            own = self._by_owner.get(owner.lower()) if owner else None
+            if own is not None and self._headroom(own, resource) > 0:
+                chosen = own
+            else:
+                usable = [
+                    cid for cid, cred in self._credentials.items()
+                    if self._usable(cred, owner)
+                ]
+                if not usable:
+                    raise ValueError(
+                        "No GitHub token in the pool may serve this request."
+                    )
+                chosen = max(
+                    usable,
+                    key=lambda cid: self._headroom(cid, resource),
+                )
+            self._in_flight[chosen] = self._in_flight.get(chosen, 0) + 1
+            return self._credentials[chosen]
+
+    def release(self, cred: Credential) -> None:
+        with self._lock:
+            count = self._in_flight.get(cred.id, 0) - 1
+            if count > 0:
+                self._in_flight[cred.id] = count
+            else:
+                self._in_flight.pop(cred.id, None)
+
+
+_token_pool: TokenPool | None = None
+
+
+def get_token_pool() -> TokenPool:
+    """
+    The process-wide pool, seeded with `settings.github_service_tokens`
+    and the Github_Token / GITHUB_TOKEN env vars. User tokens are loaded
+    at startup by `sync_service.load_user_credentials` and replaced when
+    a user logs in with a new token (see `user_service`).
+    """
+    global _token_pool
+    if _token_pool is None:
+        tokens = [
+            token.strip()
+            for token in settings.github_service_tokens.split(",")
+            if token.strip()
+        ]
+        for env_var in ("Github_Token", "GITHUB_TOKEN"):
+            if os.getenv(env_var):
+                tokens.append(os.environ[env_var])
+        _token_pool = TokenPool(
+            list(dict.fromkeys(tokens)),
+            share_user_tokens=settings.github_share_user_tokens,
+        )
+    return _token_pool
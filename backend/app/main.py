@@ -1,13 +1,56 @@
-from app.api.routes import auth, health, score, users
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.api.middleware import MetricsMiddleware
+from app.api.routes import auth, health, leaderboard, metrics, score, users
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.integrations.http import close_http_client
+from app.services import sync_service
+from app.services.job_queue import refresh_queue
+from app.services.readiness_service import readiness_probes
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+
+async def load_pool_credentials() -> None:
+    """Put stored user OAuth tokens into the GitHub token pool."""
+    try:
+        async with AsyncSessionLocal() as db:
+            await sync_service.load_user_credentials(db)
+    except (OSError, SQLAlchemyError):
+        # serve anyway (readiness reports the database); logins add tokens
+        logger.warning("Could not load user GitHub tokens", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # resolve the build id before serving, not on the first probe
+    health.get_build_id()
+    await load_pool_credentials()
+    readiness_probes.start()
+    yield
+    await readiness_probes.stop()
+    await refresh_queue.stop()
+    await close_http_client()
+
 
 app = FastAPI(
     title="DevStats",
     description="DevStats is a tool to track developer statistics",
     version="0.0.1",
+    lifespan=lifespan,
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
 app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(score.router)
+app.include_router(leaderboard.router)
@@ -1,3 +1,16 @@
+from .contribution import ContributionDay
 from .pull_request import PullRequest
+from .repository import Repository
+from .sync_state import UserSyncState
+from .user_score import UserScore
+from .weight_profile import ProfileScore, WeightProfile
 
-__all__ = ["PullRequest"]
+__all__ = [
+    "ContributionDay",
+    "ProfileScore",
+    "PullRequest",
+    "Repository",
+    "UserScore",
+    "UserSyncState",
+    "WeightProfile",
+]
@@ -0,0 +1,64 @@
+import uuid
+from datetime import date
+
+from app.db.base import Base
+from sqlalchemy import BigInteger, Date, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class ContributionDay(Base):
+    """
+    Per-user daily rollup of PR activity, bucketed by the day (UTC) each
+    PR was opened. Kept up to date as PRs are upserted.
+    """
+
+    __tablename__ = "contribution_days"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+
+    pr_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    lines_added: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    lines_removed: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    commits: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    merged_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    # sum of (merged_at - created_at) in days over merged PRs
+    merge_days: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
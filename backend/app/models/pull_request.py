@@ -0,0 +1,122 @@
+import uuid
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import (BigInteger, Boolean, DateTime, ForeignKey, Index,
+                        Integer, String, UniqueConstraint)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+
+class PullRequest(Base):
+    __tablename__ = "pull_requests"
+    __table_args__ = (
+        # natural key used by bulk upserts
+        UniqueConstraint(
+            "user_id",
+            "github_pr_id",
+            name="uq_pull_requests_user_id_github_pr_id",
+        ),
+        # time-window aggregates and listings per user
+        Index("ix_pull_requests_user_id_created_at", "user_id", "created_at"),
+        # users with PRs in a repo whose star / fork counts changed
+        Index("ix_pull_requests_repo_full_name", "repo_full_name"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    github_pr_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        index=True,
+    )
+
+    repo_full_name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+
+    repo_owner: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+
+    # PR opened on GitHub
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    closed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    merged_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # GitHub's `updatedAt`; drives incremental sync
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    additions: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    deletions: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    changed_files: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    commits: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    review_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    ci_passed: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+    )
+
+    score: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Relationships
+    user = relationship(
+        "User",
+        back_populates="pull_requests",
+    )
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Repository(Base):
+    """
+    Repository metadata shared by all PRs against it; `pull_requests`
+    refers to it through `repo_full_name` instead of copying the counts.
+    """
+
+    __tablename__ = "repositories"
+
+    name_with_owner: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+    )
+
+    stargazer_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    fork_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class UserSyncState(Base):
+    """Per-user high-water marks for incremental GitHub PR sync."""
+
+    __tablename__ = "user_sync_states"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # latest PR `updatedAt` seen so far; None until the first full sync
+    pr_updated_watermark: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    last_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class UserScore(Base):
+    """
+    Running sums over all of a user's stored PRs, kept up to date as PRs
+    are upserted, so reading a score is a single primary-key lookup.
+    """
+
+    __tablename__ = "user_scores"
+    __table_args__ = (
+        # leaderboard ordering
+        Index("ix_user_scores_final_score", "final_score"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    pr_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    # sum of pull_requests.score
+    score_sum: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    total_commits: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    total_merge_days: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+
+    # current repo stars / forks from `repositories`, counted once per PR
+    total_stars: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    total_forks: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    # scoring_service.aggregate_from_totals over the sums above
+    final_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
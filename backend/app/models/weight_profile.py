@@ -0,0 +1,110 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from app.db.base import Base
+from sqlalchemy import (DateTime, Float, ForeignKey, Integer, String,
+                        UniqueConstraint)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class WeightProfile(Base):
+    """
+    A named, versioned set of scoring weights. Versions are never edited;
+    changing weights means adding version N+1 and rescoring with it.
+    """
+
+    __tablename__ = "weight_profiles"
+    __table_args__ = (
+        UniqueConstraint(
+            "name",
+            "version",
+            name="uq_weight_profiles_name_version",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # scoring_service.REPO_LEVEL_KINDS
+    repo_level: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+    )
+
+    pr_weights: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+
+    repo_weights: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+
+    aggregate_weights: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class ProfileScore(Base):
+    """A user's score under one weight profile version."""
+
+    __tablename__ = "profile_scores"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    profile_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("weight_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    pr_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    avg_pr_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    repo_level_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    final_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
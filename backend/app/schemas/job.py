@@ -0,0 +1,17 @@
+import uuid
+from datetime import datetime
+
+from app.schemas.score import ScoreBreakdown
+from pydantic import BaseModel, ConfigDict
+
+
+class RefreshJobOut(BaseModel):
+    id: uuid.UUID
+    status: str
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    result: ScoreBreakdown | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,22 @@
+import uuid
+
+from pydantic import BaseModel
+
+
+class LeaderboardEntryOut(BaseModel):
+    rank: int
+    user_id: uuid.UUID
+    username: str
+    final_score: float
+
+
+class LeaderboardPage(BaseModel):
+    total_users: int
+    entries: list[LeaderboardEntryOut]
+
+
+class LeaderboardPositionOut(BaseModel):
+    rank: int
+    final_score: float
+    percentile: float
+    total_users: int
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PullRequestInfo(BaseModel):
@@ -37,6 +37,14 @@ class PullRequestInfo(BaseModel):
         ...,
         description="Whether the PR was merged"
     )
+    github_id: int | None = Field(
+        None,
+        description="GitHub database id of the PR"
+    )
+    updated_at: datetime | None = Field(
+        None,
+        description="PR last-updated timestamp"
+    )
 
 
 class PRParameters(BaseModel):
@@ -84,3 +92,24 @@ class PRParameters(BaseModel):
         ge=0,
         description="Fork count of the base repository"
     )
+
+
+class PullRequestOut(BaseModel):
+    """
+    A stored PR as returned by the API.
+    """
+
+    id: int
+    github_pr_id: int
+    repo_full_name: str
+    created_at: datetime | None = None
+    closed_at: datetime | None = None
+    merged_at: datetime | None = None
+    updated_at: datetime | None = None
+    additions: int
+    deletions: int
+    changed_files: int
+    commits: int
+    score: int
+
+    model_config = ConfigDict(from_attributes=True)
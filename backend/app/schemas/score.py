@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from app.schemas.pull_request import PullRequestOut
 from pydantic import BaseModel, Field
 
@@ -8,7 +10,43 @@ class ScoreRequest(BaseModel):
 
 
 class ScoreBreakdown(BaseModel):
-    total_score: int
-    pull_request_count: int
     window_days: int
+    pull_request_count: int
+    avg_pr_score: float
+    repo_level_score: float
+    final_score: float
+    # most recent PRs in the window, up to the request's `limit`
     pull_requests: list[PullRequestOut]
+
+
+class ScoreSnapshotOut(BaseModel):
+    pull_request_count: int
+    avg_pr_score: float
+    repo_level_score: float
+    final_score: float
+    updated_at: datetime | None = None
+
+
+class ConsistencyOut(BaseModel):
+    window_days: int
+    pull_request_count: int
+    lines_added: int
+    lines_removed: int
+    commits: int
+    avg_merge_days: float
+    active_days: int
+    active_weeks: int
+    current_streak: int
+    longest_streak: int
+    weekly_regularity: float
+    weekly_variation: float
+
+
+class ProfileScoreOut(BaseModel):
+    profile: str
+    version: int
+    pull_request_count: int
+    avg_pr_score: float
+    repo_level_score: float
+    final_score: float
+    computed_at: datetime
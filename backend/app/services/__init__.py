@@ -1,3 +1,15 @@
-from . import scoring_service
+from . import (contribution_service, leaderboard_service, pull_request_service,
+               rescore_service, scoring_service, sync_service,
+               user_score_service, user_service, weight_profile_service)
 
-__all__ = ["scoring_service"]
+__all__ = [
+    "contribution_service",
+    "leaderboard_service",
+    "pull_request_service",
+    "rescore_service",
+    "scoring_service",
+    "sync_service",
+    "user_score_service",
+    "user_service",
+    "weight_profile_service",
+]
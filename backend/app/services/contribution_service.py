@@ -0,0 +1,232 @@
+import statistics
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from app.models.contribution import ContributionDay
+from app.models.pull_request import PullRequest
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+BUCKET_COLUMNS = (
+    "pr_count",
+    "lines_added",
+    "lines_removed",
+    "commits",
+    "merged_count",
+    "merge_days",
+)
+
+
+def bucket_day(created_at: datetime) -> date:
+    return created_at.astimezone(timezone.utc).date()
+
+
+def week_start(day: date) -> date:
+    """Monday of the ISO week containing `day`."""
+    return day - timedelta(days=day.weekday())
+
+
+def _contribution(
+    created_at: datetime | None,
+    merged_at: datetime | None,
+    additions: int,
+    deletions: int,
+    commits: int,
+) -> tuple[date, tuple[float, ...]] | None:
+    """A PR's bucket day and what it adds there, in BUCKET_COLUMNS order."""
+    if created_at is None:
+        return None
+    merge_days = 0.0
+    if merged_at is not None:
+        merge_days = (merged_at - created_at).total_seconds() / 86400.0
+    return bucket_day(created_at), (
+        1,
+        additions,
+        deletions,
+        commits,
+        1 if merged_at is not None else 0,
+        merge_days,
+    )
+
+
+def bucket_deltas(
+    previous: Mapping[int, Any],
+    rows: Iterable[Mapping[str, Any]],
+) -> dict[date, list[float]]:
+    """
+    Per-day change to a user's buckets from upserting `rows`, given the
+    stored versions of those PRs (`previous`, keyed by github_pr_id).
+    Rows whose `updated_at` is unchanged are skipped, as in the upsert.
+    """
+    deltas: dict[date, list[float]] = defaultdict(
+        lambda: [0] * len(BUCKET_COLUMNS)
+    )
+    for row in rows:
+        old = previous.get(row["github_pr_id"])
+        if old is not None and old.updated_at == row["updated_at"]:
+            continue
+        changes = [(1, _contribution(
+            row["created_at"], row["merged_at"],
+            row["additions"], row["deletions"], row["commits"],
+        ))]
+        if old is not None:
+            changes.append((-1, _contribution(
+                old.created_at, old.merged_at,
+                old.additions, old.deletions, old.commits,
+            )))
+        for sign, contribution in changes:
+            if contribution is None:
+                continue
+            day, values = contribution
+            bucket = deltas[day]
+            for i, value in enumerate(values):
+                bucket[i] += sign * value
+    return {day: values for day, values in deltas.items() if any(values)}
+
+
+async def apply_bucket_deltas(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    deltas: Mapping[date, list[float]],
+) -> None:
+    """Add per-day deltas to the user's buckets (caller commits)."""
+    if not deltas:
+        return
+    stmt = insert(ContributionDay).values([
+        {"user_id": user_id, "day": day, **dict(zip(BUCKET_COLUMNS, values))}
+        for day, values in sorted(deltas.items())
+    ])
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ContributionDay.user_id, ContributionDay.day],
+            set_={
+                col: getattr(ContributionDay, col) + stmt.excluded[col]
+                for col in BUCKET_COLUMNS
+            },
+        )
+    )
+
+
+async def rebuild(db: AsyncSession, *, user_id: uuid.UUID) -> None:
+    """Recompute the user's buckets from `pull_requests` (caller commits)."""
+    day = func.date(func.timezone("UTC", PullRequest.created_at))
+    await db.execute(
+        delete(ContributionDay).where(ContributionDay.user_id == user_id)
+    )
+    await db.execute(
+        insert(ContributionDay).from_select(
+            ["user_id", "day", *BUCKET_COLUMNS],
+            select(
+                literal(user_id),
+                day,
+                func.count(),
+                func.sum(PullRequest.additions),
+                func.sum(PullRequest.deletions),
+                func.sum(PullRequest.commits),
+                func.count(PullRequest.merged_at),
+                func.coalesce(func.sum(
+                    func.extract(
+                        "epoch",
+                        PullRequest.merged_at - PullRequest.created_at,
+                    ) / 86400.0
+                ), 0.0),
+            )
+            .where(
+                PullRequest.user_id == user_id,
+                PullRequest.created_at.is_not(None),
+            )
+            .group_by(day),
+        )
+    )
+
+
+async def list_days(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    since: date,
+) -> list[ContributionDay]:
+    return list(await db.scalars(
+        select(ContributionDay)
+        .where(
+            ContributionDay.user_id == user_id,
+            ContributionDay.day >= since,
+        )
+        .order_by(ContributionDay.day)
+    ))
+
+
+def consistency_metrics(
+    buckets: Iterable[ContributionDay],
+    *,
+    end: date,
+    days: int,
+) -> dict[str, float]:
+    """
+    Streak and regularity metrics for the `days` days ending at `end`,
+    from daily buckets (ascending by day). Work is linear in the number of
+    buckets and weeks, never in the number of PRs.
+
+    - current_streak: consecutive active days up to `end` (or the day
+      before, so a streak is not broken until a day passes without a PR)
+    - longest_streak: longest run of consecutive active days
+    - weekly_regularity: share of weeks with at least one PR
+    - weekly_variation: coefficient of variation of PRs per week
+      (0 = perfectly even)
+    """
+    start = end - timedelta(days=days - 1)
+    totals = dict.fromkeys(BUCKET_COLUMNS, 0)
+    active: list[date] = []
+    per_week: dict[date, int] = defaultdict(int)
+    for bucket in buckets:
+        if not start <= bucket.day <= end or bucket.pr_count <= 0:
+            continue
+        active.append(bucket.day)
+        per_week[week_start(bucket.day)] += bucket.pr_count
+        for col in BUCKET_COLUMNS:
+            totals[col] += getattr(bucket, col)
+
+    longest = run = 0
+    previous: date | None = None
+    for day in active:
+        run = run + 1 if previous == day - timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+
+    current = 0
+    active_set = set(active)
+    cursor = end if end in active_set else end - timedelta(days=1)
+    while cursor in active_set:
+        current += 1
+        cursor -= timedelta(days=1)
+
+    weeks = (week_start(end) - week_start(start)).days // 7 + 1
+    weekly_counts = [
+        per_week.get(week_start(start) + timedelta(weeks=i), 0)
+        for i in range(weeks)
+    ]
+    mean = statistics.fmean(weekly_counts)
+    variation = statistics.pstdev(weekly_counts) / mean if mean else 0.0
+
+    return {
+        "pull_request_count": totals["pr_count"],
+        "lines_added": totals["lines_added"],
+        "lines_removed": totals["lines_removed"],
+        "commits": totals["commits"],
+        "avg_merge_days": round(
+            totals["merge_days"] / totals["merged_count"], 2
+        ) if totals["merged_count"] else 0.0,
+        "active_days": len(active),
+        "active_weeks": sum(1 for count in weekly_counts if count),
+        "current_streak": current,
+        "longest_streak": longest,
+        "weekly_regularity": round(
+            sum(1 for count in weekly_counts if count) / weeks, 4
+        ),
+        "weekly_variation": round(variation, 4),
+    }
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from app.core.config import settings
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job:
+    """One unit of background work and its outcome."""
+
+    def __init__(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        *,
+        owner_id: Any = None,
+    ):
+        self.id = uuid.uuid4()
+        self.key = key
+        self.owner_id = owner_id
+        self.status = JobStatus.QUEUED
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.result: Any = None
+        self.error: str | None = None
+        self._run = run
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    async def wait(self) -> "Job":
+        await self._done.wait()
+        return self
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the job queue is at capacity."""
+
+
+class JobQueue:
+    """
+    In-process asyncio job queue with a bounded worker pool.
+
+    Jobs are single-flight by key: submitting a key that already has a
+    queued or running job returns that job instead of starting another.
+    Finished jobs stay pollable for `retention_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_queued: int,
+        retention_seconds: float,
+    ):
+        self.workers = workers
+        self.retention_seconds = retention_seconds
+        self._queue: asyncio.Queue[Job] | None = None
+        self._max_queued = max_queued
+        self._tasks: list[asyncio.Task[None]] = []
+        self._jobs: dict[uuid.UUID, Job] = {}
+        self._in_flight: dict[str, Job] = {}
+        self._finished_at: dict[uuid.UUID, float] = {}
+
+    def _ensure_started(self) -> asyncio.Queue[Job]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queued)
+            self._tasks = [
+                asyncio.ensure_future(self._worker())
+                for _ in range(self.workers)
+            ]
+        return self._queue
+
+    def submit(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        *,
+        owner_id: Any = None,
+    ) -> Job:
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            return existing
+
+        queue = self._ensure_started()
+        self._expire()
+        job = Job(key, run, owner_id=owner_id)
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull as exc:
+            raise QueueFullError("Job queue is full.") from exc
+        self._jobs[job.id] = job
+        self._in_flight[key] = job
+        return job
+
+    def get(self, job_id: uuid.UUID) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "in_flight": len(self._in_flight),
+            "retained": len(self._jobs),
+        }
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        for job_id, finished in list(self._finished_at.items()):
+            if finished < cutoff:
+                del self._finished_at[job_id]
+                self._jobs.pop(job_id, None)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            try:
+                job.result = await job._run()
+                job.status = JobStatus.SUCCEEDED
+            except Exception as exc:
+                job.error = str(exc) or type(exc).__name__
+                job.status = JobStatus.FAILED
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                self._finished_at[job.id] = time.monotonic()
+                if self._in_flight.get(job.key) is job:
+                    del self._in_flight[job.key]
+                job._done.set()
+                queue.task_done()
+
+
+refresh_queue = JobQueue(
+    workers=settings.refresh_workers,
+    max_queued=settings.refresh_max_queued,
+    retention_seconds=settings.refresh_job_retention,
+)
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.models.user import User
+from app.models.user_score import UserScore
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# sorts after any user id string, for bisecting past a whole score group
+_MAX_ID = "\U0010ffff"
+
+
+class LeaderboardEntry(NamedTuple):
+    rank: int
+    user_id: uuid.UUID
+    username: str
+    final_score: float
+
+
+class LeaderboardPosition(NamedTuple):
+    entry: LeaderboardEntry
+    # share of other users with a strictly lower score, 0-100
+    percentile: float
+    total_users: int
+
+
+class Leaderboard:
+    """
+    All users ordered by `final_score`, kept in a sorted list of
+    (-score, user id) keys. Rank lookups are binary searches and a score
+    change is one removal plus one insertion. Tied users share a rank
+    (1, 2, 2, 4, ...). Updates made between `begin_reload` and `load`
+    are kept over the loaded rows, which may predate them.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[float, str]] = []
+        self._scores: dict[str, float] = {}
+        self._names: dict[str, str] = {}
+        # (username, score), or None when removed, per user id changed
+        # since begin_reload; None when no reload is in progress
+        self._pending: dict[str, tuple[str, float] | None] | None = None
+        self._lock = threading.Lock()
+        self.loaded_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def is_stale(self, max_age: float) -> bool:
+        return (
+            self.loaded_at is None
+            or time.monotonic() - self.loaded_at > max_age
+        )
+
+    def begin_reload(self) -> None:
+        """Start recording updates for the next `load` to reapply."""
+        with self._lock:
+            self._pending = {}
+
+    def load(self, rows: Iterable[tuple[uuid.UUID, str, float]]) -> None:
+        """
+        Replace the contents with (user_id, username, final_score) rows,
+        then reapply updates made since `begin_reload`.
+        """
+        scores: dict[str, float] = {}
+        names: dict[str, str] = {}
+        for user_id, username, score in rows:
+            scores[str(user_id)] = score
+            names[str(user_id)] = username
+        keys = sorted((-score, uid) for uid, score in scores.items())
+        with self._lock:
+            for uid, change in (self._pending or {}).items():
+                old = scores.pop(uid, None)
+                names.pop(uid, None)
+                if old is not None:
+                    del keys[bisect_left(keys, (-old, uid))]
+                if change is not None:
+                    names[uid], scores[uid] = change
+                    insort(keys, (-scores[uid], uid))
+            self._keys, self._scores, self._names = keys, scores, names
+            self._pending = None
+            self.loaded_at = time.monotonic()
+
+    def update(self, user_id: uuid.UUID, username: str, score: float) -> None:
+        uid = str(user_id)
+        with self._lock:
+            if self._pending is not None:
+                self._pending[uid] = (username, score)
+            self._names[uid] = username
+            old = self._scores.get(uid)
+            if old == score:
+                return
+            if old is not None:
+                del self._keys[bisect_left(self._keys, (-old, uid))]
+            insort(self._keys, (-score, uid))
+            self._scores[uid] = score
+
+    def remove(self, user_id: uuid.UUID) -> None:
+        uid = str(user_id)
+        with self._lock:
+            if self._pending is not None:
+                self._pending[uid] = None
+            old = self._scores.pop(uid, None)
+            self._names.pop(uid, None)
+            if old is not None:
+                del self._keys[bisect_left(self._keys, (-old, uid))]
+
+    def _rank(self, score: float) -> int:
+        return bisect_left(self._keys, (-score,)) + 1
+
+    def _entry(self, key: tuple[float, str]) -> LeaderboardEntry:
+        neg_score, uid = key
+        return LeaderboardEntry(
+            rank=self._rank(-neg_score),
+            user_id=uuid.UUID(uid),
+            username=self._names.get(uid, ""),
+            final_score=-neg_score,
+        )
+
+    def top(self, k: int, *, offset: int = 0) -> list[LeaderboardEntry]:
+        with self._lock:
+            return [self._entry(key) for key in self._keys[offset:offset + k]]
+
+    def position(self, user_id: uuid.UUID) -> LeaderboardPosition | None:
+        uid = str(user_id)
+        with self._lock:
+            score = self._scores.get(uid)
+            if score is None:
+                return None
+            total = len(self._keys)
+            below = total - bisect_right(self._keys, (-score, _MAX_ID))
+            return LeaderboardPosition(
+                entry=self._entry((-score, uid)),
+                percentile=(
+                    round(100.0 * below / (total - 1), 2) if total > 1
+                    else 100.0
+                ),
+                total_users=total,
+            )
+
+    def neighbors(
+        self,
+        user_id: uuid.UUID,
+        radius: int,
+    ) -> list[LeaderboardEntry]:
+        """Up to `radius` users on each side of the user, plus the user."""
+        uid = str(user_id)
+        with self._lock:
+            score = self._scores.get(uid)
+            if score is None:
+                return []
+            index = bisect_left(self._keys, (-score, uid))
+            start = max(0, index - radius)
+            return [
+                self._entry(key)
+                for key in self._keys[start:index + radius + 1]
+            ]
+
+
+leaderboard = Leaderboard()
+_reload_lock = asyncio.Lock()
+
+
+async def reload(db: AsyncSession, *, board: Leaderboard | None = None) -> int:
+    """
+    Rebuild the leaderboard from `user_scores`; returns its size. Scores
+    updated in memory while the query runs (e.g. by a sync committing
+    meanwhile) are kept rather than overwritten by the older rows.
+    """
+    if board is None:
+        board = leaderboard
+    board.begin_reload()
+    rows = await db.execute(
+        select(UserScore.user_id, User.username, UserScore.final_score)
+        .join(User, User.id == UserScore.user_id)
+        .order_by(UserScore.final_score.desc())
+    )
+    board.load(rows.tuples())
+    return len(board)
+
+
+async def ensure_loaded(db: AsyncSession) -> Leaderboard:
+    """
+    Return the leaderboard, reloading it once it is older than
+    `settings.leaderboard_reload_interval` so scores written by other
+    processes show up. Only the first load makes callers wait; later
+    reloads serve the current contents to everyone else meanwhile.
+    """
+    interval = settings.leaderboard_reload_interval
+    if not leaderboard.is_stale(interval):
+        return leaderboard
+    if _reload_lock.locked() and leaderboard.loaded_at is not None:
+        return leaderboard
+    async with _reload_lock:
+        if leaderboard.is_stale(interval):
+            await reload(db)
+    return leaderboard
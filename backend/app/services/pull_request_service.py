@@ -0,0 +1,251 @@
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from app.core.config import settings
+from app.models.pull_request import PullRequest
+from app.models.repository import Repository
+from app.services import contribution_service, user_score_service
+from sqlalchemy import (BigInteger, any_, bindparam, func, literal_column,
+                        select, text)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns written from GitHub data; everything else keeps its stored value.
+SYNCED_COLUMNS = (
+    "repo_full_name",
+    "repo_owner",
+    "created_at",
+    "closed_at",
+    "merged_at",
+    "updated_at",
+    "additions",
+    "deletions",
+    "changed_files",
+    "commits",
+    "score",
+)
+
+_INSERT_COLUMNS = (
+    "user_id",
+    "github_pr_id",
+    *SYNCED_COLUMNS,
+    "review_count",
+    "ci_passed",
+)
+
+# asyncpg caps a statement at 32767 bind parameters
+_MAX_ROWS_PER_STATEMENT = 32767 // len(_INSERT_COLUMNS)
+
+
+def _prepare_rows(
+    user_id: uuid.UUID,
+    rows: Iterable[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    # one statement cannot touch the same conflict target twice,
+    # so the last row for each PR wins
+    by_pr: dict[int, dict[str, Any]] = {}
+    for row in rows:
+        if row.get("github_pr_id") is None:
+            continue
+        by_pr[row["github_pr_id"]] = {
+            "review_count": 0,
+            "ci_passed": False,
+            **row,
+            "user_id": user_id,
+        }
+    return list(by_pr.values())
+
+
+def _count(flags: Iterable[bool], total: int) -> dict[str, int]:
+    inserted = updated = 0
+    for was_insert in flags:
+        if was_insert:
+            inserted += 1
+        else:
+            updated += 1
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": total - inserted - updated,
+    }
+
+
+async def _stored_rows(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    rows: list[dict[str, Any]],
+) -> dict[int, Any]:
+    result = await db.execute(
+        select(
+            PullRequest.github_pr_id,
+            PullRequest.repo_full_name,
+            PullRequest.updated_at,
+            PullRequest.created_at,
+            PullRequest.closed_at,
+            PullRequest.merged_at,
+            PullRequest.additions,
+            PullRequest.deletions,
+            PullRequest.commits,
+            PullRequest.score,
+        ).where(
+            PullRequest.user_id == user_id,
+            # one array parameter, however large the batch (an IN list
+            # would need a bind parameter per id)
+            PullRequest.github_pr_id == any_(bindparam(
+                "github_pr_ids",
+                [row["github_pr_id"] for row in rows],
+                type_=ARRAY(BigInteger),
+            )),
+        )
+    )
+    return {row.github_pr_id: row for row in result}
+
+
+async def _upsert_values(
+    db: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> list[bool]:
+    stmt = insert(PullRequest).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_pull_requests_user_id_github_pr_id",
+        set_={col: stmt.excluded[col] for col in SYNCED_COLUMNS},
+        # rows GitHub has not touched since the last sync stay as they are
+        where=PullRequest.updated_at.is_distinct_from(
+            stmt.excluded.updated_at
+        ),
+    ).returning(literal_column("xmax = 0").label("inserted"))
+    return list(await db.scalars(stmt))
+
+
+async def _upsert_copy(
+    db: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> list[bool]:
+    """COPY rows into a temp staging table, then upsert from it."""
+    columns = ", ".join(_INSERT_COLUMNS)
+    await db.execute(text(
+        "CREATE TEMP TABLE pull_requests_staging ON COMMIT DROP AS "
+        f"SELECT {columns} FROM pull_requests WITH NO DATA"
+    ))
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "pull_requests_staging",
+        records=[tuple(row[col] for col in _INSERT_COLUMNS) for row in rows],
+        columns=list(_INSERT_COLUMNS),
+    )
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in SYNCED_COLUMNS)
+    result = await db.execute(text(
+        f"INSERT INTO pull_requests ({columns}) "
+        f"SELECT {columns} FROM pull_requests_staging "
+        "ON CONFLICT ON CONSTRAINT uq_pull_requests_user_id_github_pr_id "
+        f"DO UPDATE SET {updates} "
+        "WHERE pull_requests.updated_at IS DISTINCT FROM EXCLUDED.updated_at "
+        "RETURNING xmax = 0"
+    ))
+    flags = list(result.scalars())
+    await db.execute(text("DROP TABLE pull_requests_staging"))
+    return flags
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    rows: Iterable[dict[str, Any]],
+) -> dict[str, int]:
+    """
+    Write a batch of PR rows (see `sync_service.pr_row_values`) for one
+    user with INSERT ... ON CONFLICT DO UPDATE on (user_id, github_pr_id).
+    Batches of `settings.pr_bulk_copy_threshold` rows or more are COPYed
+    into a staging table first. The user's `user_scores` snapshot and
+    daily contribution buckets are updated in the same transaction; new
+    and re-pointed PRs add their repo's current stars / forks from
+    `repositories`, so save the batch's repo metadata (and apply its
+    changes) first. The caller commits.
+
+    Returns { 'inserted', 'updated', 'unchanged' }.
+    """
+    prepared = _prepare_rows(user_id, rows)
+    if not prepared:
+        return {"inserted": 0, "updated": 0, "unchanged": 0}
+
+    snapshot = await user_score_service.lock_snapshot(db, user_id=user_id)
+    previous = await _stored_rows(db, user_id, prepared)
+
+    if len(prepared) >= settings.pr_bulk_copy_threshold:
+        flags = await _upsert_copy(db, prepared)
+    else:
+        flags = []
+        for i in range(0, len(prepared), _MAX_ROWS_PER_STATEMENT):
+            flags.extend(await _upsert_values(
+                db, prepared[i:i + _MAX_ROWS_PER_STATEMENT]
+            ))
+    repo_counts = await user_score_service.get_repo_counts(db, {
+        *(row["repo_full_name"] for row in prepared),
+        *(row.repo_full_name for row in previous.values()),
+    })
+    user_score_service.apply_delta(
+        snapshot,
+        user_score_service.upsert_delta(previous, prepared, repo_counts),
+    )
+    await contribution_service.apply_bucket_deltas(
+        db,
+        user_id=user_id,
+        deltas=contribution_service.bucket_deltas(previous, prepared),
+    )
+    return _count(flags, len(prepared))
+
+
+async def window_aggregate(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    since: datetime,
+) -> dict[str, float]:
+    """
+    Sums `scoring_service.aggregate_from_totals` needs, computed in
+    Postgres over PRs created since `since`. Uses the
+    (user_id, created_at) index and returns a single row; repo stars /
+    forks come from `repositories` and count once per PR, as in
+    aggregate_from_prs.
+    """
+    merge_days = func.coalesce(
+        func.extract("epoch", PullRequest.closed_at - PullRequest.created_at)
+        / 86400.0,
+        0.0,
+    )
+    row = (await db.execute(
+        select(
+            func.count().label("pr_count"),
+            func.coalesce(func.avg(PullRequest.score), 0.0)
+            .label("avg_pr_score"),
+            func.coalesce(func.sum(PullRequest.commits), 0)
+            .label("total_commits"),
+            func.coalesce(func.sum(merge_days), 0.0)
+            .label("total_merge_days"),
+            func.coalesce(func.sum(Repository.stargazer_count), 0)
+            .label("total_stars"),
+            func.coalesce(func.sum(Repository.fork_count), 0)
+            .label("total_forks"),
+        )
+        .select_from(PullRequest)
+        .outerjoin(
+            Repository,
+            Repository.name_with_owner == PullRequest.repo_full_name,
+        )
+        .where(
+            PullRequest.user_id == user_id,
+            PullRequest.created_at >= since,
+        )
+    )).one()
+    return {
+        "pr_count": int(row.pr_count),
+        "avg_pr_score": float(row.avg_pr_score),
+        "total_commits": int(row.total_commits),
+        "total_merge_days": float(row.total_merge_days),
+        "total_stars": int(row.total_stars),
+        "total_forks": int(row.total_forks),
+    }
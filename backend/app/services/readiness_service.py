@@ -0,0 +1,128 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from app.core.config import settings
+from app.integrations.scheduler import get_scheduler
+from sqlalchemy import text
+
+Probe = Callable[[], Awaitable[dict[str, Any]]]
+
+
+class ProbeResult(NamedTuple):
+    ok: bool
+    checked_at: float
+    latency_ms: float
+    detail: dict[str, Any]
+
+
+class ReadinessProbes:
+    """
+    Runs dependency probes on a background loop and keeps the latest
+    result of each, so a readiness check only reads memory. A probe
+    passes unless it raises or times out; a result older than the
+    allowed staleness counts as failing.
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, Probe],
+        *,
+        interval: float,
+        timeout: float,
+    ):
+        self.probes = probes
+        self.interval = interval
+        self.timeout = timeout
+        self.results: dict[str, ProbeResult] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the probe loop on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self, name: str, probe: Probe) -> None:
+        started = time.monotonic()
+        try:
+            detail = await asyncio.wait_for(probe(), self.timeout)
+            ok = True
+        except Exception as exc:
+            detail = {"error": str(exc) or type(exc).__name__}
+            ok = False
+        finished = time.monotonic()
+        self.results[name] = ProbeResult(
+            ok, finished, round((finished - started) * 1000, 2), detail
+        )
+
+    async def run_once(self) -> None:
+        await asyncio.gather(*(
+            self._run(name, probe) for name, probe in self.probes.items()
+        ))
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    def report(self, max_staleness: float) -> tuple[bool, dict[str, Any]]:
+        now = time.monotonic()
+        checks: dict[str, Any] = {}
+        ready = True
+        for name in self.probes:
+            result = self.results.get(name)
+            if result is None:
+                checks[name] = {"ok": False, "detail": "not probed yet"}
+                ready = False
+                continue
+            age = now - result.checked_at
+            ok = result.ok and age <= max_staleness
+            ready = ready and ok
+            checks[name] = {
+                "ok": ok,
+                "age_seconds": round(age, 2),
+                "latency_ms": result.latency_ms,
+                "detail": result.detail,
+            }
+        return ready, checks
+
+
+async def probe_database() -> dict[str, Any]:
+    # imported here so importing this module does not create an engine
+    from app.db.session import engine
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {"pool": engine.pool.status()}
+
+
+async def probe_github() -> dict[str, Any]:
+    """Fails only when every known GitHub budget is exhausted."""
+    budgets = get_scheduler().snapshot()["budgets"]
+    now = time.time()
+    remaining = [
+        # a window that has already reset has its full budget again
+        b["remaining"] if b["reset_at"] > now else b["limit"]
+        for b in budgets
+        if b["remaining"] is not None
+    ]
+    if remaining and max(remaining) <= 0:
+        raise RuntimeError("All GitHub rate-limit budgets are exhausted.")
+    return {
+        "credentials": len({b["credential"] for b in budgets}),
+        "max_remaining": max(remaining) if remaining else None,
+    }
+
+
+readiness_probes = ReadinessProbes(
+    {"database": probe_database, "github": probe_github},
+    interval=settings.health_probe_interval,
+    timeout=settings.health_probe_timeout,
+)
@@ -0,0 +1,248 @@
+import argparse
+import asyncio
+import uuid
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from app.core.config import settings
+from app.models.pull_request import PullRequest
+from app.models.repository import Repository
+from app.models.weight_profile import ProfileScore, WeightProfile
+from app.services import weight_profile_service
+from app.services.scoring_service import AggregateState, scoring_service
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+ProfileResult = tuple[uuid.UUID, WeightProfile, dict[str, float]]
+
+_SAVED_COLUMNS = (
+    "user_id",
+    "profile_id",
+    "pr_count",
+    "avg_pr_score",
+    "repo_level_score",
+    "final_score",
+    "computed_at",
+)
+
+# asyncpg caps a statement at 32767 bind parameters
+_MAX_ROWS_PER_STATEMENT = 32767 // len(_SAVED_COLUMNS)
+
+
+def _rows_query() -> Select:
+    """Every stored PR with the inputs scoring needs, grouped by user."""
+    return (
+        select(
+            PullRequest.user_id,
+            PullRequest.additions,
+            PullRequest.deletions,
+            PullRequest.changed_files,
+            PullRequest.commits,
+            func.coalesce(
+                func.extract(
+                    "epoch", PullRequest.closed_at - PullRequest.created_at
+                ) / 86400.0,
+                0.0,
+            ).label("merge_time_days"),
+            func.coalesce(Repository.stargazer_count, 0).label("repo_stars"),
+            func.coalesce(Repository.fork_count, 0).label("repo_forks"),
+        )
+        .outerjoin(
+            Repository,
+            Repository.name_with_owner == PullRequest.repo_full_name,
+        )
+        .order_by(PullRequest.user_id)
+    )
+
+
+class RescoreAccumulator:
+    """
+    Folds chunks of PR rows, ordered by user, into one AggregateState per
+    user and profile. PR scores are computed a chunk at a time with
+    compute_pr_scores_batch; a user split across chunks is merged.
+    """
+
+    def __init__(self, profiles: Sequence[WeightProfile]):
+        self.profiles = list(profiles)
+        self._user: uuid.UUID | None = None
+        self._states: dict[int, AggregateState] = {}
+
+    def _emit(self) -> list[ProfileResult]:
+        if self._user is None:
+            return []
+        return [
+            (
+                self._user,
+                profile,
+                {
+                    "pr_count": self._states[profile.id].pr_count,
+                    **self._states[profile.id].finalize(
+                        profile.aggregate_weights,
+                        repo_weights=profile.repo_weights,
+                        repo_level=profile.repo_level,
+                    ),
+                },
+            )
+            for profile in self.profiles
+        ]
+
+    def feed(self, rows: Sequence[Any]) -> list[ProfileResult]:
+        """Add a chunk; returns results for users known to be complete."""
+        if not rows:
+            return []
+        users = [row.user_id for row in rows]
+        starts = [0] + [
+            i for i in range(1, len(users)) if users[i] != users[i - 1]
+        ]
+        counts = np.diff(starts + [len(users)])
+
+        def column(name: str) -> np.ndarray:
+            return np.array([getattr(row, name) for row in rows],
+                            dtype=np.float64)
+
+        cols = {
+            name: column(name)
+            for name in ("additions", "deletions", "changed_files",
+                         "commits", "merge_time_days", "repo_stars",
+                         "repo_forks")
+        }
+        sums = {
+            name: np.add.reduceat(cols[name], starts)
+            for name in ("commits", "merge_time_days", "repo_stars",
+                         "repo_forks")
+        }
+        score_sums = {
+            profile.id: np.add.reduceat(
+                scoring_service.compute_pr_scores_batch(
+                    cols["additions"],
+                    cols["deletions"],
+                    cols["changed_files"],
+                    cols["commits"],
+                    cols["merge_time_days"],
+                    weights=profile.pr_weights,
+                ),
+                starts,
+            )
+            for profile in self.profiles
+        }
+
+        results: list[ProfileResult] = []
+        for g, start in enumerate(starts):
+            states = {
+                profile.id: AggregateState.from_totals(
+                    per_pr_weights=profile.pr_weights,
+                    pr_count=int(counts[g]),
+                    score_sum=float(score_sums[profile.id][g]),
+                    total_commits=int(sums["commits"][g]),
+                    total_merge_days=float(sums["merge_time_days"][g]),
+                    total_stars=int(sums["repo_stars"][g]),
+                    total_forks=int(sums["repo_forks"][g]),
+                )
+                for profile in self.profiles
+            }
+            if users[start] == self._user:
+                for profile_id, state in states.items():
+                    self._states[profile_id].merge(state)
+            else:
+                results.extend(self._emit())
+                self._user, self._states = users[start], states
+        return results
+
+    def finish(self) -> list[ProfileResult]:
+        results = self._emit()
+        self._user, self._states = None, {}
+        return results
+
+
+async def _save(db: AsyncSession, results: list[ProfileResult]) -> None:
+    if not results:
+        return
+    computed_at = datetime.now(timezone.utc)
+    rows = [
+        {
+            "user_id": user_id,
+            "profile_id": profile.id,
+            **score,
+            "computed_at": computed_at,
+        }
+        for user_id, profile, score in results
+    ]
+    for i in range(0, len(rows), _MAX_ROWS_PER_STATEMENT):
+        stmt = insert(ProfileScore).values(
+            rows[i:i + _MAX_ROWS_PER_STATEMENT]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ProfileScore.user_id, ProfileScore.profile_id],
+                set_={col: stmt.excluded[col] for col in _SAVED_COLUMNS[2:]},
+            )
+        )
+    await db.commit()
+
+
+async def rescore(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    profiles: Sequence[WeightProfile],
+    chunk_size: int | None = None,
+) -> dict[str, int]:
+    """
+    Score every user's stored PRs under each profile and upsert the
+    results into `profile_scores`, one commit per chunk. PR rows are
+    streamed through a server-side cursor, so memory stays at one chunk
+    and nothing is fetched from GitHub.
+
+    Returns { "pull_requests", "users" }.
+    """
+    chunk_size = chunk_size or settings.rescore_chunk_size
+    accumulator = RescoreAccumulator(profiles)
+    counts = {"pull_requests": 0, "users": 0}
+
+    async def save(results: list[ProfileResult]) -> None:
+        counts["users"] += len(results) // max(len(profiles), 1)
+        await _save(writer, results)
+
+    async with session_factory() as reader, session_factory() as writer:
+        result = await reader.stream(
+            _rows_query().execution_options(yield_per=chunk_size)
+        )
+        async for chunk in result.partitions():
+            counts["pull_requests"] += len(chunk)
+            await save(accumulator.feed(chunk))
+        await save(accumulator.finish())
+    return counts
+
+
+async def _main(names: list[str] | None, chunk_size: int | None) -> None:
+    # imported here so importing this module does not create an engine
+    from app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        profiles = await weight_profile_service.get_latest(db, names=names)
+    if not profiles:
+        raise SystemExit("No matching weight profiles.")
+    counts = await rescore(
+        AsyncSessionLocal, profiles=profiles, chunk_size=chunk_size
+    )
+    print(
+        f"Rescored {counts['users']} users / {counts['pull_requests']} PRs "
+        "with "
+        + ", ".join(f"{p.name} v{p.version}" for p in profiles)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rescore stored PRs under weight profiles."
+    )
+    parser.add_argument(
+        "profiles",
+        nargs="*",
+        help="profile names (default: latest version of every profile)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(_main(args.profiles or None, args.chunk_size))
@@ -0,0 +1,86 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.integrations.scheduler import Priority, github_priority
+from app.models.pull_request import PullRequest
+from app.models.user import User
+from app.schemas.pull_request import PullRequestOut
+from app.schemas.score import ScoreBreakdown
+from app.services import pull_request_service, sync_service
+from app.services.scoring_service import scoring_service
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def compute_window_score(
+    db: AsyncSession,
+    *,
+    user: User,
+    since: datetime,
+) -> dict[str, float]:
+    """
+    aggregate_from_prs over the user's PRs created since `since`,
+    aggregated in the database rather than loaded row by row, plus
+    `pr_count`. `avg_pr_score` averages the stored (whole-number)
+    per-PR scores.
+    """
+    totals = await pull_request_service.window_aggregate(
+        db, user_id=user.id, since=since
+    )
+    return {
+        "pr_count": totals["pr_count"],
+        **scoring_service.aggregate_from_totals(**totals),
+    }
+
+
+async def build_score_breakdown(
+    db: AsyncSession,
+    *,
+    user: User,
+    days: int,
+    limit: int,
+) -> ScoreBreakdown:
+    """
+    The user's score over stored PRs created in the last `days` days,
+    with the `limit` most recent of them for display.
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    score = await compute_window_score(db, user=user, since=since)
+    recent = await db.scalars(
+        select(PullRequest)
+        .where(
+            PullRequest.user_id == user.id,
+            PullRequest.created_at >= since,
+        )
+        .order_by(PullRequest.created_at.desc())
+        .limit(limit)
+    )
+    return ScoreBreakdown(
+        window_days=days,
+        pull_request_count=score.pop("pr_count"),
+        **score,
+        pull_requests=[PullRequestOut.model_validate(pr) for pr in recent],
+    )
+
+
+async def refresh_user_score(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    user_id: uuid.UUID,
+    days: int,
+    limit: int,
+) -> ScoreBreakdown:
+    """
+    Sync the user's PRs from GitHub and score them. Runs as a background
+    job, so it opens its own session rather than borrowing a request's.
+    """
+    async with session_factory() as db:
+        user = await db.get(User, user_id)
+        if user is None:
+            raise LookupError("User not found.")
+        # queued sync work yields GitHub budget to request-path calls
+        with github_priority(Priority.BACKGROUND):
+            await sync_service.sync_user_pull_requests(db, user=user)
+        return await build_score_breakdown(
+            db, user=user, days=days, limit=limit
+        )
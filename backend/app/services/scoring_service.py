@@ -1,5 +1,61 @@
+import heapq
+import itertools
+import math
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+_DEFAULT_PR_WEIGHTS = {
+    'lines_added': 0.25,
+    'lines_removed': 0.10,
+    'files_changed': 0.20,
+    'commits': 0.20,
+    'merge_speed': 0.25,
+}
+
+_DEFAULT_OPEN_SOURCE_WEIGHTS = {
+    'pr': 0.25,
+    'commits': 0.2,
+    'merge_time': 0.25,
+    'stars': 0.2,
+    'forks': 0.1,
+}
+
+_DEFAULT_AGGREGATE_WEIGHTS = {'pr_avg': 0.7, 'repo': 0.3}
+
+# repo-level scorers a weight profile can build on
+REPO_LEVEL_KINDS = ('open_source', 'personal')
+
+
+def _round2(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Vectorized equivalent of the builtin ``round(x, 2)``.
+
+    ``np.round`` scales by 100 before rounding, which can land on the other
+    side of a tie than Python's correctly-rounded ``round``. Values that sit
+    close to a tie are re-rounded with the builtin so results match the
+    scalar functions bit for bit.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        idx = np.flatnonzero(near_tie)
+        rounded[idx] = [round(float(v), 2) for v in values[idx]]
+    return rounded
+
+
+def _as_int_column(values: ArrayLike) -> NDArray[np.float64]:
+    # mirrors max(0, int(x)) from the scalar functions
+    return np.maximum(np.trunc(np.asarray(values, dtype=np.float64)), 0.0)
+
+
+def _as_float_column(values: ArrayLike) -> NDArray[np.float64]:
+    # mirrors max(0.0, float(x)) from the scalar functions
+    return np.maximum(np.asarray(values, dtype=np.float64), 0.0)
+
 
 class scoring_service:
     """Service to compute an open-source contribution score (0-100)."""
@@ -152,8 +208,8 @@ class scoring_service:
             return {'avg_pr_score': 0.0, 'repo_level_score': 0.0, 'final_score': 0.0}
 
         pr_scores = []
+        merge_days = []
         total_commits = 0
-        total_merge_days = 0.0
         for pr in pr_list:
             sc = scoring_service.compute_pr_score(
                 lines_added=pr.get('lines_added', 0),
@@ -164,25 +220,66 @@ class scoring_service:
                 weights=per_pr_weights,
             )
             pr_scores.append(sc)
+            merge_days.append(pr.get('merge_time_days', 0.0))
             total_commits += pr.get('commits', 0)
-            total_merge_days += pr.get('merge_time_days', 0.0)
-
-        avg_pr_score = sum(pr_scores) / len(pr_scores)
-        avg_commits_per_pr = (total_commits / len(pr_list)) if pr_list else 0.0
-        avg_merge_days = (total_merge_days / len(pr_list)) if pr_list else 0.0
 
-        # compute repo-level score using existing function (keeps backward compatibility)
-        # optional: sum or max depending on data
-        repo_level_score = scoring_service.compute_open_source_score(
+        # fsum is correctly rounded, so the totals do not depend on PR order
+        # or on how the Python version implements sum() for floats
+        return scoring_service.aggregate_from_totals(
             pr_count=len(pr_list),
-            commits_per_pr=avg_commits_per_pr,
-            avg_merge_time_days=avg_merge_days,
-            repo_stars=sum(
+            avg_pr_score=math.fsum(pr_scores) / len(pr_scores),
+            total_commits=total_commits,
+            total_merge_days=math.fsum(merge_days),
+            total_stars=sum(
                 pr.get('repo_stars', 0) for pr in pr_list
             ),
-            repo_forks=sum(
+            total_forks=sum(
                 pr.get('repo_forks', 0) for pr in pr_list
             ),
+            aggregate_weights=aggregate_weights,
+        )
+
+    @staticmethod
+    def aggregate_from_totals(
+        pr_count: int,
+        avg_pr_score: float,
+        total_commits: float,
+        total_merge_days: float,
+        total_stars: int,
+        total_forks: int,
+        *,
+        aggregate_weights: dict[str, float] | None = None,
+        repo_weights: dict[str, float] | None = None,
+        repo_level: str = 'open_source',
+    ) -> dict[str, float]:
+        """
+        Same result as aggregate_from_prs, from pre-aggregated sums
+        (e.g. computed by the database over a time window).
+        repo_level picks compute_open_source_score or
+        compute_personal_score (called with repo_weights).
+        """
+        if not pr_count:
+            return {'avg_pr_score': 0.0, 'repo_level_score': 0.0, 'final_score': 0.0}
+
+        avg_commits_per_pr = total_commits / pr_count
+        avg_merge_days = total_merge_days / pr_count
+
+        if repo_level == 'open_source':
+            repo_scorer = scoring_service.compute_open_source_score
+        elif repo_level == 'personal':
+            repo_scorer = scoring_service.compute_personal_score
+        else:
+            raise ValueError(f'Unknown repo-level score: {repo_level!r}')
+
+        # compute repo-level score using existing function (keeps backward compatibility)
+        # optional: sum or max depending on data
+        repo_level_score = repo_scorer(
+            pr_count=pr_count,
+            commits_per_pr=avg_commits_per_pr,
+            avg_merge_time_days=avg_merge_days,
+            repo_stars=total_stars,
+            repo_forks=total_forks,
+            weights=repo_weights,
         )
 
         # combine avg_pr_score and repo_level_score (tunable)
@@ -201,3 +298,357 @@ class scoring_service:
             'repo_level_score': round(repo_level_score, 2),
             'final_score': round(max(0.0, min(final, 1.0)) * 100, 2),
         }
+
+    # -------------------------------------------------
+    # Batch (vectorized) scoring
+    # -------------------------------------------------
+
+    @staticmethod
+    def compute_pr_scores_batch(
+        lines_added: ArrayLike,
+        lines_removed: ArrayLike,
+        files_changed: ArrayLike,
+        commits: ArrayLike,
+        merge_time_days: ArrayLike,
+        *,
+        weights: dict[str, float] | None = None
+    ) -> NDArray[np.float64]:
+        """
+        Vectorized compute_pr_score over equally sized column arrays.
+        Returns one score per PR, identical to calling compute_pr_score
+        on each row.
+        """
+        la = _as_int_column(lines_added)
+        lr = _as_int_column(lines_removed)
+        fc = _as_int_column(files_changed)
+        cm = _as_int_column(commits)
+        md = _as_float_column(merge_time_days)
+
+        if weights is None:
+            weights = _DEFAULT_PR_WEIGHTS
+
+        added_score = np.minimum(la / 200.0, 1.0)
+        removed_score = np.minimum(lr / 100.0, 1.0)
+        files_score = np.minimum(fc / 10.0, 1.0)
+        commits_score = np.minimum(cm / 5.0, 1.0)
+        merge_speed_score = 1.0 - np.minimum(md / 7.0, 1.0)
+
+        total = (
+            added_score * weights.get('lines_added', 0.0)
+            + removed_score * weights.get('lines_removed', 0.0)
+            + files_score * weights.get('files_changed', 0.0)
+            + commits_score * weights.get('commits', 0.0)
+            + merge_speed_score * weights.get('merge_speed', 0.0)
+        )
+
+        return _round2(np.clip(total, 0.0, 1.0) * 100)
+
+    @staticmethod
+    def compute_open_source_scores_batch(
+        pr_count: ArrayLike,
+        commits_per_pr: ArrayLike,
+        avg_merge_time_days: ArrayLike,
+        repo_stars: ArrayLike,
+        repo_forks: ArrayLike,
+        *,
+        weights: dict[str, float] | None = None
+    ) -> NDArray[np.float64]:
+        """Vectorized compute_open_source_score over column arrays."""
+        pr = _as_int_column(pr_count)
+        commits = _as_float_column(commits_per_pr)
+        merge_days = _as_float_column(avg_merge_time_days)
+        stars = _as_int_column(repo_stars)
+        forks = _as_int_column(repo_forks)
+
+        if weights is None:
+            weights = _DEFAULT_OPEN_SOURCE_WEIGHTS
+
+        pr_score = np.minimum(pr / 50.0, 1.0)
+        commits_score = np.minimum(commits / 10.0, 1.0)
+        merge_score = 1.0 - np.minimum(merge_days / 30.0, 1.0)
+        stars_score = np.minimum(stars / 1000.0, 1.0)
+        forks_score = np.minimum(forks / 500.0, 1.0)
+
+        total = (
+            pr_score * weights.get('pr', 0.0)
+            + commits_score * weights.get('commits', 0.0)
+            + merge_score * weights.get('merge_time', 0.0)
+            + stars_score * weights.get('stars', 0.0)
+            + forks_score * weights.get('forks', 0.0)
+        )
+
+        return _round2(np.clip(total, 0.0, 1.0) * 100)
+
+    @staticmethod
+    def aggregate_batch(
+        group_ids: ArrayLike,
+        lines_added: ArrayLike,
+        lines_removed: ArrayLike,
+        files_changed: ArrayLike,
+        commits: ArrayLike,
+        merge_time_days: ArrayLike,
+        repo_stars: ArrayLike,
+        repo_forks: ArrayLike,
+        *,
+        per_pr_weights: dict[str, float] | None = None,
+        aggregate_weights: dict[str, float] | None = None,
+    ) -> dict[str, NDArray[Any]]:
+        """
+        Score many users' PRs in one vectorized pass.
+
+        Every argument is a column with one entry per PR; group_ids holds
+        the owning user of each PR. Returns a dict of arrays:
+            'pr_scores'        - per PR, aligned with the input columns
+            'group_ids'        - the distinct group ids (sorted)
+            'avg_pr_score', 'repo_level_score', 'final_score'
+                               - per group, aligned with 'group_ids'
+        Per-group values match aggregate_from_prs on the same PRs exactly:
+        float columns are summed per group with math.fsum (correctly
+        rounded, so order-independent), integer columns exactly.
+        """
+        pr_scores = scoring_service.compute_pr_scores_batch(
+            lines_added,
+            lines_removed,
+            files_changed,
+            commits,
+            merge_time_days,
+            weights=per_pr_weights,
+        )
+
+        groups, inverse = np.unique(np.asarray(group_ids), return_inverse=True)
+        n_groups = len(groups)
+        counts = np.bincount(inverse, minlength=n_groups)
+        order = np.argsort(inverse, kind='stable')
+        boundaries = np.cumsum(counts)[:-1]
+
+        # integer columns add exactly in float64 (well below 2**53)
+        def group_sum(column: ArrayLike) -> NDArray[np.float64]:
+            return np.bincount(
+                inverse,
+                weights=np.asarray(column, dtype=np.float64),
+                minlength=n_groups,
+            )
+
+        # bincount adds floats plainly, so float columns use fsum per group
+        # to agree bit-for-bit with aggregate_from_prs
+        def group_fsum(column: ArrayLike) -> NDArray[np.float64]:
+            values = np.asarray(column, dtype=np.float64)[order]
+            return np.array(
+                [math.fsum(part) for part in np.split(values, boundaries)],
+                dtype=np.float64,
+            )
+
+        counts = counts.astype(np.float64)
+        avg_pr_score = group_fsum(pr_scores) / counts
+
+        repo_level_score = scoring_service.compute_open_source_scores_batch(
+            pr_count=counts,
+            commits_per_pr=group_sum(commits) / counts,
+            avg_merge_time_days=group_fsum(merge_time_days) / counts,
+            repo_stars=group_sum(repo_stars),
+            repo_forks=group_sum(repo_forks),
+        )
+
+        if aggregate_weights is None:
+            aggregate_weights = _DEFAULT_AGGREGATE_WEIGHTS
+
+        final = (
+            (avg_pr_score / 100.0)
+            * aggregate_weights.get('pr_avg', 0.0)
+            + (repo_level_score / 100.0)
+            * aggregate_weights.get('repo', 0.0)
+        )
+
+        return {
+            'pr_scores': pr_scores,
+            'group_ids': groups,
+            'avg_pr_score': _round2(avg_pr_score),
+            'repo_level_score': _round2(repo_level_score),
+            'final_score': _round2(np.clip(final, 0.0, 1.0) * 100),
+        }
+
+
+class AggregateState:
+    """
+    Running sums behind aggregate_from_prs, updatable one PR at a time.
+
+    `add` / `remove` take the same PR dicts as aggregate_from_prs, `merge`
+    folds in a state built elsewhere (another shard or worker) and
+    `finalize` returns the same dict aggregate_from_prs would for all
+    PRs added so far, up to rounding in the running float sums (which
+    aggregate_from_prs takes with fsum). Every operation is O(1) in the
+    number of PRs.
+    """
+
+    FIELDS = (
+        'pr_count',
+        'score_sum',
+        'total_commits',
+        'total_merge_days',
+        'total_stars',
+        'total_forks',
+    )
+
+    def __init__(self, *, per_pr_weights: dict[str, float] | None = None):
+        self.per_pr_weights = per_pr_weights
+        self.pr_count = 0
+        self.score_sum = 0.0
+        self.total_commits = 0
+        self.total_merge_days = 0.0
+        self.total_stars = 0
+        self.total_forks = 0
+
+    def __len__(self) -> int:
+        return self.pr_count
+
+    def contribution(self, pr: dict[str, Any]) -> tuple[float, ...]:
+        """What one PR adds to each field, in FIELDS order."""
+        score = scoring_service.compute_pr_score(
+            lines_added=pr.get('lines_added', 0),
+            lines_removed=pr.get('lines_removed', 0),
+            files_changed=pr.get('files_changed', 0),
+            commits=pr.get('commits', 0),
+            merge_time_days=pr.get('merge_time_days', 0.0),
+            weights=self.per_pr_weights,
+        )
+        return (
+            1,
+            score,
+            pr.get('commits', 0),
+            pr.get('merge_time_days', 0.0),
+            pr.get('repo_stars', 0),
+            pr.get('repo_forks', 0),
+        )
+
+    def _apply(self, values: tuple[float, ...], sign: int) -> None:
+        for field, value in zip(self.FIELDS, values):
+            setattr(self, field, getattr(self, field) + sign * value)
+
+    def add(self, pr: dict[str, Any]) -> None:
+        self._apply(self.contribution(pr), 1)
+
+    def remove(self, pr: dict[str, Any]) -> None:
+        """Undo an earlier `add` of the same PR dict."""
+        if not self.pr_count:
+            raise ValueError('Cannot remove from an empty aggregate.')
+        self._apply(self.contribution(pr), -1)
+
+    def merge(self, other: 'AggregateState') -> 'AggregateState':
+        """Fold `other` into this state in place and return self."""
+        if other.per_pr_weights != self.per_pr_weights:
+            raise ValueError('Cannot merge states with different PR weights.')
+        self._apply(tuple(getattr(other, f) for f in self.FIELDS), 1)
+        return self
+
+    def totals(self) -> dict[str, float]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_totals(
+        cls,
+        *,
+        per_pr_weights: dict[str, float] | None = None,
+        **totals: float,
+    ) -> 'AggregateState':
+        """A state holding already-summed FIELDS (e.g. from a batch)."""
+        state = cls(per_pr_weights=per_pr_weights)
+        state._apply(tuple(totals.get(f, 0) for f in cls.FIELDS), 1)
+        return state
+
+    def finalize(
+        self,
+        aggregate_weights: dict[str, float] | None = None,
+        **repo_options: Any,
+    ) -> dict[str, float]:
+        """repo_options: repo_weights / repo_level, see aggregate_from_totals."""
+        return scoring_service.aggregate_from_totals(
+            pr_count=self.pr_count,
+            avg_pr_score=(
+                self.score_sum / self.pr_count if self.pr_count else 0.0
+            ),
+            total_commits=self.total_commits,
+            total_merge_days=self.total_merge_days,
+            total_stars=self.total_stars,
+            total_forks=self.total_forks,
+            aggregate_weights=aggregate_weights,
+            **repo_options,
+        )
+
+
+class SlidingWindowState(AggregateState):
+    """
+    AggregateState over the PRs of the last `window_days` days.
+
+    Each PR is added with a timestamp (`at`, or its 'created_at' key);
+    `expire` drops PRs that fell out of the window, in
+    O(log n) per expired PR, and `finalize` expires before scoring.
+    `remove` takes a PR out early; it searches the window, so it is O(n).
+    """
+
+    def __init__(
+        self,
+        window_days: float,
+        *,
+        per_pr_weights: dict[str, float] | None = None,
+    ):
+        super().__init__(per_pr_weights=per_pr_weights)
+        self.window = timedelta(days=window_days)
+        self._entries: list[tuple[datetime, int, tuple[float, ...]]] = []
+        self._seq = itertools.count()
+
+    def add(self, pr: dict[str, Any], *, at: datetime | None = None) -> None:
+        at = at or pr.get('created_at')
+        if at is None:
+            raise ValueError('PR needs a timestamp for a sliding window.')
+        values = self.contribution(pr)
+        heapq.heappush(self._entries, (at, next(self._seq), values))
+        self._apply(values, 1)
+
+    def remove(self, pr: dict[str, Any], *, at: datetime | None = None) -> None:
+        """Undo an earlier `add` of the same PR dict (and timestamp)."""
+        at = at or pr.get('created_at')
+        values = self.contribution(pr)
+        for i, (entry_at, _, entry_values) in enumerate(self._entries):
+            if entry_values == values and (at is None or entry_at == at):
+                break
+        else:
+            raise ValueError('PR is not in the sliding window.')
+        last = self._entries.pop()
+        if i < len(self._entries):
+            self._entries[i] = last
+            heapq.heapify(self._entries)
+        self._apply(values, -1)
+
+    def merge(self, other: AggregateState) -> 'SlidingWindowState':
+        if not isinstance(other, SlidingWindowState):
+            raise TypeError('Can only merge another SlidingWindowState.')
+        super().merge(other)
+        self._entries.extend(
+            (at, next(self._seq), values) for at, _, values in other._entries
+        )
+        heapq.heapify(self._entries)
+        return self
+
+    def expire(self, now: datetime | None = None) -> int:
+        """Drop PRs older than the window; returns how many were dropped."""
+        cutoff = (now or datetime.now(timezone.utc)) - self.window
+        dropped = 0
+        while self._entries and self._entries[0][0] < cutoff:
+            _, _, values = heapq.heappop(self._entries)
+            self._apply(values, -1)
+            dropped += 1
+        if not self._entries:
+            # drop accumulated float error once the window is empty
+            for field in self.FIELDS:
+                setattr(self, field, 0)
+        return dropped
+
+    def finalize(
+        self,
+        aggregate_weights: dict[str, float] | None = None,
+        *,
+        now: datetime | None = None,
+        **repo_options: Any,
+    ) -> dict[str, float]:
+        self.expire(now)
+        return super().finalize(aggregate_weights, **repo_options)
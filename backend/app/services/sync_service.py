@@ -0,0 +1,294 @@
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from app.core.config import settings
+from app.core.security import decrypt_tokens
+from app.db.routing import recent_writes
+from app.integrations.github_async import AsyncGitHubService
+from app.integrations.repo_metadata import (RepoMetadata, RepoMetadataStore,
+                                            get_repo_metadata_store)
+from app.integrations.token_pool import TokenPool, get_token_pool
+from app.models.pull_request import PullRequest
+from app.models.repository import Repository
+from app.models.sync_state import UserSyncState
+from app.models.user import User
+from app.schemas.pull_request import PRParameters, PullRequestInfo
+from app.services import pull_request_service, user_score_service
+from app.services.leaderboard_service import leaderboard
+from app.services.scoring_service import scoring_service
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PRPair = tuple[PullRequestInfo, PRParameters]
+
+# fetched_at of a placeholder `repositories` row; any real fetch is newer
+_NEVER_FETCHED = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def pr_row_values(pr_info: PullRequestInfo, pr_params: PRParameters) -> dict[str, Any]:
+    """Column values for a `pull_requests` row built from GitHub data."""
+    merge_time_days = 0.0
+    if pr_params.pr_closed:
+        delta = pr_params.pr_closed - pr_params.pr_opened
+        merge_time_days = delta.total_seconds() / 86400.0
+
+    score = scoring_service.compute_pr_score(
+        lines_added=pr_params.lines_added,
+        lines_removed=pr_params.lines_removed,
+        files_changed=pr_params.files_changed,
+        commits=pr_params.commits,
+        merge_time_days=merge_time_days,
+    )
+
+    return {
+        "github_pr_id": pr_info.github_id,
+        "repo_full_name": pr_info.repo,
+        "repo_owner": pr_info.repo.split("/", 1)[0],
+        "created_at": pr_params.pr_opened,
+        "closed_at": pr_params.pr_closed,
+        "merged_at": pr_params.pr_closed if pr_info.merged else None,
+        "updated_at": pr_info.updated_at,
+        "additions": pr_params.lines_added,
+        "deletions": pr_params.lines_removed,
+        "changed_files": pr_params.files_changed,
+        "commits": pr_params.commits,
+        "score": int(round(score)),
+    }
+
+
+async def load_user_credentials(
+    db: AsyncSession,
+    *,
+    pool: TokenPool | None = None,
+) -> int:
+    """
+    Add every stored user OAuth token to the token pool, tagged with its
+    owner so that user's own data is fetched with their token.
+    Tokens that no longer decrypt are skipped. Returns how many were added.
+    """
+    pool = pool or get_token_pool()
+    rows = await db.execute(
+        select(User.username, User.access_token_encrypted).where(
+            User.access_token_encrypted.is_not(None)
+        )
+    )
+    users = rows.all()
+    tokens = decrypt_tokens(encrypted for _, encrypted in users)
+    added = 0
+    for (username, _), token in zip(users, tokens):
+        if token is None:
+            continue
+        pool.add(token, owner=username)
+        added += 1
+    return added
+
+
+async def load_repo_metadata(
+    db: AsyncSession,
+    *,
+    names: Iterable[str] | None = None,
+    store: RepoMetadataStore | None = None,
+) -> int:
+    """
+    Seed the in-process repo metadata store from `repositories`, either
+    for the given names or for every row still within the TTL.
+    Returns how many entries were loaded.
+    """
+    if store is None:
+        store = get_repo_metadata_store()
+    stmt = select(Repository)
+    if names is not None:
+        stmt = stmt.where(Repository.name_with_owner.in_(list(names)))
+    else:
+        stmt = stmt.where(
+            Repository.fetched_at > datetime.now(timezone.utc) - store.ttl
+        )
+    loaded = 0
+    for repo in await db.scalars(stmt):
+        store.put(RepoMetadata(
+            repo.name_with_owner,
+            repo.stargazer_count,
+            repo.fork_count,
+            repo.fetched_at,
+        ))
+        loaded += 1
+    return loaded
+
+
+async def save_repo_metadata(
+    db: AsyncSession,
+    entries: Iterable[RepoMetadata],
+) -> dict[str, tuple[int, int]]:
+    """
+    Upsert repo metadata into `repositories`, keeping the newest fetch
+    per repo (caller commits). Returns the (stars, forks) change of each
+    repo whose counts moved, for user_score_service.apply_repo_changes;
+    a repo new to the table changes from 0 / 0.
+    """
+    latest: dict[str, RepoMetadata] = {}
+    for entry in entries:
+        current = latest.get(entry.name_with_owner)
+        if current is None or current.fetched_at < entry.fetched_at:
+            latest[entry.name_with_owner] = entry
+    if not latest:
+        return {}
+    names = sorted(latest)
+    # placeholder rows make every repo lockable below, so two writers
+    # saving the same new repo take turns instead of both counting it
+    await db.execute(
+        insert(Repository)
+        .values([
+            {
+                "name_with_owner": name,
+                "stargazer_count": 0,
+                "fork_count": 0,
+                "fetched_at": _NEVER_FETCHED,
+            }
+            for name in names
+        ])
+        .on_conflict_do_nothing(index_elements=[Repository.name_with_owner])
+    )
+    stored = await db.scalars(
+        select(Repository)
+        .where(Repository.name_with_owner == any_(bindparam(
+            "repo_names", names, type_=ARRAY(String)
+        )))
+        .order_by(Repository.name_with_owner)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    changes: dict[str, tuple[int, int]] = {}
+    for repo in stored:
+        entry = latest[repo.name_with_owner]
+        if repo.fetched_at >= entry.fetched_at:
+            continue
+        change = (
+            entry.stars - repo.stargazer_count,
+            entry.forks - repo.fork_count,
+        )
+        if change != (0, 0):
+            changes[repo.name_with_owner] = change
+        repo.stargazer_count = entry.stars
+        repo.fork_count = entry.forks
+        repo.fetched_at = entry.fetched_at
+    await db.flush()
+    return changes
+
+
+async def get_sync_state(
+    db: AsyncSession,
+    *,
+    user_id: Any,
+) -> UserSyncState | None:
+    return await db.get(UserSyncState, user_id)
+
+
+async def _chunks(
+    prs: AsyncIterator[PRPair],
+    size: int,
+) -> AsyncIterator[list[PRPair]]:
+    chunk: list[PRPair] = []
+    async for pr in prs:
+        chunk.append(pr)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _as_async(prs: Iterable[PRPair]) -> AsyncIterator[PRPair]:
+    for pr in prs:
+        yield pr
+
+
+async def sync_user_pull_requests(
+    db: AsyncSession,
+    *,
+    user: User,
+    github: AsyncGitHubService | None = None,
+) -> dict[str, int]:
+    """
+    Bring the user's stored PRs up to date with GitHub.
+
+    The first sync fetches the full history; later syncs only ask GitHub
+    for PRs updated since the stored watermark and upsert those. Repo
+    star / fork counts stored by earlier syncs seed the metadata store,
+    so only unknown or stale repos are looked up.
+    By default requests go through the token pool, preferring the user's
+    own token, and the user's reads stick to the primary database for a
+    short while after the commit. Returns counts:
+        { 'fetched', 'inserted', 'updated', 'unchanged' }.
+    """
+    if github is None:
+        github = AsyncGitHubService(owner=user.username)
+
+    state = await get_sync_state(db, user_id=user.id)
+    if state is None:
+        state = UserSyncState(user_id=user.id)
+        db.add(state)
+
+    watermark = state.pr_updated_watermark
+    started_at = datetime.now(timezone.utc)
+
+    # star / fork counts already in `repositories` for the user's repos
+    # need no GitHub lookup while they are within the TTL
+    await load_repo_metadata(
+        db,
+        names=await db.scalars(
+            select(PullRequest.repo_full_name)
+            .where(PullRequest.user_id == user.id)
+            .distinct()
+        ),
+        store=github.repo_metadata,
+    )
+
+    if watermark is None:
+        prs = _as_async(await github.get_user_prs_sharded(user.username))
+    else:
+        prs = github.iter_user_prs_graphql(
+            user.username, updated_since=watermark
+        )
+
+    counts = {"fetched": 0, "inserted": 0, "updated": 0, "unchanged": 0}
+    # chunks as large as the COPY threshold, so full syncs take that path
+    async for chunk in _chunks(prs, settings.pr_bulk_copy_threshold):
+        counts["fetched"] += len(chunk)
+        # repo count changes reach every affected snapshot before this
+        # chunk's PRs add their repos' current counts
+        changes = await save_repo_metadata(
+            db,
+            github.repo_metadata.lookup(
+                sorted({pr_info.repo for pr_info, _ in chunk})
+            ).values(),
+        )
+        await user_score_service.apply_repo_changes(
+            db, changes, user_id=user.id
+        )
+        written = await pull_request_service.bulk_upsert(
+            db,
+            user_id=user.id,
+            rows=[pr_row_values(info, params) for info, params in chunk],
+        )
+        # commit per chunk so no row locks are held while fetching
+        await db.commit()
+        for key, value in written.items():
+            counts[key] += value
+        for pr_info, _ in chunk:
+            if pr_info.updated_at and (
+                watermark is None or pr_info.updated_at > watermark
+            ):
+                watermark = pr_info.updated_at
+
+    state.pr_updated_watermark = watermark
+    state.last_synced_at = started_at
+    await db.commit()
+    recent_writes.note(user.github_id)
+
+    snapshot = await user_score_service.get_snapshot(db, user_id=user.id)
+    if snapshot is not None:
+        leaderboard.update(user.id, user.username, snapshot.final_score)
+
+    return counts
@@ -0,0 +1,260 @@
+import uuid
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+from app.models.pull_request import PullRequest
+from app.models.repository import Repository
+from app.models.user_score import UserScore
+from app.services.scoring_service import scoring_service
+from sqlalchemy import Select, String, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TOTAL_COLUMNS = (
+    "pr_count",
+    "score_sum",
+    "total_commits",
+    "total_merge_days",
+    "total_stars",
+    "total_forks",
+)
+
+
+def merge_days(created_at: datetime | None, closed_at: datetime | None) -> float:
+    if created_at is None or closed_at is None:
+        return 0.0
+    return (closed_at - created_at).total_seconds() / 86400.0
+
+
+def upsert_delta(
+    previous: Mapping[int, Any],
+    rows: Iterable[Mapping[str, Any]],
+    repo_counts: Mapping[str, tuple[int, int]] | None = None,
+) -> dict[str, float]:
+    """
+    Change to a user's totals from upserting `rows`, given the rows
+    already stored for those PRs (`previous`, keyed by github_pr_id).
+    Rows whose `updated_at` is unchanged are skipped, as in the upsert.
+    Stars / forks are the current (stars, forks) of each PR's repo in
+    `repo_counts` (see get_repo_counts; missing repos count 0, as in
+    rebuild): added for new PRs and moved for PRs whose repo changed.
+    """
+    repo_counts = repo_counts or {}
+    delta = dict.fromkeys(TOTAL_COLUMNS, 0)
+
+    def count_repo(name: str, sign: int) -> None:
+        stars, forks = repo_counts.get(name, (0, 0))
+        delta["total_stars"] += sign * stars
+        delta["total_forks"] += sign * forks
+
+    for row in rows:
+        old = previous.get(row["github_pr_id"])
+        if old is not None and old.updated_at == row["updated_at"]:
+            continue
+        delta["score_sum"] += row["score"]
+        delta["total_commits"] += row["commits"]
+        delta["total_merge_days"] += merge_days(
+            row["created_at"], row["closed_at"]
+        )
+        if old is None:
+            delta["pr_count"] += 1
+            count_repo(row["repo_full_name"], 1)
+        else:
+            delta["score_sum"] -= old.score
+            delta["total_commits"] -= old.commits
+            delta["total_merge_days"] -= merge_days(
+                old.created_at, old.closed_at
+            )
+            if old.repo_full_name != row["repo_full_name"]:
+                count_repo(old.repo_full_name, -1)
+                count_repo(row["repo_full_name"], 1)
+    return delta
+
+
+async def _ensure_snapshot(db: AsyncSession, user_id: uuid.UUID) -> None:
+    await db.execute(
+        insert(UserScore)
+        .values(
+            user_id=user_id,
+            **dict.fromkeys(TOTAL_COLUMNS, 0),
+            final_score=0.0,
+            updated_at=datetime.now(timezone.utc),
+        )
+        .on_conflict_do_nothing(index_elements=[UserScore.user_id])
+    )
+
+
+async def lock_snapshot(db: AsyncSession, *, user_id: uuid.UUID) -> UserScore:
+    """
+    Create the user's snapshot row if needed and lock it until the
+    transaction ends, so concurrent writers apply their deltas in turn.
+    """
+    await _ensure_snapshot(db, user_id)
+    return (await db.scalars(
+        select(UserScore)
+        .where(UserScore.user_id == user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )).one()
+
+
+def apply_delta(snapshot: UserScore, delta: Mapping[str, float]) -> None:
+    """Add `delta` to a locked snapshot and rescore it (caller commits)."""
+    if not any(delta.values()):
+        return
+    for col in TOTAL_COLUMNS:
+        setattr(snapshot, col, getattr(snapshot, col) + delta[col])
+    snapshot.final_score = snapshot_score(snapshot)["final_score"]
+    snapshot.updated_at = datetime.now(timezone.utc)
+
+
+def repo_change_deltas(
+    changes: Mapping[str, tuple[int, int]],
+    pr_counts: Iterable[tuple[uuid.UUID, str, int]],
+) -> dict[uuid.UUID, dict[str, float]]:
+    """
+    Per-user total changes from repos whose (stars, forks) moved by
+    `changes`, given (user_id, repo, PR count) rows: each of a user's PRs
+    in a repo counts that repo's change once.
+    """
+    deltas: dict[uuid.UUID, dict[str, float]] = {}
+    for user_id, repo, count in pr_counts:
+        stars, forks = changes[repo]
+        delta = deltas.setdefault(user_id, dict.fromkeys(TOTAL_COLUMNS, 0))
+        delta["total_stars"] += stars * count
+        delta["total_forks"] += forks * count
+    return deltas
+
+
+def _repo_names(names: Iterable[str]) -> Any:
+    # one array parameter, however many repos
+    return any_(bindparam("repo_names", sorted(names), type_=ARRAY(String)))
+
+
+async def get_repo_counts(
+    db: AsyncSession,
+    names: Iterable[str],
+) -> dict[str, tuple[int, int]]:
+    """Current (stars, forks) from `repositories` for the given repos."""
+    names = set(names)
+    if not names:
+        return {}
+    result = await db.execute(
+        select(
+            Repository.name_with_owner,
+            Repository.stargazer_count,
+            Repository.fork_count,
+        ).where(Repository.name_with_owner == _repo_names(names))
+    )
+    return {name: (stars, forks) for name, stars, forks in result}
+
+
+async def apply_repo_changes(
+    db: AsyncSession,
+    changes: Mapping[str, tuple[int, int]],
+    *,
+    user_id: uuid.UUID,
+) -> None:
+    """
+    Shift the star / fork totals of every user with PRs in the repos of
+    `changes` (see sync_service.save_repo_metadata) by the change times
+    their PR count there, instead of re-summing anyone's history.
+    The affected snapshots and `user_id`'s (the writer's own) are locked
+    together in user_id order, so concurrent writers cannot deadlock on
+    them (caller commits).
+    """
+    if not changes:
+        return
+    pr_counts = await db.execute(
+        select(
+            PullRequest.user_id,
+            PullRequest.repo_full_name,
+            func.count(),
+        )
+        .where(PullRequest.repo_full_name == _repo_names(changes))
+        .group_by(PullRequest.user_id, PullRequest.repo_full_name)
+    )
+    deltas = repo_change_deltas(changes, pr_counts)
+    await _ensure_snapshot(db, user_id)
+    snapshots = await db.scalars(
+        select(UserScore)
+        .where(UserScore.user_id == any_(bindparam(
+            "user_ids",
+            sorted({user_id, *deltas}),
+            type_=ARRAY(UUID(as_uuid=True)),
+        )))
+        .order_by(UserScore.user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    for snapshot in snapshots:
+        if snapshot.user_id in deltas:
+            apply_delta(snapshot, deltas[snapshot.user_id])
+
+
+def _repo_totals(user_id: uuid.UUID) -> Select[Any]:
+    """Current stars / forks of the repos of a user's PRs, once per PR."""
+    return (
+        select(
+            func.coalesce(func.sum(Repository.stargazer_count), 0),
+            func.coalesce(func.sum(Repository.fork_count), 0),
+        )
+        .select_from(PullRequest)
+        .join(
+            Repository,
+            Repository.name_with_owner == PullRequest.repo_full_name,
+        )
+        .where(PullRequest.user_id == user_id)
+    )
+
+
+async def rebuild(db: AsyncSession, *, user_id: uuid.UUID) -> UserScore:
+    """Recompute the user's snapshot from `pull_requests` (caller commits)."""
+    snapshot = await lock_snapshot(db, user_id=user_id)
+    row = (await db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(PullRequest.score), 0),
+            func.coalesce(func.sum(PullRequest.commits), 0),
+            func.coalesce(func.sum(
+                func.extract(
+                    "epoch", PullRequest.closed_at - PullRequest.created_at
+                ) / 86400.0
+            ), 0.0),
+        )
+        .where(PullRequest.user_id == user_id)
+    )).one()
+    repo_row = (await db.execute(_repo_totals(user_id))).one()
+    for col, value in zip(TOTAL_COLUMNS, (*row, *repo_row)):
+        setattr(snapshot, col, value)
+    snapshot.final_score = snapshot_score(snapshot)["final_score"]
+    snapshot.updated_at = datetime.now(timezone.utc)
+    return snapshot
+
+
+async def get_snapshot(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+) -> UserScore | None:
+    return await db.get(UserScore, user_id)
+
+
+def snapshot_score(
+    snapshot: UserScore,
+    *,
+    aggregate_weights: dict[str, float] | None = None,
+) -> dict[str, float]:
+    """`aggregate_from_prs`-style scores from a snapshot's running sums."""
+    return scoring_service.aggregate_from_totals(
+        pr_count=snapshot.pr_count,
+        avg_pr_score=(
+            snapshot.score_sum / snapshot.pr_count if snapshot.pr_count else 0.0
+        ),
+        total_commits=snapshot.total_commits,
+        total_merge_days=snapshot.total_merge_days,
+        total_stars=snapshot.total_stars,
+        total_forks=snapshot.total_forks,
+        aggregate_weights=aggregate_weights,
+    )
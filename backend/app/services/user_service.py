@@ -0,0 +1,113 @@
+import uuid
+from typing import Any
+
+from app.core.config import settings
+from app.core.security import decrypt_tokens
+from app.core.ttl_cache import TTLCache
+from app.db.routing import recent_writes
+from app.integrations.token_pool import get_token_pool
+from app.models.user import User
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+# column values of recently authenticated users, keyed by github_id
+user_cache = TTLCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl,
+)
+
+
+async def get_by_id(db: AsyncSession, *, user_id: uuid.UUID) -> User | None:
+    return await db.get(User, user_id)
+
+
+async def get_by_github_id(db: AsyncSession, *, github_id: int) -> User | None:
+    return await db.scalar(select(User).where(User.github_id == github_id))
+
+
+def _snapshot(user: User) -> dict[str, Any]:
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+    }
+
+
+async def get_by_github_id_cached(
+    db: AsyncSession,
+    *,
+    github_id: int,
+) -> User | None:
+    """
+    get_by_github_id through `user_cache`. A hit builds a detached User
+    from the cached columns without touching the database; relationships
+    are not loaded on it.
+    """
+    data = user_cache.get(github_id)
+    if data is not None:
+        user = User(**data)
+        make_transient_to_detached(user)
+        return user
+
+    user = await get_by_github_id(db, github_id=github_id)
+    if user is not None:
+        user_cache.set(github_id, _snapshot(user))
+    return user
+
+
+def invalidate_cached(github_id: int) -> None:
+    user_cache.invalidate(github_id)
+
+
+# ORM updates / deletes drop the cached copy at flush and again after
+# the commit, since a read between the two caches the old row. Bulk
+# UPDATE / DELETE statements bypass these hooks and must call
+# invalidate_cached.
+_PENDING_INVALIDATIONS = "user_cache_invalidations"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_write(mapper: Any, connection: Any, user: User) -> None:
+    invalidate_cached(user.github_id)
+    session = object_session(user)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(
+            user.github_id
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for github_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_cached(github_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+# a user whose row just changed reads from the primary for a while
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _note_write(mapper: Any, connection: Any, user: User) -> None:
+    recent_writes.note(user.github_id)
+
+
+# a login stores a fresh OAuth token; the token pool should use it for the
+# user's own fetches right away rather than after the next restart
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _refresh_pool_token(mapper: Any, connection: Any, user: User) -> None:
+    if not inspect(user).attrs.access_token_encrypted.history.has_changes():
+        return
+    pool = get_token_pool()
+    token = None
+    if user.access_token_encrypted:
+        token = decrypt_tokens([user.access_token_encrypted])[0]
+    if token is None:
+        pool.remove_owner(user.username)
+    else:
+        pool.add(token, owner=user.username)
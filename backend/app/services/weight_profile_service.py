@@ -0,0 +1,67 @@
+from collections.abc import Iterable
+from typing import Any
+
+from app.models.weight_profile import WeightProfile
+from app.services.scoring_service import REPO_LEVEL_KINDS
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_latest(
+    db: AsyncSession,
+    *,
+    names: Iterable[str] | None = None,
+) -> list[WeightProfile]:
+    """Latest version of each profile (optionally only the given names)."""
+    stmt = (
+        select(WeightProfile)
+        .distinct(WeightProfile.name)
+        .order_by(WeightProfile.name, WeightProfile.version.desc())
+    )
+    if names is not None:
+        stmt = stmt.where(WeightProfile.name.in_(list(names)))
+    return list(await db.scalars(stmt))
+
+
+async def get_version(
+    db: AsyncSession,
+    *,
+    name: str,
+    version: int,
+) -> WeightProfile | None:
+    return await db.scalar(
+        select(WeightProfile).where(
+            WeightProfile.name == name,
+            WeightProfile.version == version,
+        )
+    )
+
+
+async def create_version(
+    db: AsyncSession,
+    *,
+    name: str,
+    repo_level: str,
+    pr_weights: dict[str, Any],
+    repo_weights: dict[str, Any],
+    aggregate_weights: dict[str, Any],
+) -> WeightProfile:
+    """Add the next version of `name` (caller commits)."""
+    if repo_level not in REPO_LEVEL_KINDS:
+        raise ValueError(f"Unknown repo-level score: {repo_level!r}")
+    current = await db.scalar(
+        select(func.max(WeightProfile.version)).where(
+            WeightProfile.name == name
+        )
+    )
+    profile = WeightProfile(
+        name=name,
+        version=(current or 0) + 1,
+        repo_level=repo_level,
+        pr_weights=pr_weights,
+        repo_weights=repo_weights,
+        aggregate_weights=aggregate_weights,
+    )
+    db.add(profile)
+    await db.flush()
+    return profile
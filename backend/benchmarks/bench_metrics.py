@@ -0,0 +1,67 @@
+"""
+Hot-path cost of recording metrics.
+
+    cd backend && python -m benchmarks.bench_metrics [count]
+
+Times a histogram observation, a counter increment and one request
+through a bare ASGI app with and without MetricsMiddleware.
+"""
+
+import asyncio
+import sys
+import time
+
+from app.api.middleware import MetricsMiddleware
+from app.core.metrics import Counter, Histogram
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed / count * 1e9:8.0f} ns/op")
+
+
+def _timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    _report(label, count, time.perf_counter() - start)
+
+
+async def _app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _requests(app, count: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/"}
+
+    async def receive() -> dict:
+        return {"type": "http.request"}
+
+    async def send(message: dict) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def main(count: int) -> None:
+    histogram = Histogram("bench_seconds", "Benchmark.", ("route",))
+    counter = Counter("bench", "Benchmark.", ("route", "status"))
+
+    _timed("histogram observe", count, lambda: [
+        histogram.observe(0.042, "/score") for _ in range(count)
+    ])
+    _timed("counter inc", count, lambda: [
+        counter.inc("/score", "200") for _ in range(count)
+    ])
+    _report("request, bare app", count, asyncio.run(_requests(_app, count)))
+    _report(
+        "request, with middleware",
+        count,
+        asyncio.run(_requests(MetricsMiddleware(_app), count)),
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
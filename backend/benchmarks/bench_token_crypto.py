@@ -0,0 +1,49 @@
+"""
+Per-token cost of decrypting stored GitHub tokens.
+
+    cd backend && python -m benchmarks.bench_token_crypto [count]
+
+Compares building a Fernet per call (the old `_fernet_key` path) with
+the process-wide CryptoContext, one call at a time and in a batch.
+"""
+
+import base64
+import hashlib
+import sys
+import time
+
+from app.core.security import CryptoContext
+from cryptography.fernet import Fernet
+
+SECRET = "benchmark-secret"
+
+
+def _per_call_fernet() -> Fernet:
+    digest = hashlib.sha256(SECRET.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def _timed(label: str, count: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / count * 1e6:8.2f} us/token")
+
+
+def main(count: int) -> None:
+    context = CryptoContext(SECRET)
+    stored = [context.encrypt(f"gho_{i:036d}").encode() for i in range(count)]
+
+    _timed("fernet per call", count, lambda: [
+        _per_call_fernet().decrypt(token) for token in stored
+    ])
+    _timed("crypto context, per call", count, lambda: [
+        context.decrypt(token.decode()) for token in stored
+    ])
+    _timed("crypto context, batch", count, lambda: context.decrypt_many(
+        token.decode() for token in stored
+    ))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -1,6 +1,30 @@
+import random
+
 import pytest
 
 
 @pytest.fixture(scope='session')
 def sample_fixture():
     return "sample data"
+
+
+def _random_prs(rng: random.Random, n: int) -> list[dict]:
+    return [
+        {
+            'user': rng.randrange(25),
+            'lines_added': rng.randrange(0, 600),
+            'lines_removed': rng.randrange(0, 300),
+            'files_changed': rng.randrange(0, 30),
+            'commits': rng.randrange(0, 12),
+            'merge_time_days': rng.uniform(0, 20),
+            'repo_stars': rng.randrange(0, 400),
+            'repo_forks': rng.randrange(0, 150),
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture
+def random_prs():
+    """random_prs(seed, n): n PR dicts for 25 users, reproducible per seed."""
+    return lambda seed, n: _random_prs(random.Random(seed), n)
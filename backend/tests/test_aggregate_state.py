@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.services.scoring_service import (AggregateState, SlidingWindowState,
+                                          scoring_service)
+
+
+def test_merged_shards_finalize_like_aggregate_from_prs(random_prs):
+    prs = random_prs(7, 300)
+    shards = [AggregateState() for _ in range(3)]
+    for i, pr in enumerate(prs):
+        shards[i % 3].add(pr)
+    state = shards[0].merge(shards[1]).merge(shards[2])
+
+    weights = {'pr_avg': 0.5, 'repo': 0.5}
+    assert state.finalize(weights) == scoring_service.aggregate_from_prs(
+        prs, aggregate_weights=weights
+    )
+
+    extra = prs[:10]
+    for pr in extra:
+        state.add(pr)
+    for pr in extra:
+        state.remove(pr)
+    assert len(state) == len(prs)
+
+
+def test_sliding_window_expires_old_prs(random_prs):
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    prs = random_prs(3, 40)
+    window = SlidingWindowState(30)
+    for i, pr in enumerate(prs):
+        window.add(pr, at=now - timedelta(days=i))
+
+    recent = prs[:31]  # days 0..30 are still inside the window
+    assert window.finalize(now=now) == scoring_service.aggregate_from_prs(recent)
+    assert len(window) == len(recent)
+
+    assert window.expire(now + timedelta(days=365)) == len(recent)
+    assert window.finalize(now=now)['final_score'] == 0.0
+
+
+def test_sliding_window_remove_undoes_add(random_prs):
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    prs = random_prs(4, 20)
+    window = SlidingWindowState(30)
+    for i, pr in enumerate(prs):
+        window.add(pr, at=now - timedelta(days=i))
+
+    # used as an AggregateState, a window still supports remove()
+    state: AggregateState = window
+    state.remove(prs[5])
+    window.remove(prs[12], at=now - timedelta(days=12))
+    kept = [pr for i, pr in enumerate(prs) if i not in (5, 12)]
+
+    assert len(window) == len(kept)
+    assert window.finalize(now=now) == scoring_service.aggregate_from_prs(kept)
+    with pytest.raises(ValueError):
+        window.remove(prs[5])
+    # the removed entries are gone from the window, so nothing is expired
+    # twice when the window moves on
+    assert window.expire(now + timedelta(days=365)) == len(kept)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from datetime import timedelta
+
+from app.core import security
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.models.user import User
+from app.services import user_service
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+def test_ttl_cache_expires_evicts_and_counts():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    cache.set("d", 4, ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.stats() == {
+        "entries": 1, "hits": 1, "misses": 3, "evictions": 2,
+    }
+
+
+def test_decoded_claims_are_reused(monkeypatch):
+    monkeypatch.setattr(settings, "jwt_secret", "test-secret")
+    monkeypatch.setattr(security, "_crypto_context", None)
+    security.claims_cache.clear()
+    calls = []
+    decode = security.decode_access_token
+
+    def counting_decode(token):
+        calls.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(security, "decode_access_token", counting_decode)
+    token = security.create_access_token(
+        {"github_id": 42}, expires_delta=timedelta(minutes=5)
+    )
+
+    first = security.decode_access_token_cached(token)
+    first["github_id"] = 0  # callers get their own copy
+    assert security.decode_access_token_cached(token)["github_id"] == 42
+    assert len(calls) == 1
+
+
+def _users_engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, params, context, many) -> None:
+        statements.append(statement)
+
+    return engine, statements
+
+
+def test_cached_user_lookup_skips_the_database():
+    user_service.user_cache.clear()
+
+    async def run() -> tuple[str, int]:
+        engine, statements = _users_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        async with async_sessionmaker(engine)() as db:
+            db.add(User(github_id=11, username="dana"))
+            await db.commit()
+            statements.clear()
+            await user_service.get_by_github_id_cached(db, github_id=11)
+            after_miss = len(statements)
+            cached = await user_service.get_by_github_id_cached(
+                db, github_id=11
+            )
+        await engine.dispose()
+        return cached.username, len(statements) - after_miss
+
+    assert asyncio.run(run()) == ("dana", 0)
+
+
+def test_orm_update_invalidates_the_cached_user():
+    user_service.user_cache.clear()
+
+    async def run() -> tuple[str, bool]:
+        engine, _ = _users_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        async with async_sessionmaker(engine)() as db:
+            user = User(github_id=12, username="erin")
+            db.add(user)
+            await db.commit()
+            await user_service.get_by_github_id_cached(db, github_id=12)
+
+            user.username = "erin-renamed"
+            await db.flush()
+            # a read between flush and commit still sees the old row
+            user_service.user_cache.set(
+                12, {"github_id": 12, "username": "erin"}
+            )
+            await db.commit()
+            dropped = user_service.user_cache.get(12) is None
+
+            fresh = await user_service.get_by_github_id_cached(
+                db, github_id=12
+            )
+        await engine.dispose()
+        return fresh.username, dropped
+
+    assert asyncio.run(run()) == ("erin-renamed", True)
@@ -0,0 +1,31 @@
+import uuid
+
+from app.services.pull_request_service import _count, _prepare_rows
+
+
+def test_count_reads_xmax_flags():
+    # RETURNING xmax = 0 yields True for inserts and False for updates;
+    # rows skipped by the WHERE clause return nothing and are unchanged
+    assert _count([True, False, True], 5) == {
+        "inserted": 2,
+        "updated": 1,
+        "unchanged": 2,
+    }
+    assert _count([], 3) == {"inserted": 0, "updated": 0, "unchanged": 3}
+
+
+def test_prepare_rows_keeps_the_last_row_per_pr():
+    user_id = uuid.uuid4()
+    rows = _prepare_rows(user_id, [
+        {"github_pr_id": 1, "score": 1.0},
+        {"github_pr_id": None, "score": 9.0},
+        {"github_pr_id": 2, "score": 2.0, "ci_passed": True},
+        {"github_pr_id": 1, "score": 3.0},
+    ])
+    assert [(row["github_pr_id"], row["score"]) for row in rows] == [
+        (1, 3.0),
+        (2, 2.0),
+    ]
+    assert all(row["user_id"] == user_id for row in rows)
+    assert [row["ci_passed"] for row in rows] == [False, True]
+    assert [row["review_count"] for row in rows] == [0, 0]
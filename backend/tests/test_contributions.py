@@ -0,0 +1,54 @@
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.contribution_service import (bucket_deltas,
+                                               consistency_metrics)
+
+T0 = datetime(2025, 3, 3, 12, tzinfo=timezone.utc)  # a Monday
+
+
+def _bucket(day: date, prs: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        day=day,
+        pr_count=prs,
+        lines_added=10 * prs,
+        lines_removed=prs,
+        commits=2 * prs,
+        merged_count=prs,
+        merge_days=1.5 * prs,
+    )
+
+
+def test_bucket_deltas_move_changed_pr_between_days():
+    old = SimpleNamespace(
+        created_at=T0, merged_at=None, updated_at=T0,
+        additions=5, deletions=1, commits=1,
+    )
+    row = {
+        "github_pr_id": 1,
+        "created_at": T0 + timedelta(days=1),
+        "merged_at": T0 + timedelta(days=3),
+        "updated_at": T0 + timedelta(days=3),
+        "additions": 7,
+        "deletions": 2,
+        "commits": 3,
+    }
+    deltas = bucket_deltas({1: old}, [row])
+    assert deltas == {
+        T0.date(): [-1, -5, -1, -1, 0, 0.0],
+        T0.date() + timedelta(days=1): [1, 7, 2, 3, 1, 2.0],
+    }
+
+
+def test_consistency_metrics_streaks_and_weeks():
+    end = date(2025, 3, 30)  # a Sunday; 4 full weeks in a 28 day window
+    days = [date(2025, 3, d) for d in (3, 4, 5, 12, 28, 29)]
+    metrics = consistency_metrics(
+        [_bucket(day) for day in days], end=end, days=28
+    )
+    assert metrics["active_days"] == 6
+    assert metrics["longest_streak"] == 3
+    assert metrics["current_streak"] == 2  # today not active yet
+    assert metrics["active_weeks"] == 3
+    assert metrics["weekly_regularity"] == 0.75
+    assert metrics["avg_merge_days"] == 1.5
@@ -0,0 +1,80 @@
+import asyncio
+import importlib
+import sys
+
+import pytest
+from app.core.config import settings
+from app.db.instrumentation import DBStats, InstrumentedQueuePool
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+def test_pool_and_statement_events_are_recorded():
+    stats = DBStats()
+
+    class Pool(InstrumentedQueuePool):
+        pass
+
+    Pool.stats = stats
+
+    async def run() -> dict:
+        engine = create_async_engine(
+            "sqlite+aiosqlite://", poolclass=Pool, pool_size=2
+        )
+        stats.instrument(engine)
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+            await conn.execute(text("SELECT x FROM t"))
+            inside = stats.in_use
+        snapshot = stats.snapshot(engine)
+        await engine.dispose()
+        return {"inside": inside, **snapshot}
+
+    snapshot = asyncio.run(run())
+    assert snapshot["inside"] == 1
+    assert snapshot["connections"]["in_use"] == 0
+    assert snapshot["connections"]["checkouts"] == 1
+    assert snapshot["checkout_wait"]["count"] == 1
+    assert snapshot["statements"]["SELECT"]["count"] == 1
+    assert snapshot["statements"]["INSERT"]["count"] == 1
+    assert snapshot["statements"]["OTHER"]["count"] == 1
+    assert snapshot["pool"]["class"] == "Pool"
+
+
+def test_failed_statement_does_not_leak_its_start_time():
+    stats = DBStats("errors")
+
+    async def run() -> tuple[list, int]:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        stats.instrument(engine)
+        async with engine.connect() as conn:
+            with pytest.raises(DBAPIError):
+                await conn.execute(text("SELECT x FROM missing"))
+            await conn.execute(text("SELECT 1"))
+            raw = await conn.get_raw_connection()
+            starts = list(raw.info.get("query_start", []))
+        await engine.dispose()
+        return starts, stats.statements["SELECT"].count
+
+    starts, selects = asyncio.run(run())
+    assert starts == []
+    assert selects == 1
+
+
+def test_app_engine_connects_with_aiosqlite(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", "sqlite+aiosqlite://")
+    monkeypatch.setattr(settings, "database_replica_url", "")
+    # the module builds its engines from settings on import
+    monkeypatch.delitem(sys.modules, "app.db.session", raising=False)
+    session = importlib.import_module("app.db.session")
+
+    async def run() -> int:
+        try:
+            async with session.engine.connect() as conn:
+                return await conn.scalar(text("SELECT 1"))
+        finally:
+            await session.engine.dispose()
+
+    assert asyncio.run(run()) == 1
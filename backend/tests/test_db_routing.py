@@ -0,0 +1,117 @@
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+from app.core.config import settings
+from app.db.routing import RecentWrites, SessionRouter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
+                                    create_async_engine)
+
+# point these at two local Postgres instances (see docker-compose.yml)
+# to run the routing tests against real servers
+PRIMARY_URL = os.getenv("TEST_DATABASE_URL", "sqlite+aiosqlite://")
+REPLICA_URL = os.getenv("TEST_DATABASE_REPLICA_URL", "sqlite+aiosqlite://")
+
+
+async def _answered_by(factory: async_sessionmaker[AsyncSession]) -> str:
+    async with factory() as session:
+        return await session.scalar(text("SELECT name FROM routing_probe"))
+
+
+async def _route(writes: RecentWrites) -> dict[str, str]:
+    """Which server answers each kind of session, after user 1 wrote."""
+    engines = {
+        "primary": create_async_engine(PRIMARY_URL),
+        "replica": create_async_engine(REPLICA_URL),
+    }
+    factories = {}
+    for name, engine in engines.items():
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE IF EXISTS routing_probe"))
+            await conn.execute(text("CREATE TABLE routing_probe (name TEXT)"))
+            await conn.execute(
+                text("INSERT INTO routing_probe VALUES (:name)"),
+                {"name": name},
+            )
+        factories[name] = async_sessionmaker(engine, class_=AsyncSession)
+
+    router = SessionRouter(
+        factories["primary"], factories["replica"], writes=writes
+    )
+    writes.note(1)
+    try:
+        return {
+            "anonymous": await _answered_by(router.for_read(None)),
+            "other_user": await _answered_by(router.for_read(2)),
+            "writer": await _answered_by(router.for_read(1)),
+            "write": await _answered_by(router.for_write()),
+        }
+    finally:
+        for engine in engines.values():
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP TABLE routing_probe"))
+            await engine.dispose()
+
+
+def test_reads_go_to_replica_unless_the_user_just_wrote():
+    routed = asyncio.run(_route(RecentWrites(window_seconds=60)))
+    assert routed == {
+        "anonymous": "replica",
+        "other_user": "replica",
+        "writer": "primary",
+        "write": "primary",
+    }
+
+
+def test_stickiness_ends_with_the_window():
+    routed = asyncio.run(_route(RecentWrites(window_seconds=0)))
+    assert routed["writer"] == "replica"
+
+
+def test_without_replica_everything_uses_the_primary():
+    primary = async_sessionmaker()
+    router = SessionRouter(primary, writes=RecentWrites(window_seconds=60))
+    assert router.for_read(None) is primary
+    assert router.for_write() is primary
+
+
+@pytest.mark.skipif(
+    "TEST_DATABASE_REPLICA_URL" not in os.environ,
+    reason="needs TEST_DATABASE_URL and TEST_DATABASE_REPLICA_URL",
+)
+def test_app_sessions_route_between_two_postgres_servers(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", PRIMARY_URL)
+    monkeypatch.setattr(settings, "database_replica_url", REPLICA_URL)
+    # the module builds its engines from settings on import
+    monkeypatch.delitem(sys.modules, "app.db.session", raising=False)
+    session = importlib.import_module("app.db.session")
+    server = text("SELECT pg_postmaster_start_time()::text")
+
+    async def identify(factory: async_sessionmaker[AsyncSession]) -> str:
+        async with factory() as db:
+            return await db.scalar(server)
+
+    async def run() -> dict[str, str]:
+        router = session.session_router
+        router.writes.note(-1)
+        try:
+            return {
+                "primary": await identify(session.AsyncSessionLocal),
+                "replica": await identify(session.ReadSessionLocal),
+                "anonymous": await identify(router.for_read(None)),
+                "writer": await identify(router.for_read(-1)),
+                "write": await identify(router.for_write()),
+            }
+        finally:
+            await session.engine.dispose()
+            await session.replica_engine.dispose()
+
+    selects = session.replica_db_stats.statements["SELECT"].count
+    routed = asyncio.run(run())
+    assert routed["primary"] != routed["replica"]
+    assert routed["anonymous"] == routed["replica"]
+    assert routed["writer"] == routed["write"] == routed["primary"]
+    assert session.replica_db_stats.statements["SELECT"].count >= selects + 2
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+from app.integrations.cache import (CachedResponse, MemoryCacheBackend,
+                                    ResponseCache, SQLiteCacheBackend)
+from app.integrations.github_async import AsyncGitHubService
+
+
+def _entry(body, etag=None, last_modified=None) -> CachedResponse:
+    return CachedResponse(etag, last_modified, body, None)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", _entry(1))
+    backend.set("b", _entry(2))
+    assert backend.get("a").body == 1
+    backend.set("c", _entry(3))
+    assert backend.get("b") is None
+    assert [backend.get(k).body for k in ("a", "c")] == [1, 3]
+
+
+def test_validators_prefer_etag():
+    cache = ResponseCache(MemoryCacheBackend())
+    assert cache.validators(None) == {}
+    assert cache.validators(_entry([], etag='"v1"', last_modified="x")) == {
+        "If-None-Match": '"v1"'
+    }
+    assert cache.validators(_entry([], last_modified="Wed, 01 Jan 2025")) == {
+        "If-Modified-Since": "Wed, 01 Jan 2025"
+    }
+    assert cache.validators(_entry([])) == {}
+
+
+def test_sqlite_backend_persists_and_evicts_by_batched_access(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    backend = SQLiteCacheBackend(path, max_entries=2, touch_batch=100)
+    backend.set("a", _entry({"n": 1}, etag='"a"'))
+    backend.set("b", _entry({"n": 2}))
+    # the read is only recorded in memory until the next set
+    assert backend.get("a") == _entry({"n": 1}, etag='"a"')
+    backend.set("c", _entry({"n": 3}))
+    assert backend.get("b") is None
+    assert len(backend) == 2
+
+    reopened = SQLiteCacheBackend(path, max_entries=2)
+    assert reopened.get("a").body == {"n": 1}
+    reopened.clear()
+    assert len(reopened) == 0
+
+
+def test_rest_get_answers_304_from_the_cache(tmp_path):
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": 1}], headers={"ETag": '"v1"'})
+
+    async def run(cache: ResponseCache) -> list:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            service = AsyncGitHubService("token", client=client, cache=cache)
+            first = await service.rest_get("/users/octo/repos")
+            second = await service.rest_get("/users/octo/repos")
+            return [first.body, second.body]
+
+    for backend in (
+        MemoryCacheBackend(),
+        SQLiteCacheBackend(tmp_path / "rest.sqlite3"),
+    ):
+        seen.clear()
+        cache = ResponseCache(backend)
+        assert asyncio.run(run(cache)) == [[{"id": 1}], [{"id": 1}]]
+        assert "if-none-match" not in seen[0]
+        assert seen[1]["if-none-match"] == '"v1"'
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,182 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from app.integrations.github_async import AsyncGitHubService
+
+
+def _pr_node(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": None,
+        "state": "MERGED",
+        "merged": True,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "closedAt": "2025-01-02T00:00:00Z",
+        "additions": 1,
+        "deletions": 1,
+        "changedFiles": 1,
+        "commits": {"totalCount": 1},
+        "baseRepository": {
+            "nameWithOwner": "octo/repo",
+            "stargazerCount": 1,
+            "forkCount": 1,
+        },
+    }
+
+
+def _paged_transport(total: int, page_size: int) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        start = int(variables.get("after") or 0)
+        end = min(start + page_size, total)
+        return httpx.Response(200, json={"data": {"search": {
+            "issueCount": total,
+            "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+            "nodes": [_pr_node(n + 1) for n in range(start, end)],
+        }}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_iter_user_prs_follows_end_cursor():
+    async def run() -> list[int]:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=_paged_transport(total=250, page_size=100),
+        ) as client:
+            service = AsyncGitHubService("token", client=client)
+            return [
+                info.pr_number
+                async for info, _ in service.iter_user_prs_graphql("octo")
+            ]
+
+    assert asyncio.run(run()) == list(range(1, 251))
+
+
+def _dated_search_transport(created: list[datetime]) -> httpx.MockTransport:
+    """Fake search honouring `created:a..b` and the 1000 result cap."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        variables = body["variables"]
+        matching = list(range(len(created)))
+        for term in variables["query"].split():
+            if term.startswith("created:"):
+                lo, hi = (
+                    datetime.fromisoformat(part.replace("Z", "+00:00"))
+                    for part in term[len("created:"):].split("..")
+                )
+                matching = [i for i in matching if lo <= created[i] <= hi]
+        start = int(variables.get("after") or 0)
+        end = min(start + variables.get("first", 100), len(matching), 1000)
+        nodes = []
+        for i in matching[start:end]:
+            node = _pr_node(i + 1)
+            node["createdAt"] = created[i].isoformat()
+            nodes.append(node)
+        return httpx.Response(200, json={"data": {"search": {
+            "issueCount": len(matching),
+            "pageInfo": {"hasNextPage": end < min(len(matching), 1000),
+                         "endCursor": str(end)},
+            "nodes": nodes,
+        }}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_sharded_search_reaches_past_result_cap():
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    created = [base + timedelta(hours=3 * i) for i in range(2500)]
+
+    async def run() -> list[int]:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=_dated_search_transport(created),
+        ) as client:
+            service = AsyncGitHubService("token", client=client)
+            prs = await service.get_user_prs_sharded(
+                "octo", since=base, max_concurrency=3
+            )
+            return [info.pr_number for info, _ in prs]
+
+    numbers = asyncio.run(run())
+    assert sorted(numbers) == list(range(1, 2501))
+
+
+def test_batched_search_demultiplexes_aliases():
+    requests: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        variables = body["variables"]
+        data = {}
+        i = 0
+        while f"q{i}" in variables:
+            # every search matches 150 PRs
+            offset = int(variables[f"a{i}"] or 0)
+            end = min(offset + variables["first"], 150)
+            data[f"s{i}"] = {
+                "issueCount": 150,
+                "pageInfo": {"hasNextPage": end < 150, "endCursor": str(end)},
+                "nodes": [_pr_node(n + 1) for n in range(offset, end)],
+            }
+            i += 1
+        return httpx.Response(200, json={"data": data})
+
+    async def run() -> dict:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            service = AsyncGitHubService("token", client=client)
+            keys = [f"user{i}" for i in range(5)] + [("user0", "octo/repo")]
+            return await service.get_prs_batch(keys, max_aliases=4)
+
+    results = asyncio.run(run())
+    assert len(results) == 6
+    assert all(len(prs) == 150 for prs in results.values())
+    # 6 searches at 4 per request, over 2 pages each
+    assert len(requests) == 4
+
+
+def test_batched_search_survives_a_failing_alias():
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        data, errors = {}, []
+        i = 0
+        while f"q{i}" in variables:
+            if "author:ghost" in variables[f"q{i}"]:
+                data[f"s{i}"] = None
+                errors.append({
+                    "path": [f"s{i}"],
+                    "message": "The listed users cannot be searched.",
+                })
+            else:
+                data[f"s{i}"] = {
+                    "issueCount": 1,
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [_pr_node(i + 1)],
+                }
+            i += 1
+        return httpx.Response(200, json={"data": data, "errors": errors})
+
+    async def run(errors: dict) -> dict:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            service = AsyncGitHubService("token", client=client)
+            return await service.get_prs_batch(
+                ["octo", "ghost", "hubot"], errors=errors
+            )
+
+    errors: dict = {}
+    results = asyncio.run(run(errors))
+    assert {key: len(prs) for key, prs in results.items()} == {
+        "octo": 1, "ghost": 0, "hubot": 1,
+    }
+    assert errors == {"ghost": "The listed users cannot be searched."}
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import httpx
+from app.integrations.github_async import AsyncGitHubService
+from app.integrations.scheduler import (GitHubScheduler, Priority,
+                                        current_priority, github_priority)
+
+
+def _headers(limit: int, remaining: int, reset_in: float) -> dict[str, str]:
+    return {
+        "x-ratelimit-limit": str(limit),
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(time.time() + reset_in),
+        "x-ratelimit-resource": "core",
+    }
+
+
+def test_background_is_held_back_and_interactive_runs_first():
+    async def run() -> list[str]:
+        scheduler = GitHubScheduler()
+        scheduler.observe_headers("cred", _headers(100, 10, reset_in=0.2))
+        order: list[str] = []
+
+        async def call(name: str) -> None:
+            order.append(name)
+
+        async def background(name: str) -> None:
+            with github_priority(Priority.BACKGROUND):
+                await scheduler.run("cred", "core", "rest",
+                                    lambda: call(name))
+
+        # 10 of 100 left is below the background reserve: both wait
+        bulk = [asyncio.create_task(background(f"bg{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+        assert scheduler.snapshot()["budgets"][0]["queued_background"] == 2
+
+        # an interactive request jumps the queue and fits the budget
+        await scheduler.run("cred", "core", "rest", lambda: call("ui"))
+        await asyncio.gather(*bulk)
+        return order
+
+    assert asyncio.run(run()) == ["ui", "bg0", "bg1"]
+
+
+def test_batched_searches_run_at_background_priority():
+    seen: list[Priority] = []
+    scheduler = GitHubScheduler()
+    run = scheduler.run
+
+    async def recording_run(*args, **kwargs):
+        seen.append(current_priority())
+        return await run(*args, **kwargs)
+
+    scheduler.run = recording_run
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": {"s0": {
+            "issueCount": 0,
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [],
+        }}})
+
+    async def search() -> None:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            service = AsyncGitHubService(
+                "token", client=client, scheduler=scheduler
+            )
+            await service.get_prs_batch(["octo"])
+
+    asyncio.run(search())
+    assert seen == [Priority.BACKGROUND]
@@ -1,2 +1,37 @@
+import asyncio
+
+from app.services.readiness_service import ReadinessProbes
+
+
 def test_health():
     assert True
+
+
+def test_readiness_serves_cached_probe_results():
+    async def ok():
+        return {"pool": "fine"}
+
+    async def broken():
+        raise ConnectionError("refused")
+
+    async def slow():
+        await asyncio.sleep(1)
+        return {}
+
+    probes = ReadinessProbes(
+        {"db": ok, "github": broken, "slow": slow},
+        interval=60,
+        timeout=0.05,
+    )
+    ready, checks = probes.report(max_staleness=30)
+    assert not ready and checks["db"]["detail"] == "not probed yet"
+
+    asyncio.run(probes.run_once())
+    ready, checks = probes.report(max_staleness=30)
+    assert not ready
+    assert checks["db"]["ok"] and checks["db"]["detail"] == {"pool": "fine"}
+    assert checks["github"]["detail"] == {"error": "refused"}
+    assert not checks["slow"]["ok"]  # timed out
+
+    ready, checks = probes.report(max_staleness=-1)
+    assert not checks["db"]["ok"]  # stale
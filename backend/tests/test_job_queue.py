@@ -0,0 +1,47 @@
+import asyncio
+
+from app.services.job_queue import JobQueue, JobStatus
+
+
+def test_concurrent_submits_for_same_key_share_one_job():
+    async def run() -> tuple[int, list[JobStatus]]:
+        queue = JobQueue(workers=2, max_queued=10, retention_seconds=60)
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = queue.submit("refresh:alice", work)
+        second = queue.submit("refresh:alice", work)
+        other = queue.submit("refresh:bob", work)
+        assert first is second and first is not other
+
+        await asyncio.gather(first.wait(), other.wait())
+        # a new submit after completion starts a fresh job
+        third = queue.submit("refresh:alice", work)
+        await third.wait()
+        await queue.stop()
+        return calls, [first.status, other.status, third.status]
+
+    calls, statuses = asyncio.run(run())
+    assert calls == 3
+    assert statuses == [JobStatus.SUCCEEDED] * 3
+
+
+def test_failed_job_records_error():
+    async def run():
+        queue = JobQueue(workers=1, max_queued=10, retention_seconds=60)
+
+        async def boom() -> None:
+            raise LookupError("User not found.")
+
+        job = await queue.submit("refresh:ghost", boom).wait()
+        await queue.stop()
+        return job
+
+    job = asyncio.run(run())
+    assert job.status == JobStatus.FAILED
+    assert job.error == "User not found."
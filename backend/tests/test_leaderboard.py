@@ -0,0 +1,64 @@
+import uuid
+
+from app.services.leaderboard_service import Leaderboard
+
+
+def _board(scores: list[float]) -> tuple[Leaderboard, list[uuid.UUID]]:
+    ids = [uuid.UUID(int=i + 1) for i in range(len(scores))]
+    board = Leaderboard()
+    board.load(
+        (uid, f"user{i}", score)
+        for i, (uid, score) in enumerate(zip(ids, scores))
+    )
+    return board, ids
+
+
+def test_ranks_ties_and_percentiles():
+    board, ids = _board([50.0, 90.0, 70.0, 70.0, 10.0])
+
+    assert [(e.rank, e.final_score) for e in board.top(5)] == [
+        (1, 90.0), (2, 70.0), (2, 70.0), (4, 50.0), (5, 10.0),
+    ]
+    assert board.position(ids[1]).percentile == 100.0
+    assert board.position(ids[2]).entry.rank == 2
+    assert board.position(ids[2]).percentile == 50.0  # 2 of 4 others below
+    assert board.position(ids[4]).percentile == 0.0
+    assert board.position(uuid.uuid4()) is None
+
+
+def test_updates_move_users_and_neighbors_follow():
+    board, ids = _board([50.0, 90.0, 70.0, 30.0, 10.0])
+
+    board.update(ids[4], "user4", 95.0)
+    assert board.top(1)[0].user_id == ids[4]
+    assert board.position(ids[1]).entry.rank == 2
+
+    board.remove(ids[0])
+    assert len(board) == 4
+    assert [e.username for e in board.neighbors(ids[2], 1)] == [
+        "user1", "user2", "user3",
+    ]
+
+
+def test_updates_during_a_reload_survive_it():
+    board, ids = _board([50.0, 90.0, 70.0])
+
+    board.begin_reload()
+    # rows read before these changes were committed
+    stale = [(ids[0], "user0", 50.0), (ids[1], "user1", 90.0),
+             (ids[2], "user2", 70.0)]
+    board.update(ids[0], "user0", 99.0)
+    board.remove(ids[2])
+    new_user = uuid.UUID(int=99)
+    board.update(new_user, "late", 60.0)
+    board.load(stale)
+
+    assert [(e.user_id, e.final_score) for e in board.top(5)] == [
+        (ids[0], 99.0), (ids[1], 90.0), (new_user, 60.0),
+    ]
+    assert board.position(ids[2]) is None
+
+    # without a reload in progress, load replaces the contents outright
+    board.update(ids[0], "user0", 1.0)
+    board.load(stale)
+    assert board.position(ids[0]).entry.final_score == 50.0
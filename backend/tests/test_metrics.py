@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+from app.api.middleware import MetricsMiddleware
+from app.core import metrics
+from app.core.metrics import Counter, Histogram, Registry
+from fastapi import FastAPI
+
+
+def test_render_prometheus_text():
+    registry = Registry()
+    calls = registry.register(Counter("calls", "Calls.", ("kind",)))
+    latency = registry.register(
+        Histogram("latency_seconds", "Latency.", ("kind",), buckets=(0.1, 1))
+    )
+    calls.inc("a")
+    calls.inc("a", amount=2)
+    latency.observe(0.1, 'say "hi"')
+    latency.observe(0.5, 'say "hi"')
+    latency.observe(3, 'say "hi"')
+
+    assert registry.render().splitlines() == [
+        "# HELP calls Calls.",
+        "# TYPE calls counter",
+        'calls_total{kind="a"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{kind="say \\"hi\\"",le="0.1"} 1',
+        'latency_seconds_bucket{kind="say \\"hi\\"",le="1"} 2',
+        'latency_seconds_bucket{kind="say \\"hi\\"",le="+Inf"} 3',
+        'latency_seconds_sum{kind="say \\"hi\\""} 3.6',
+        'latency_seconds_count{kind="say \\"hi\\""} 3',
+    ]
+
+
+def test_middleware_labels_requests_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    route = "/items/{item_id}"
+    before = metrics.http_request_seconds.count("GET", route)
+
+    async def run() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for path in ("/items/1", "/items/2", "/items/nope", "/elsewhere"):
+                await client.get(path)
+
+    asyncio.run(run())
+
+    assert metrics.http_request_seconds.count("GET", route) == before + 3
+    assert metrics.http_requests.value("GET", route, "200") >= 2
+    assert metrics.http_requests.value("GET", route, "422") >= 1
+    assert metrics.http_requests.value("GET", "unmatched", "404") >= 1
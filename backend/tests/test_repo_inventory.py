@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from app.integrations.inventory import RepoInventory, RepoInventoryCache
+
+
+def _fetcher(
+    calls: list[str],
+    username: str,
+    gate: asyncio.Event | None = None,
+):
+    async def fetch() -> RepoInventory:
+        calls.append(username)
+        if gate is not None:
+            await gate.wait()
+        return RepoInventory(username, [])
+
+    return fetch
+
+
+def test_concurrent_misses_share_one_fetch():
+    async def run() -> list[str]:
+        cache = RepoInventoryCache(ttl_seconds=60)
+        calls: list[str] = []
+        gate = asyncio.Event()
+        fetch = _fetcher(calls, "octo", gate)
+        waiters = [
+            asyncio.create_task(cache.get("octo", fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters)
+        assert all(result is results[0] for result in results)
+        assert await cache.get("octo", fetch) is results[0]
+        return calls
+
+    assert asyncio.run(run()) == ["octo"]
+
+
+def test_cancelling_the_first_caller_keeps_the_shared_fetch():
+    async def run() -> None:
+        cache = RepoInventoryCache(ttl_seconds=60)
+        calls: list[str] = []
+        gate = asyncio.Event()
+        fetch = _fetcher(calls, "octo", gate)
+        first = asyncio.create_task(cache.get("octo", fetch))
+        second = asyncio.create_task(cache.get("octo", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert (await second).username == "octo"
+        # the fetch finished and was cached even though its starter left
+        assert len(cache) == 1
+        assert calls == ["octo"]
+
+    asyncio.run(run())
+
+
+def test_entries_are_bounded_and_expire():
+    async def run() -> list[str]:
+        cache = RepoInventoryCache(ttl_seconds=60, max_entries=2)
+        calls: list[str] = []
+        for name in ("a", "b"):
+            await cache.get(name, _fetcher(calls, name))
+        await cache.get("a", _fetcher(calls, "a"))
+        await cache.get("c", _fetcher(calls, "c"))
+        assert len(cache) == 2
+        # "b" was least recently used, so it is fetched again
+        await cache.get("b", _fetcher(calls, "b"))
+        await cache.get("a", _fetcher(calls, "a"))
+
+        cache.ttl_seconds = 0
+        await cache.get("a", _fetcher(calls, "a"))
+        return calls
+
+    assert asyncio.run(run()) == ["a", "b", "c", "b", "a", "a"]
@@ -0,0 +1,126 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from app.integrations.github_async import AsyncGitHubService
+from app.integrations.repo_metadata import RepoMetadata, RepoMetadataStore
+from app.models.repository import Repository
+from app.services.sync_service import load_repo_metadata
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+def _slim_pr_node(number: int, repo: str) -> dict:
+    """A search node as the slim query returns it: no star / fork counts."""
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": None,
+        "state": "MERGED",
+        "merged": True,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "closedAt": "2025-01-02T00:00:00Z",
+        "additions": 1,
+        "deletions": 1,
+        "changedFiles": 1,
+        "commits": {"totalCount": 1},
+        "baseRepository": {"nameWithOwner": repo},
+    }
+
+
+def test_store_tracks_freshness_case_insensitively():
+    store = RepoMetadataStore(ttl_seconds=60)
+    now = datetime.now(timezone.utc)
+    store.put(RepoMetadata("Octo/Repo", 5, 1, now))
+    store.put(RepoMetadata("octo/old", 3, 0, now - timedelta(minutes=5)))
+
+    assert store.get("octo/repo").stars == 5
+    assert store.stale(["OCTO/REPO", "octo/old", "octo/new", "octo/new"]) == [
+        "octo/old",
+        "octo/new",
+    ]
+    assert set(store.lookup(["octo/repo", "octo/new"])) == {"octo/repo"}
+
+
+def test_store_keeps_the_newer_entry():
+    store = RepoMetadataStore(ttl_seconds=60)
+    now = datetime.now(timezone.utc)
+    store.put(RepoMetadata("octo/repo", 9, 2, now))
+    store.put(RepoMetadata("octo/repo", 1, 1, now - timedelta(seconds=1)))
+    assert store.get("octo/repo").stars == 9
+
+
+def test_slim_nodes_take_counts_from_one_metadata_lookup():
+    lookups: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        if "repository(owner:" in payload["query"]:
+            lookups.append(payload["variables"])
+            return httpx.Response(200, json={"data": {"r0": {
+                "nameWithOwner": "octo/repo",
+                "stargazerCount": 7,
+                "forkCount": 2,
+            }}})
+        start = int(payload["variables"].get("after") or 0)
+        end = min(start + 2, 4)
+        return httpx.Response(200, json={"data": {"search": {
+            "issueCount": 4,
+            "pageInfo": {"hasNextPage": end < 4, "endCursor": str(end)},
+            "nodes": [
+                _slim_pr_node(n + 1, "octo/repo") for n in range(start, end)
+            ],
+        }}})
+
+    async def run() -> list:
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            service = AsyncGitHubService("token", client=client)
+            service.repo_metadata = RepoMetadataStore(ttl_seconds=3600)
+            return [
+                params
+                async for _, params in service.iter_user_prs_graphql("octo")
+            ]
+
+    params = asyncio.run(run())
+    assert len(params) == 4
+    assert {(p.repo_stars, p.repo_forks) for p in params} == {(7, 2)}
+    assert lookups == [{"o0": "octo", "n0": "repo"}]
+
+
+def test_load_repo_metadata_seeds_the_store_from_repositories():
+    fetched_at = datetime.now(timezone.utc)
+
+    async def run() -> tuple[int, RepoMetadataStore]:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Repository.__table__.create)
+        store = RepoMetadataStore(ttl_seconds=3600)
+        async with async_sessionmaker(engine)() as db:
+            db.add_all([
+                Repository(
+                    name_with_owner="octo/repo",
+                    stargazer_count=7,
+                    fork_count=2,
+                    fetched_at=fetched_at,
+                ),
+                Repository(
+                    name_with_owner="octo/other",
+                    stargazer_count=1,
+                    fork_count=0,
+                    fetched_at=fetched_at,
+                ),
+            ])
+            await db.commit()
+            loaded = await load_repo_metadata(
+                db, names=["octo/repo", "octo/gone"], store=store
+            )
+        await engine.dispose()
+        return loaded, store
+
+    loaded, store = asyncio.run(run())
+    assert loaded == 1
+    assert (store.get("octo/repo").stars, store.get("octo/repo").forks) == (7, 2)
+    assert store.get("octo/other") is None
@@ -0,0 +1,120 @@
+import asyncio
+import math
+import uuid
+from types import SimpleNamespace
+
+from app.services import rescore_service
+from app.services.rescore_service import RescoreAccumulator
+from app.services.scoring_service import scoring_service
+from sqlalchemy.dialects import postgresql
+
+PERSONAL = SimpleNamespace(
+    id=2,
+    name="personal",
+    version=3,
+    repo_level="personal",
+    pr_weights={"lines_added": 0.5, "commits": 0.5},
+    repo_weights={"pr": 0.5, "stars": 0.5},
+    aggregate_weights={"pr_avg": 0.4, "repo": 0.6},
+)
+
+
+def test_chunked_rescore_matches_aggregate_over_each_user(random_prs):
+    prs = sorted(random_prs(5, 500), key=lambda p: p["user"])
+    users = {u: uuid.UUID(int=u + 1) for u in range(25)}
+    rows = [
+        SimpleNamespace(
+            user_id=users[pr["user"]],
+            additions=pr["lines_added"],
+            deletions=pr["lines_removed"],
+            changed_files=pr["files_changed"],
+            commits=pr["commits"],
+            merge_time_days=pr["merge_time_days"],
+            repo_stars=pr["repo_stars"],
+            repo_forks=pr["repo_forks"],
+        )
+        for pr in prs
+    ]
+
+    accumulator = RescoreAccumulator([PERSONAL])
+    results = []
+    for i in range(0, len(rows), 37):  # chunks split users
+        results.extend(accumulator.feed(rows[i:i + 37]))
+    results.extend(accumulator.finish())
+
+    assert [user_id for user_id, _, _ in results] == sorted(users.values())
+    for user_id, profile, score in results:
+        own = [pr for pr in prs if users[pr["user"]] == user_id]
+        expected = scoring_service.aggregate_from_prs(
+            own,
+            per_pr_weights=profile.pr_weights,
+            aggregate_weights=profile.aggregate_weights,
+        )
+        repo = scoring_service.compute_personal_score(
+            pr_count=len(own),
+            commits_per_pr=sum(p["commits"] for p in own) / len(own),
+            avg_merge_time_days=(
+                sum(p["merge_time_days"] for p in own) / len(own)
+            ),
+            repo_stars=sum(p["repo_stars"] for p in own),
+            repo_forks=sum(p["repo_forks"] for p in own),
+            weights=profile.repo_weights,
+        )
+        assert score["pr_count"] == len(own)
+        assert score["avg_pr_score"] == expected["avg_pr_score"]
+        assert score["repo_level_score"] == round(repo, 2)
+        pr_scores = [
+            scoring_service.compute_pr_score(
+                lines_added=p["lines_added"],
+                lines_removed=p["lines_removed"],
+                files_changed=p["files_changed"],
+                commits=p["commits"],
+                merge_time_days=p["merge_time_days"],
+                weights=profile.pr_weights,
+            )
+            for p in own
+        ]
+        assert score["final_score"] == scoring_service.aggregate_from_totals(
+            pr_count=len(own),
+            avg_pr_score=math.fsum(pr_scores) / len(own),
+            total_commits=sum(p["commits"] for p in own),
+            total_merge_days=math.fsum(p["merge_time_days"] for p in own),
+            total_stars=sum(p["repo_stars"] for p in own),
+            total_forks=sum(p["repo_forks"] for p in own),
+            aggregate_weights=profile.aggregate_weights,
+            repo_weights=profile.repo_weights,
+            repo_level=profile.repo_level,
+        )["final_score"]
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def test_save_splits_results_under_the_bind_parameter_cap():
+    score = {
+        "pr_count": 1,
+        "avg_pr_score": 1.0,
+        "repo_level_score": 1.0,
+        "final_score": 1.0,
+    }
+    # one chunk of single-PR users under two profiles
+    results = [
+        (uuid.UUID(int=n), SimpleNamespace(id=n % 2 + 1), score)
+        for n in range(10_000)
+    ]
+    db = _RecordingSession()
+    asyncio.run(rescore_service._save(db, results))
+
+    assert len(db.statements) > 1
+    assert all(len(stmt.params) <= 32767 for stmt in db.statements)
+    assert sum(len(stmt.params) for stmt in db.statements) == 7 * len(results)
+    assert db.commits == 1
@@ -0,0 +1,52 @@
+import numpy as np
+from app.services.scoring_service import _round2, scoring_service
+
+
+def _columns(prs: list[dict]) -> dict:
+    keys = ['lines_added', 'lines_removed', 'files_changed', 'commits',
+            'merge_time_days', 'repo_stars', 'repo_forks']
+    cols = {k: np.array([pr[k] for pr in prs]) for k in keys}
+    cols['group_ids'] = np.array([pr['user'] for pr in prs])
+    return cols
+
+
+def test_pr_scores_batch_matches_scalar(random_prs):
+    prs = random_prs(1, 2000)
+    cols = _columns(prs)
+    batch = scoring_service.compute_pr_scores_batch(
+        cols['lines_added'],
+        cols['lines_removed'],
+        cols['files_changed'],
+        cols['commits'],
+        cols['merge_time_days'],
+    )
+    expected = [
+        scoring_service.compute_pr_score(
+            lines_added=pr['lines_added'],
+            lines_removed=pr['lines_removed'],
+            files_changed=pr['files_changed'],
+            commits=pr['commits'],
+            merge_time_days=pr['merge_time_days'],
+        )
+        for pr in prs
+    ]
+    assert batch.tolist() == expected
+
+
+def test_aggregate_batch_matches_aggregate_from_prs(random_prs):
+    prs = random_prs(2, 3000)
+    result = scoring_service.aggregate_batch(**_columns(prs))
+
+    for i, user in enumerate(result['group_ids'].tolist()):
+        # reversed: the float totals must not depend on PR order
+        expected = scoring_service.aggregate_from_prs(
+            [pr for pr in reversed(prs) if pr['user'] == user]
+        )
+        assert result['avg_pr_score'][i] == expected['avg_pr_score']
+        assert result['repo_level_score'][i] == expected['repo_level_score']
+        assert result['final_score'][i] == expected['final_score']
+
+
+def test_round2_matches_builtin_round_near_ties():
+    values = [0.125, 0.135, 1.005, 2.675, 50.665, 99.995, 33.335]
+    assert _round2(np.array(values)).tolist() == [round(v, 2) for v in values]
@@ -0,0 +1,27 @@
+import pytest
+from app.core.security import CryptoContext
+from cryptography.fernet import Fernet
+from fastapi import HTTPException
+
+
+def test_new_key_in_front_still_decrypts_old_rows():
+    old = CryptoContext("jwt-secret")
+    stored = old.encrypt("gho_old")
+
+    new_key = Fernet.generate_key().decode()
+    rotated = CryptoContext("jwt-secret", f"{new_key}, ")
+    assert rotated.decrypt(stored) == "gho_old"
+
+    fresh = rotated.encrypt("gho_new")
+    assert Fernet(new_key).decrypt(fresh.encode()) == b"gho_new"
+    assert Fernet(new_key).decrypt(rotated.rotate(stored).encode()) == (
+        b"gho_old"
+    )
+    with pytest.raises(HTTPException):
+        old.decrypt(fresh)
+
+
+def test_decrypt_many_maps_bad_entries_to_none():
+    context = CryptoContext("jwt-secret")
+    tokens = [context.encrypt("a"), None, "garbage", context.encrypt("b")]
+    assert context.decrypt_many(tokens) == ["a", None, None, "b"]
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+from app.core import security
+from app.core.config import settings
+from app.integrations import token_pool
+from app.integrations.scheduler import GitHubScheduler
+from app.integrations.token_pool import TokenPool, credential_id
+from app.models.user import User
+from app.services import user_service  # noqa: F401 - registers the ORM hooks
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+def _set_remaining(scheduler: GitHubScheduler, token: str, remaining: int):
+    scheduler.observe_headers(credential_id(token), {
+        "x-ratelimit-limit": "5000",
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(time.time() + 3600),
+    })
+
+
+def test_pick_prefers_the_credential_with_most_budget():
+    scheduler = GitHubScheduler()
+    pool = TokenPool(["svc-a", "svc-b"], scheduler)
+    _set_remaining(scheduler, "svc-a", 100)
+    _set_remaining(scheduler, "svc-b", 900)
+
+    first = pool.pick("core")
+    assert first.token == "svc-b"
+    # in-flight picks count against headroom until released
+    _set_remaining(scheduler, "svc-b", 101)
+    second = pool.pick("core")
+    assert second.token == "svc-a"
+    pool.release(first)
+    pool.release(second)
+
+
+def test_owner_token_is_preferred_until_exhausted():
+    scheduler = GitHubScheduler()
+    pool = TokenPool(["svc"], scheduler)
+    pool.add("alice-token", owner="alice")
+    _set_remaining(scheduler, "svc", 4000)
+    _set_remaining(scheduler, "alice-token", 10)
+
+    own = pool.pick("core", owner="Alice")
+    assert own.token == "alice-token"
+    pool.release(own)
+
+    _set_remaining(scheduler, "alice-token", 0)
+    fallback = pool.pick("core", owner="alice")
+    assert fallback.token == "svc"
+    pool.release(fallback)
+
+
+def test_user_tokens_are_not_lent_unless_sharing_is_enabled():
+    scheduler = GitHubScheduler()
+    pool = TokenPool(scheduler=scheduler)
+    pool.add("alice-token", owner="alice")
+
+    with pytest.raises(ValueError):
+        pool.pick("core", owner="bob")
+    with pytest.raises(ValueError):
+        pool.pick("core")
+
+    pool.share_user_tokens = True
+    assert pool.pick("core", owner="bob").token == "alice-token"
+
+
+def test_new_login_token_replaces_the_old_one():
+    pool = TokenPool(scheduler=GitHubScheduler())
+    pool.add("old-token", owner="alice")
+    pool.add("new-token", owner="alice")
+    assert len(pool) == 1
+    assert pool.pick("core", owner="alice").token == "new-token"
+
+    pool.remove_owner("alice")
+    assert len(pool) == 0
+
+
+def test_login_token_enters_the_process_pool(monkeypatch):
+    monkeypatch.setattr(settings, "jwt_secret", "test-secret")
+    monkeypatch.setattr(security, "_crypto_context", None)
+    pool = TokenPool(scheduler=GitHubScheduler())
+    monkeypatch.setattr(token_pool, "_token_pool", pool)
+
+    async def run() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        async with async_sessionmaker(engine)() as db:
+            user = User(
+                github_id=7,
+                username="carol",
+                access_token_encrypted=security.encrypt_token("first"),
+            )
+            db.add(user)
+            await db.commit()
+            assert pool.pick("core", owner="carol").token == "first"
+
+            user.access_token_encrypted = security.encrypt_token("second")
+            await db.commit()
+            assert pool.pick("core", owner="carol").token == "second"
+        await engine.dispose()
+
+    asyncio.run(run())
@@ -0,0 +1,95 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.user_score_service import repo_change_deltas, upsert_delta
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _row(
+    pr_id: int,
+    *,
+    updated: int,
+    score: int,
+    commits: int,
+    repo: str = "octo/repo",
+) -> dict:
+    return {
+        "github_pr_id": pr_id,
+        "repo_full_name": repo,
+        "created_at": T0,
+        "closed_at": T0 + timedelta(days=2),
+        "updated_at": T0 + timedelta(hours=updated),
+        "commits": commits,
+        "score": score,
+    }
+
+
+def test_upsert_delta_counts_new_changed_and_skips_unchanged():
+    stored = _row(1, updated=1, score=40, commits=2)
+    untouched = _row(2, updated=1, score=50, commits=5)
+    previous = {
+        row["github_pr_id"]: SimpleNamespace(**row)
+        for row in (stored, untouched)
+    }
+
+    delta = upsert_delta(
+        previous,
+        [
+            _row(1, updated=2, score=45, commits=3),  # changed
+            untouched,
+            _row(3, updated=1, score=30, commits=1),  # new
+        ],
+    )
+
+    assert delta == {
+        "pr_count": 1,
+        "score_sum": 5 + 30,
+        "total_commits": 1 + 1,
+        "total_merge_days": 2.0,
+        "total_stars": 0,
+        "total_forks": 0,
+    }
+
+
+def test_upsert_delta_counts_repo_stars_for_new_and_moved_prs():
+    stored = _row(1, updated=1, score=40, commits=2, repo="octo/old")
+    untouched = _row(2, updated=1, score=50, commits=5)
+    previous = {
+        row["github_pr_id"]: SimpleNamespace(**row)
+        for row in (stored, untouched)
+    }
+    counts = {"octo/old": (10, 1), "octo/repo": (100, 20)}
+
+    delta = upsert_delta(
+        previous,
+        [
+            # transferred to octo/repo
+            _row(1, updated=2, score=40, commits=2, repo="octo/repo"),
+            untouched,
+            _row(3, updated=1, score=30, commits=1),
+            # no `repositories` row yet
+            _row(4, updated=1, score=30, commits=1, repo="octo/unknown"),
+        ],
+        counts,
+    )
+
+    assert (delta["pr_count"], delta["total_stars"], delta["total_forks"]) == (
+        2,
+        -10 + 100 + 100,
+        -1 + 20 + 20,
+    )
+
+
+def test_repo_change_deltas_scale_by_each_users_pr_count():
+    alice, bob = uuid.UUID(int=1), uuid.UUID(int=2)
+    deltas = repo_change_deltas(
+        {"octo/a": (5, 1), "octo/b": (-2, 0)},
+        [(alice, "octo/a", 3), (alice, "octo/b", 1), (bob, "octo/b", 4)],
+    )
+    assert {
+        user_id: (delta["total_stars"], delta["total_forks"])
+        for user_id, delta in deltas.items()
+    } == {alice: (13, 3), bob: (-8, 0)}
+    assert deltas[alice]["pr_count"] == 0
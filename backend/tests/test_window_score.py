@@ -0,0 +1,107 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.db.base import Base
+from app.models.pull_request import PullRequest
+from app.models.repository import Repository
+from app.models.user import User
+from app.services.score_service import compute_window_score
+from app.services.scoring_service import scoring_service
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# window_aggregate is Postgres SQL; point this at a scratch database
+DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(
+    DATABASE_URL is None,
+    reason="needs TEST_DATABASE_URL (Postgres)",
+)
+def test_window_aggregate_matches_aggregate_from_prs(random_prs):
+    now = datetime.now(timezone.utc)
+    prs = random_prs(11, 60)
+    for i, pr in enumerate(prs):
+        pr["repo"] = f"octo/repo{i % 4}"
+        # every third PR falls outside a 30-day window
+        pr["created_at"] = now - timedelta(days=45 if i % 3 == 0 else i % 29)
+    stars = {f"octo/repo{n}": (n * 150, n * 40) for n in range(4)}
+    since = now - timedelta(days=30)
+    in_window = [pr for pr in prs if pr["created_at"] >= since]
+    for pr in in_window:
+        pr["repo_stars"], pr["repo_forks"] = stars[pr["repo"]]
+
+    async def run() -> dict[str, float]:
+        engine = create_async_engine(DATABASE_URL)
+        try:
+            async with engine.connect() as conn:
+                # DDL and rows are rolled back with the transaction
+                await conn.begin()
+                await conn.run_sync(
+                    Base.metadata.create_all,
+                    tables=[
+                        User.__table__,
+                        Repository.__table__,
+                        PullRequest.__table__,
+                    ],
+                )
+                db = AsyncSession(bind=conn)
+                user = User(github_id=-1, username="window-test")
+                db.add(user)
+                db.add_all(
+                    Repository(
+                        name_with_owner=name,
+                        stargazer_count=count[0],
+                        fork_count=count[1],
+                        fetched_at=now,
+                    )
+                    for name, count in stars.items()
+                )
+                await db.flush()
+                db.add_all(
+                    PullRequest(
+                        user_id=user.id,
+                        github_pr_id=-(i + 1),
+                        repo_full_name=pr["repo"],
+                        repo_owner="octo",
+                        created_at=pr["created_at"],
+                        closed_at=pr["created_at"]
+                        + timedelta(days=pr["merge_time_days"]),
+                        additions=pr["lines_added"],
+                        deletions=pr["lines_removed"],
+                        changed_files=pr["files_changed"],
+                        commits=pr["commits"],
+                        score=round(scoring_service.compute_pr_score(
+                            lines_added=pr["lines_added"],
+                            lines_removed=pr["lines_removed"],
+                            files_changed=pr["files_changed"],
+                            commits=pr["commits"],
+                            merge_time_days=pr["merge_time_days"],
+                        )),
+                    )
+                    for i, pr in enumerate(prs)
+                )
+                await db.flush()
+                score = await compute_window_score(
+                    db, user=user, since=since
+                )
+                await conn.rollback()
+                return score
+        finally:
+            await engine.dispose()
+
+    score = asyncio.run(run())
+    expected = scoring_service.aggregate_from_prs(in_window)
+    assert score["pr_count"] == len(in_window)
+    # merge times round-trip through timestamps, so allow one cent
+    assert score["repo_level_score"] == pytest.approx(
+        expected["repo_level_score"], abs=0.01
+    )
+    # stored per-PR scores are whole numbers, each off by at most 0.5
+    assert score["avg_pr_score"] == pytest.approx(
+        expected["avg_pr_score"], abs=0.5
+    )
+    assert score["final_score"] == pytest.approx(
+        expected["final_score"], abs=0.5
+    )